@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: compiled keyword matcher vs the original linear substring scan"""
+import os
+import random
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import KEYWORDS
+from utils.keyword_matcher import KeywordMatcher
+
+FILLER = [
+    "senior", "lead", "principal", "staff", "remote", "hybrid", "manager", "sales", "marketing",
+    "analyst", "python", "react", "frontend", "devops", "cloud", "data", "engineer", "executive",
+    "consultant", "support", "ii", "iii", "urgent", "hiring", "bengaluru", "pune", "contract",
+]
+
+def legacy_contains_keywords(text, keywords=KEYWORDS):
+    """The original helpers.contains_keywords implementation"""
+    text_lower = text.lower()
+    return any(keyword.lower() in text_lower for keyword in keywords)
+
+def make_corpus(size, seed=42):
+    """Synthetic job titles; roughly a third contain a configured keyword"""
+    rng = random.Random(seed)
+    titles = []
+    for _ in range(size):
+        words = rng.sample(FILLER, rng.randint(2, 5))
+        if rng.random() < 0.35:
+            words.insert(rng.randint(0, len(words)), rng.choice(KEYWORDS))
+        titles.append(' '.join(words).title())
+    return titles
+
+def bench(label, func, corpus, rounds):
+    best = float('inf')
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for title in corpus:
+            func(title)
+        best = min(best, time.perf_counter() - started)
+    per_title = best / len(corpus) * 1e6
+    print(f"{label:<28} {best * 1000:8.2f} ms  {per_title:6.2f} µs/title  {len(corpus) / best:10,.0f} titles/s")
+    return best
+
+def main(size=5000, rounds=5):
+    corpus = make_corpus(size)
+    matcher = KeywordMatcher(KEYWORDS)
+
+    print(f"📊 Keyword matching over {size:,} titles x {len(KEYWORDS)} keywords (best of {rounds})")
+    legacy = bench("legacy any(substring)", legacy_contains_keywords, corpus, rounds)
+    compiled = bench("compiled contains()", matcher.contains, corpus, rounds)
+    bench("compiled matches()", matcher.matches, corpus, rounds)
+    print(f"⚡ contains() speedup: {legacy / compiled:.1f}x")
+
+    hits = sum(matcher.contains(title) for title in corpus)
+    print(f"🎯 {hits:,} titles matched ({hits / size:.0%})")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Benchmark HTML parser backends on the saved LinkedIn and Naukri result pages.
+
+Reports parse + card extraction time and peak traced memory per page for each
+backend, with and without the card SoupStrainer, and for the streaming card
+parser fed in STREAM_CHUNK_SIZE chunks.
+"""
+import os
+import sys
+import time
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from config import STREAM_CHUNK_SIZE
+from scraper.parsers import (
+    LXML_AVAILABLE, LINKEDIN_STRAINER, NAUKRI_STRAINER, LINKEDIN_STREAM_SPEC, NAUKRI_STREAM_SPEC,
+    extract_linkedin_cards, extract_naukri_cards,
+)
+from scraper.stream_parser import iter_cards
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+PAGES = [
+    ("LinkedIn", "linkedin_search.html", LINKEDIN_STRAINER, extract_linkedin_cards, LINKEDIN_STREAM_SPEC),
+    ("Naukri", "naukri_search.html", NAUKRI_STRAINER, extract_naukri_cards, NAUKRI_STREAM_SPEC),
+]
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+def run_once(markup, backend, strainer, extract):
+    soup = BeautifulSoup(markup, backend, parse_only=strainer)
+    return extract(soup)
+
+def run_stream(markup, spec):
+    chunks = (markup[i:i + STREAM_CHUNK_SIZE] for i in range(0, len(markup), STREAM_CHUNK_SIZE))
+    return list(iter_cards(chunks, spec))
+
+def measure(parse, rounds):
+    best = float('inf')
+    for _ in range(rounds):
+        started = time.perf_counter()
+        cards = parse()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, len(cards)
+
+def main(rounds=5):
+    backends = ['html.parser'] + (['lxml'] if LXML_AVAILABLE else [])
+    if not LXML_AVAILABLE:
+        print("⚠️ lxml not installed - only html.parser is measured")
+
+    for source, fixture, strainer, extract, spec in PAGES:
+        markup = load_fixture(fixture)
+        print(f"\n📄 {source} page ({len(markup) / 1024:.0f} KB), best of {rounds}")
+        print(f"{'backend':<14}{'mode':<10}{'ms/page':>10}{'peak KB':>10}{'cards':>7}{'cards/s':>10}")
+        for backend in backends:
+            for mode, parse_only in (("full", None), ("strained", strainer)):
+                seconds, peak, cards = measure(lambda: run_once(markup, backend, parse_only, extract), rounds)
+                print(f"{backend:<14}{mode:<10}{seconds * 1000:>10.1f}{peak / 1024:>10.0f}{cards:>7}{cards / seconds:>10.0f}")
+        seconds, peak, cards = measure(lambda: run_stream(markup, spec), rounds)
+        print(f"{'html.parser':<14}{'stream':<10}{seconds * 1000:>10.1f}{peak / 1024:>10.0f}{cards:>7}{cards / seconds:>10.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Offline scraper benchmark: replays the saved result pages through the hot paths.
+
+Stages: fetch (shared HTTP session), parse (card extraction), scrape (full scraper
+call), cycle (concurrent fan-out over every keyword and source) and persist
+(dedup + bulk insert into a scratch database). Everything runs against a local
+stand-in server, so no outside service is contacted.
+
+    python benchmarks/bench_scrapers.py [--rounds N] [--latency SECONDS]
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from standin import start_standin
+
+def summarize(label, samples, cards=0, peak=None):
+    """Print latency percentiles, throughput and peak memory for one stage"""
+    samples = sorted(samples)
+    total = sum(samples)
+    p95 = samples[min(len(samples) - 1, int(0.95 * len(samples)))]
+    rate = f"{cards / total:10.0f}" if cards and total else f"{'-':>10}"
+    print(f"{label:<22}{len(samples):>6}{statistics.mean(samples) * 1000:>10.1f}"
+          f"{statistics.median(samples) * 1000:>10.1f}{p95 * 1000:>10.1f}{rate}"
+          + (f"{peak / 1024:>10.0f}" if peak is not None else f"{'-':>10}"))
+
+def timed(func, *args):
+    """Run func quietly, returning (result, seconds)"""
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args)
+    return result, time.perf_counter() - started
+
+def peak_memory(func, *args):
+    """Run func quietly under tracemalloc (separately, so tracing doesn't skew timings)"""
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated server latency per request (s)")
+    args = parser.parse_args()
+
+    server, base_url = start_standin(args.latency)
+    scratch = tempfile.TemporaryDirectory()
+
+    # Point every scraper and the database at local stand-ins before config is imported
+    os.environ["LINKEDIN_BASE_URL"] = base_url
+    os.environ["NAUKRI_BASE_URL"] = base_url
+    os.environ["DB_PATH"] = os.path.join(scratch.name, "bench_jobs.db")
+    os.environ.setdefault("LINKEDIN_MIN_INTERVAL", "0")
+    os.environ.setdefault("NAUKRI_MIN_INTERVAL", "0")
+
+    from config import KEYWORDS, LOCATION, get_random_headers
+    from utils.http_client import http_get
+    from scraper.parsers import parse_cards, extract_linkedin_cards, extract_naukri_cards, LINKEDIN_STRAINER, NAUKRI_STRAINER
+    from scraper.linkedin_scraper import scrape_linkedin_jobs
+    from scraper.naukri_fallback import scrape_naukri_fallback
+    from scraper.pipeline import stream_scrape, expand_queries
+    from scraper.fetch_cache import get_fetch_cache
+    from db.database import create_table, save_jobs_bulk, close_connection
+
+    sources = {
+        'LinkedIn': (f"{base_url}/jobs/search/?keywords=java%20developer&location=remote",
+                     LINKEDIN_STRAINER, extract_linkedin_cards, scrape_linkedin_jobs),
+        'Naukri': (f"{base_url}/java developer-jobs-in-remote",
+                   NAUKRI_STRAINER, extract_naukri_cards, scrape_naukri_fallback),
+    }
+
+    print(f"📊 Offline scraper benchmark | {args.rounds} rounds | {args.latency * 1000:.0f} ms server latency")
+    print(f"{'stage':<22}{'runs':>6}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'cards/s':>10}{'peak KB':>10}")
+
+    try:
+        for source, (url, strainer, extract, scrape) in sources.items():
+            scraper = lambda keyword, location, scrape=scrape: list(scrape(keyword, location))
+            fetch, parse, scrape, cached = [], [], [], []
+            parsed_cards = scraped_cards = cached_cards = 0
+            for _ in range(args.rounds):
+                response, elapsed = timed(http_get, url, get_random_headers())
+                fetch.append(elapsed)
+
+                cards, elapsed = timed(parse_cards, response.content, strainer, extract)
+                parse.append(elapsed)
+                parsed_cards += len(cards)
+
+                # Cold scrape, then the same search again answered from the fetch cache (304)
+                get_fetch_cache().clear()
+                jobs, elapsed = timed(scraper, "java developer", LOCATION)
+                scrape.append(elapsed)
+                scraped_cards += len(jobs)
+
+                jobs, elapsed = timed(scraper, "java developer", LOCATION)
+                cached.append(elapsed)
+                cached_cards += len(jobs)
+
+            summarize(f"{source} fetch", fetch, peak=peak_memory(http_get, url, get_random_headers()))
+            summarize(f"{source} parse", parse, parsed_cards, peak_memory(parse_cards, response.content, strainer, extract))
+            summarize(f"{source} scrape cached", cached, cached_cards, peak_memory(scraper, "java developer", LOCATION))
+            get_fetch_cache().clear()
+            summarize(f"{source} scrape", scrape, scraped_cards, peak_memory(scraper, "java developer", LOCATION))
+
+        # Full fan-out over every keyword and source through the pipeline, storing nothing yet
+        scrapers = {'Naukri': scrape_naukri_fallback, 'LinkedIn': scrape_linkedin_jobs}
+        queries = expand_queries(KEYWORDS, [LOCATION], scrapers)
+        cycle = lambda: stream_scrape(queries, scrapers, persist=lambda jobs: [], notify=lambda jobs: 0)['results']
+        get_fetch_cache().clear()
+        results, elapsed = timed(cycle)
+        all_jobs = [job for result in results for job in result['jobs']]
+        summarize(f"cycle ({len(results)} scrapes)", [elapsed], len(all_jobs), peak_memory(cycle))
+
+        # Dedup + DB path: a cold cycle inserts, a repeated cycle is all duplicates
+        create_table()
+        cycle_jobs = [job for job in all_jobs if job['link']]
+        new_jobs, elapsed = timed(save_jobs_bulk, cycle_jobs)
+        summarize(f"persist cold ({len(new_jobs)} new)", [elapsed], len(cycle_jobs))
+        _, elapsed = timed(save_jobs_bulk, cycle_jobs)
+        summarize("persist repeat", [elapsed], len(cycle_jobs), peak_memory(save_jobs_bulk, cycle_jobs))
+    finally:
+        close_connection()
+        server.shutdown()
+        scratch.cleanup()
+
+if __name__ == "__main__":
+    main()
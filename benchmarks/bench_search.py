@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Benchmark: search_jobs over a synthetic jobs table (1M rows by default)"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db.database as database
+from config import KEYWORDS
+
+FILLER = [
+    "senior", "lead", "principal", "staff", "remote", "hybrid", "manager", "sales", "marketing",
+    "analyst", "python", "react", "frontend", "devops", "cloud", "data", "engineer", "executive",
+    "consultant", "support", "ii", "iii", "urgent", "hiring", "contract", "golang", "kotlin",
+]
+CITIES = ["Bengaluru", "Pune", "Hyderabad", "Chennai", "Mumbai", "Delhi NCR", "Remote", "Noida", "Kolkata"]
+TARGET_MS = 100
+
+def make_rows(size, seed=42):
+    """Synthetic job rows in insertion order over the last 90 days, about a third with a configured keyword"""
+    rng = random.Random(seed)
+    companies = [f"{rng.choice(['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark'])} {n}" for n in range(5000)]
+    now = datetime.utcnow()
+    for n in range(size):
+        words = rng.sample(FILLER, rng.randint(1, 3))
+        if rng.random() < 0.35:
+            words.insert(rng.randint(0, len(words)), rng.choice(KEYWORDS))
+        created_at = now - timedelta(seconds=(size - n) * 90 * 24 * 3600 // size)
+        yield (
+            ' '.join(words).title(),
+            rng.choice(companies),
+            rng.choice(CITIES),
+            f"https://example.com/jobs/{n}",
+            rng.choice(['LinkedIn', 'Naukri']),
+            created_at.strftime('%Y-%m-%d %H:%M:%S'),
+        )
+
+def build(size):
+    database.create_table()
+    started = time.perf_counter()
+    with database._conn_lock:
+        conn = database.get_connection()
+        with conn:
+            conn.executemany('''
+                INSERT INTO jobs (title, company, location, link, source, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', make_rows(size))
+        conn.execute('ANALYZE')
+    return time.perf_counter() - started
+
+def bench(label, rounds, **query):
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        results = database.search_jobs(**query)
+        timings.append((time.perf_counter() - started) * 1000)
+    p50 = statistics.median(timings)
+    flag = "✅" if p50 < TARGET_MS else "⚠️"
+    print(f"{flag} {label:<38} p50 {p50:7.2f} ms  max {max(timings):7.2f} ms  ({len(results)} results)")
+    return p50
+
+def main(size=1_000_000, rounds=20):
+    original = database.DB_PATH
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            database.close_connection()
+            database.DB_PATH = os.path.join(tmpdir, "jobs.db")
+            elapsed = build(size)
+            print(f"📦 Built {size:,} jobs (with full-text index) in {elapsed:.1f}s, "
+                  f"{database.get_database_size() / 1e6:.0f} MB")
+
+            week_ago = datetime.utcnow() - timedelta(days=7)
+            print(f"📊 search_jobs, {rounds} rounds each (target p50 < {TARGET_MS} ms)")
+            bench("rare term (apigee)", rounds, term="apigee")
+            bench("phrase words (java spring boot)", rounds, term="java spring boot")
+            bench("common term (engineer)", rounds, term="engineer")
+            bench("prefix (micro)", rounds, term="micro")
+            bench("company (globex 42)", rounds, term="globex 42")
+            bench("term + source", rounds, term="api security", source='Naukri')
+            bench("term + last 7 days", rounds, term="java", since=week_ago)
+            bench("latest 10", rounds)
+            bench("latest 10 from Naukri", rounds, source='Naukri')
+            bench("last 7 days from LinkedIn", rounds, source='LinkedIn', since=week_ago)
+        finally:
+            database.close_connection()
+            database.DB_PATH = original
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Regenerate the saved LinkedIn and Naukri result pages used by the benchmarks.
+
+The pages mirror the markup of the real guest search pages (card structure, class
+names, tracking query strings) padded with the inline scripts, styles and chrome
+that make up most of a real page's bytes.
+"""
+import os
+import random
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+TITLES = [
+    "Java Developer", "Senior Backend Developer", "Software Engineer II", "Java Spring Boot Developer",
+    "Apigee Developer", "API Developer - Remote", "Marketing Manager", "Fullstack Developer",
+    "Associate Developer", "Graduate Engineer Trainee", "Data Analyst", "Java Microservices Engineer",
+    "Security Developer (OAuth2/JWT)", "Sales Executive", "Backend Engineer - Payments", "Intern - Software",
+]
+COMPANIES = ["Acme Technologies", "Globex", "Initech Pvt Ltd", "Umbrella Corp", "Hooli", "Stark Industries", "Wayne Enterprises"]
+LOCATIONS = ["Bengaluru, Karnataka, India", "Pune, Maharashtra, India", "India (Remote)", "Hyderabad, Telangana, India"]
+AGES = ["2 minutes ago", "35 minutes ago", "1 hour ago", "5 hours ago", "1 day ago", "3 days ago", "1 week ago"]
+
+def filler(rng, kb):
+    """Inline script/style blocks standing in for LinkedIn/Naukri page weight"""
+    chunks = []
+    for n in range(kb):
+        payload = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz0123456789') for _ in range(900))
+        chunks.append(f'<script type="application/json" id="data-{n}">{{"blob":"{payload}"}}</script>')
+    chunks.append('<style>' + '.c{margin:0;padding:0}' * 400 + '</style>')
+    return '\n'.join(chunks)
+
+def linkedin_page(rng, cards=25):
+    items = []
+    for n in range(cards):
+        job_id = 3790000000 + n
+        title = rng.choice(TITLES)
+        slug = title.lower().replace(' ', '-')
+        items.append(f'''
+    <li>
+      <div class="base-card relative w-full hover:no-underline base-card--link base-search-card base-search-card--link job-search-card" data-entity-urn="urn:li:jobPosting:{job_id}" data-tracking-id="t{n}">
+        <a class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]" href="https://in.linkedin.com/jobs/view/{slug}-at-acme-{job_id}?position={n + 1}&amp;pageNum=0&amp;refId=abc&amp;trackingId=xyz%3D%3D">
+          <span class="sr-only">{title}</span>
+        </a>
+        <div class="search-entity-media"><img class="artdeco-entity-image" data-delayed-url="https://media.licdn.com/logo{n}.png" alt=""></div>
+        <div class="base-search-card__info">
+          <h3 class="base-search-card__title">
+            {title}
+          </h3>
+          <h4 class="base-search-card__subtitle">
+            <a class="hidden-nested-link" data-tracking-control-name="public_jobs_jserp-result_job-search-card-subtitle" href="https://in.linkedin.com/company/c{n}">{rng.choice(COMPANIES)}</a>
+          </h4>
+          <div class="base-search-card__metadata">
+            <span class="job-search-card__location">{rng.choice(LOCATIONS)}</span>
+            <div class="job-posting-benefits text-sm"><span class="job-posting-benefits__text">Actively Hiring</span></div>
+            <time class="job-search-card__listdate" datetime="2026-10-18">{rng.choice(AGES)}</time>
+          </div>
+        </div>
+      </div>
+    </li>''')
+
+    return f'''<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>Java Developer Jobs in India | LinkedIn</title>
+{filler(rng, 120)}
+</head>
+<body class="overflow-hidden">
+<header class="header"><nav class="nav">{'<a class="nav__link" href="#">Link</a>' * 40}</nav></header>
+<main id="main-content" class="main">
+  <section class="two-pane-serp-page__results-list">
+    <ul class="jobs-search__results-list">{''.join(items)}
+    </ul>
+  </section>
+</main>
+<footer class="footer">{'<li class="footer__item"><a href="#">Footer</a></li>' * 60}</footer>
+{filler(rng, 60)}
+</body></html>
+'''
+
+def naukri_page(rng, cards=20):
+    items = []
+    for n in range(cards):
+        job_id = 231023500000 + n
+        title = rng.choice(TITLES)
+        slug = title.lower().replace(' ', '-')
+        items.append(f'''
+  <div class="srp-jobtuple-wrapper" data-job-id="{job_id}">
+    <div class="cust-job-tuple layout-wrapper lay-2 sjw__tuple">
+      <div class="row1"><a class="title" title="{title}" href="https://www.naukri.com/job-listings-{slug}-acme-bengaluru-3-to-5-years-{job_id}?src=jobsearchDesk&amp;sid=123">{title}</a></div>
+      <div class="row2"><span class="comp-dtls-wrap"><a class="comp-name mw-25" href="/acme-jobs-careers-{n}">{rng.choice(COMPANIES)}</a></span></div>
+      <div class="row3"><div class="job-details"><span class="exp-wrap"><span class="expwdth">3-5 Yrs</span></span>
+        <span class="loc-wrap"><span class="locWdth loc">{rng.choice(LOCATIONS).split(',')[0]}</span></span></div></div>
+      <div class="row4"><span class="job-desc">Design, build and maintain REST APIs with Java, Spring Boot and microservices.</span></div>
+      <div class="row6"><span class="job-post-day">{rng.choice(AGES)}</span></div>
+    </div>
+  </div>''')
+
+    return f'''<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Java Developer Jobs - Naukri.com</title>
+{filler(rng, 150)}
+</head>
+<body>
+<div id="root"><div class="nI-gNb-header">{'<a class="nI-gNb-menu" href="#">Menu</a>' * 30}</div>
+<div class="styles_jlc__main__VdwtF">
+{''.join(items)}
+</div></div>
+{filler(rng, 40)}
+</body></html>
+'''
+
+if __name__ == "__main__":
+    rng = random.Random(7)
+    for name, page in (("linkedin_search.html", linkedin_page(rng)), ("naukri_search.html", naukri_page(rng))):
+        with open(os.path.join(HERE, name), "w", encoding="utf-8") as f:
+            f.write(page)
+        print(f"✅ Wrote {name} ({len(page) / 1024:.0f} KB)")
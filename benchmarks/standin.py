@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Local HTTP stand-in that serves the saved LinkedIn and Naukri result pages"""
+import os
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def _load(name):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+LINKEDIN_PAGE = _load("linkedin_search.html")
+NAUKRI_PAGE = _load("naukri_search.html")
+
+# Job id prefixes in the fixtures; shifted per query so each search returns distinct postings
+LINKEDIN_ID_PREFIX = b"-37900000"
+NAUKRI_ID_PREFIX = b"-2310235000"
+
+def _vary(page, prefix, query):
+    variant = zlib.crc32(query.encode()) % 1000
+    return page.replace(prefix, b"-" + str(int(prefix[1:]) + variant).encode())
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.0  # simulated server think time per request, seconds
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path.startswith(("/jobs/search", "/jobs-guest/jobs/api/seeMoreJobPostings")):
+            body = _vary(LINKEDIN_PAGE, LINKEDIN_ID_PREFIX, parts.query)
+        elif "-jobs-in-" in parts.path:
+            body = _vary(NAUKRI_PAGE, NAUKRI_ID_PREFIX, parts.path)
+        else:
+            self.send_error(404)
+            return
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        # Pages never change, so conditional requests always come back 304
+        etag = f'"{zlib.crc32(body):08x}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def start_standin(latency=0.0):
+    """Start the stand-in on a free local port; returns (server, base_url)"""
+    handler = type("Handler", (StandinHandler,), {'latency': latency})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
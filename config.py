@@ -4,6 +4,23 @@ import random
 # Telegram Configuration - Use environment variables for security
 TOKEN = os.getenv("TELEGRAM_TOKEN", "8244499994:AAGRaqveIT7cbRda-6Dw_oL0JCnr0VYgz5Q")
 CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "689236330")
+TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL", "https://api.telegram.org").rstrip("/")  # point at a local fake for tests
+
+# Telegram delivery limits (Bot API allows ~30 msg/s overall and ~1 msg/s per chat)
+TELEGRAM_GLOBAL_RATE = 25  # messages per second across all chats
+TELEGRAM_CHAT_RATE = 1.0  # messages per second per chat
+TELEGRAM_CHAT_BURST = 3  # messages a chat may receive back-to-back
+TELEGRAM_MAX_RETRIES = 5  # retries for network errors / 5xx before dropping a message
+TELEGRAM_QUEUE_SIZE = 1000
+
+# Telegram commands (/stats, /search, /latest, /pause, /resume, /scrape now) via getUpdates long polling
+COMMANDS_ENABLED = os.getenv("COMMANDS_ENABLED", "true").lower() == "true"
+COMMAND_POLL_TIMEOUT = 30  # seconds Telegram holds a getUpdates request open waiting for messages
+COMMAND_RESULTS_LIMIT = 10  # most jobs a /search or /latest reply lists
+
+# Alert Configuration - digest packs every new job into as few messages as fit
+DIGEST_MODE = os.getenv("DIGEST_MODE", "true").lower() == "true"
+MAX_INDIVIDUAL_ALERTS = 8  # cap per cycle when DIGEST_MODE is off
 
 # Job Search Configuration - Optimized for Abhishek Sorgile's Resume
 KEYWORDS = [
@@ -13,11 +30,19 @@ KEYWORDS = [
     "apigee api", "api proxy", "oauth2", "jwt", "api security",
     "fullstack developer", "rest api", "java microservices", 
     "api integration", "backend engineer",
-    "api security", "encryption", "security developer", "oauth developer",
+    "encryption", "security developer", "oauth developer",
     "junior java", "fresher", "entry level", "trainee", "intern",
     "associate developer", "graduate engineer"
 ]
 
+# Optional relevance weights for matched keywords (unlisted keywords weigh 1.0)
+KEYWORD_WEIGHTS = {
+    "apigee developer": 3.0,
+    "apigee api": 3.0,
+    "java spring boot": 2.0,
+    "java microservices": 2.0,
+}
+
 LOCATION = "remote"
 
 # Enhanced Headers for scraping
@@ -38,12 +63,91 @@ def get_random_headers():
         'Upgrade-Insecure-Requests': '1',
     }
 
+# Source base URLs - overridable so benchmarks can point scrapers at a local stand-in
+LINKEDIN_BASE_URL = os.getenv("LINKEDIN_BASE_URL", "https://www.linkedin.com")
+NAUKRI_BASE_URL = os.getenv("NAUKRI_BASE_URL", "https://www.naukri.com")
+
 # Scraping Configuration
 REQUEST_TIMEOUT = 30  # Increased for Railway
 DELAY_BETWEEN_REQUESTS = 3
 
+# HTML parser backend for requests-based scrapers: "auto" (lxml if installed), "lxml" or "html.parser"
+HTML_PARSER = os.getenv("HTML_PARSER", "auto")
+# Streaming parse reads search pages in chunks and keeps only the open card in memory, trading the
+# fetch cache's skip-parse-if-unchanged shortcut (304s are still reused) for memory bounded by card size
+STREAM_PARSE = os.getenv("STREAM_PARSE", "false").lower() == "true"
+STREAM_CHUNK_SIZE = 16 * 1024  # bytes read per chunk when streaming
+
+# HTTP Client Configuration - shared keep-alive session for scrapers and Telegram
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))  # number of hosts kept pooled
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "8"))  # connections kept per host
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5"))
+FETCH_CACHE_MAX_ENTRIES = 500  # search URLs whose validators and parsed cards are kept
+
+# Crawl Configuration - result pages walked per search, stopping early at already-seen pages
+CRAWL_MAX_PAGES = int(os.getenv("CRAWL_MAX_PAGES", "3"))
+CRAWL_PAGE_CONCURRENCY = int(os.getenv("CRAWL_PAGE_CONCURRENCY", "2"))  # pages fetched at once after the first
+LINKEDIN_PAGE_SIZE = 25  # cards per LinkedIn guest search page ("start=" step)
+
+# Selenium Configuration - long-lived Chrome sessions shared by Naukri scrapes
+CHROME_POOL_SIZE = int(os.getenv("CHROME_POOL_SIZE", "2"))
+CHROME_MAX_PAGES_PER_DRIVER = int(os.getenv("CHROME_MAX_PAGES_PER_DRIVER", "25"))
+CHROME_LEASE_TIMEOUT = int(os.getenv("CHROME_LEASE_TIMEOUT", "120"))
+NAUKRI_READY_TIMEOUT = int(os.getenv("NAUKRI_READY_TIMEOUT", "15"))  # max seconds to wait for results
+NAUKRI_NETWORK_IDLE_SECONDS = float(os.getenv("NAUKRI_NETWORK_IDLE_SECONDS", "1.5"))
+
+# Concurrency Configuration - max in-flight scrapes and min seconds between request starts per source
+SOURCE_CONCURRENCY = {
+    'naukri': int(os.getenv("NAUKRI_CONCURRENCY", str(CHROME_POOL_SIZE))),
+    'linkedin': int(os.getenv("LINKEDIN_CONCURRENCY", "4")),
+}
+SOURCE_MIN_INTERVAL = {
+    'naukri': float(os.getenv("NAUKRI_MIN_INTERVAL", "1.0")),
+    'linkedin': float(os.getenv("LINKEDIN_MIN_INTERVAL", "1.0")),
+}
+MAX_SCRAPE_WORKERS = int(os.getenv("MAX_SCRAPE_WORKERS", "8"))
+
+# Source health - circuit breaker per source so a blocked site stops consuming cycles
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3"))  # consecutive errors before pausing
+CIRCUIT_BLOCK_THRESHOLD = int(os.getenv("CIRCUIT_BLOCK_THRESHOLD", "1"))  # captchas / 429s before pausing
+CIRCUIT_BASE_COOLDOWN = int(os.getenv("CIRCUIT_BASE_COOLDOWN", "600"))  # seconds; doubles after each failed probe
+CIRCUIT_MAX_COOLDOWN = 6 * 60 * 60
+CIRCUIT_PROBE_TIMEOUT = 300  # seconds before an unanswered half-open probe is retried
+
+# Streaming pipeline - bounded queues between stages push back on the scrapers
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "100"))
+PIPELINE_BATCH_SIZE = 20  # jobs persisted per transaction at most
+ALERT_FLUSH_SECONDS = float(os.getenv("ALERT_FLUSH_SECONDS", "2.0"))  # wait for more jobs to share a digest
+
 # Database Configuration
-DB_PATH = "jobs.db"
+DB_PATH = os.getenv("DB_PATH", "jobs.db")
+JOB_RETENTION_DAYS = int(os.getenv("JOB_RETENTION_DAYS", "30"))  # jobs older than this are deleted
+CLEANUP_BATCH_SIZE = 500  # rows deleted per retention transaction
+CLEANUP_BATCH_PAUSE = 0.2  # seconds between retention batches
+INCREMENTAL_VACUUM_PAGES = 500  # free pages returned to the OS per cleanup
+SEEN_INDEX_MAX_ENTRIES = int(os.getenv("SEEN_INDEX_MAX_ENTRIES", "200000"))  # links cached in memory for dedup
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.8"))  # title similarity treated as same job
+SEARCH_CANDIDATES = 2000  # newest matching jobs ranked per full-text search (bounds its cost on large tables)
+
+# Metrics Configuration - Prometheus text at /metrics and a readable summary at /stats
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9100"))
 
 # Scheduling Configuration (in minutes)
-SCRAPING_INTERVAL = int(os.getenv("SCRAPING_INTERVAL", "30"))
\ No newline at end of file
+SCRAPING_INTERVAL = int(os.getenv("SCRAPING_INTERVAL", "30"))  # base interval; each query adapts from here
+ADAPTIVE_MIN_INTERVAL = int(os.getenv("ADAPTIVE_MIN_INTERVAL", "10"))  # busiest queries are polled this often
+ADAPTIVE_MAX_INTERVAL = int(os.getenv("ADAPTIVE_MAX_INTERVAL", "180"))  # idle queries back off to this
+ADAPTIVE_TIGHTEN = 0.5  # interval multiplier after a run that found new jobs
+ADAPTIVE_RELAX = 1.5  # interval multiplier after a run that found nothing
+ADAPTIVE_JITTER = 0.15  # +/- share of the interval added to each next run
+SCHEDULE_BATCH_WINDOW = 5 * 60  # seconds; queries due this soon join the current cycle
+SCHEDULER_TICK_SECONDS = 30  # seconds between checks for due queries
+
+# Query Planning - drop searches whose results another search already returns
+PLANNER_COVERAGE = float(os.getenv("PLANNER_COVERAGE", "0.9"))  # share of a query's links another must return to subsume it
+PLANNER_MIN_RUNS = 3  # runs observed before a query can be judged redundant
+PLANNER_MIN_LINKS = 5  # links observed before a query can be judged redundant
+PLANNER_HISTORY_LINKS = 300  # recent links remembered per query
+PLANNER_RECHECK_SECONDS = 6 * 60 * 60  # a dropped query is re-run this often to confirm it is still redundant
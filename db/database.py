@@ -1,107 +1,324 @@
+import re
 import sqlite3
 import os
 from datetime import datetime, timedelta
-from config import DB_PATH
+from config import DB_PATH, JOB_RETENTION_DAYS, CLEANUP_BATCH_SIZE, CLEANUP_BATCH_PAUSE, INCREMENTAL_VACUUM_PAGES, SEARCH_CANDIDATES
+from db.seen_index import get_seen_index
+from utils.dedup import canonical_link, job_fingerprint, get_dedup_engine
+from utils.metrics import counter, histogram
 import threading
 import time
 
+_conn = None
+_conn_lock = threading.RLock()
+
+DB_WRITE_SECONDS = histogram('db_write_seconds', 'Time to store one batch of jobs, including the lock wait')
+DEDUP_HITS = counter('dedup_hits', 'Jobs dropped as duplicates, by how they were caught')
+NEW_JOBS = counter('jobs_new', 'Jobs stored for the first time, per source')
+SEARCH_SECONDS = histogram('db_search_seconds', 'Time to answer one search_jobs query')
+
+# Ranking weights for title, company and location matches
+SEARCH_WEIGHTS = (10.0, 3.0, 1.0)
+_fts_available = False
+
+def get_connection():
+    """Get the shared SQLite connection, opening it with WAL and tuned pragmas on first use.
+
+    The connection is shared across threads; callers must hold _conn_lock while using it.
+    """
+    global _conn
+    with _conn_lock:
+        if _conn is None:
+            _conn = sqlite3.connect(DB_PATH, timeout=30, check_same_thread=False)
+            _conn.execute('PRAGMA journal_mode=WAL')
+            _conn.execute('PRAGMA synchronous=NORMAL')
+            _conn.execute('PRAGMA temp_store=MEMORY')
+            _conn.execute('PRAGMA cache_size=-8000')
+            _conn.execute('PRAGMA busy_timeout=5000')
+        return _conn
+
+def close_connection():
+    """Close the shared connection (it is reopened lazily on next use)"""
+    global _conn
+    with _conn_lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = None
+
 def create_table():
-    """Create jobs table if it doesn't exist"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    """Create jobs table and its indexes if they don't exist"""
+    with _conn_lock:
+        conn = get_connection()
+        
+        # Incremental auto-vacuum only takes effect after a full VACUUM on an existing file
+        if conn.execute('PRAGMA auto_vacuum').fetchone()[0] != 2:
+            conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+            conn.execute('VACUUM')
+        
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                company TEXT NOT NULL,
+                location TEXT NOT NULL,
+                link TEXT UNIQUE NOT NULL,
+                source TEXT NOT NULL,
+                posted_time TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Cross-source identity of a posting (see utils.dedup.job_fingerprint)
+        columns = [row[1] for row in conn.execute('PRAGMA table_info(jobs)')]
+        if 'fingerprint' not in columns:
+            conn.execute('ALTER TABLE jobs ADD COLUMN fingerprint TEXT')
+        
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs(created_at)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_fingerprint ON jobs(fingerprint)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_source_created_at ON jobs(source, created_at)')
+        conn.commit()
+        
+        create_search_index(conn)
+    
+    warm_seen_index()
+
+def create_search_index(conn):
+    """Create the jobs_fts full-text index and the triggers that keep it in sync with jobs.
+
+    An existing jobs table is indexed once when jobs_fts is first created. Returns
+    False (and search_jobs falls back to LIKE) if this SQLite build lacks FTS5.
+    """
+    global _fts_available
+    exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'").fetchone()
+    try:
+        with conn:
+            conn.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                    title, company, location, content='jobs', content_rowid='id'
+                )
+            ''')
+            conn.execute('''
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+                    INSERT INTO jobs_fts(rowid, title, company, location)
+                    VALUES (new.id, new.title, new.company, new.location);
+                END
+            ''')
+            conn.execute('''
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+                    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location)
+                    VALUES ('delete', old.id, old.title, old.company, old.location);
+                END
+            ''')
+            conn.execute('''
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, company, location ON jobs BEGIN
+                    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location)
+                    VALUES ('delete', old.id, old.title, old.company, old.location);
+                    INSERT INTO jobs_fts(rowid, title, company, location)
+                    VALUES (new.id, new.title, new.company, new.location);
+                END
+            ''')
+            if not exists:
+                conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+    except sqlite3.OperationalError as e:
+        print(f"⚠️ Full-text search unavailable, falling back to LIKE: {e}")
+        _fts_available = False
+        return False
     
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS jobs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            company TEXT NOT NULL,
-            location TEXT NOT NULL,
-            link TEXT UNIQUE NOT NULL,
-            source TEXT NOT NULL,
-            posted_time TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
+    _fts_available = True
+    return True
+
+def warm_seen_index():
+    """Load the most recent stored jobs into the in-memory seen index and dedup engine"""
+    index = get_seen_index()
+    engine = get_dedup_engine()
+    with _conn_lock:
+        rows = get_connection().execute('''
+            SELECT link, title, company, location, CAST(strftime('%s', created_at) AS INTEGER) FROM jobs
+            ORDER BY id DESC LIMIT ?
+        ''', (index.max_entries,)).fetchall()
     
-    conn.commit()
-    conn.close()
+    index.clear()
+    engine.clear()
+    for link, title, company, location, created_at in reversed(rows):
+        index.add(link, created_at)
+        engine.add({'title': title, 'company': company, 'location': location}, created_at)
+    return len(rows)
 
 def save_job(job):
     """Save job to database if it doesn't exist"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    return bool(save_jobs_bulk([job]))
+
+def save_jobs_bulk(jobs):
+    """Insert a batch of jobs in a single transaction, returning the ones that were new"""
+    if not jobs:
+        return []
     
-    try:
-        cursor.execute('''
-            INSERT OR IGNORE INTO jobs (title, company, location, link, source, posted_time)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (job['title'], job['company'], job['location'], job['link'], job['source'], job.get('posted_time')))
+    # Reject known links and duplicate postings in memory before touching disk
+    index = get_seen_index()
+    engine = get_dedup_engine()
+    candidates = []
+    batch_links = set()
+    for job in jobs:
+        key = canonical_link(job['link'])
+        if key in batch_links:
+            DEDUP_HITS.inc(kind='batch')
+            continue
+        if index.contains(job['link']):
+            DEDUP_HITS.inc(kind='link')
+            continue
+        batch_links.add(key)
         
-        conn.commit()
-        is_new = cursor.rowcount > 0
-        return is_new
-        
-    except sqlite3.IntegrityError:
-        return False
-    finally:
-        conn.close()
+        duplicate = engine.check(job)
+        if duplicate:
+            # A copy of a stored posting - remember its link so the next cycle rejects it in O(1)
+            DEDUP_HITS.inc(kind=duplicate)
+            index.add(job['link'])
+            continue
+        engine.add(job)
+        candidates.append(job)
+    
+    if not candidates:
+        return []
+    
+    new_jobs = []
+    with DB_WRITE_SECONDS.time(), _conn_lock:
+        conn = get_connection()
+        try:
+            with conn:
+                for job in candidates:
+                    fingerprint = job_fingerprint(job)
+                    if conn.execute('SELECT 1 FROM jobs WHERE fingerprint = ? LIMIT 1', (fingerprint,)).fetchone():
+                        DEDUP_HITS.inc(kind='stored')
+                        continue
+                    
+                    cursor = conn.execute('''
+                        INSERT OR IGNORE INTO jobs (title, company, location, link, source, posted_time, fingerprint)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ''', (job['title'], job['company'], job['location'], job['link'], job['source'], job.get('posted_time'), fingerprint))
+                    
+                    if cursor.rowcount > 0:
+                        new_jobs.append(job)
+        except sqlite3.Error as e:
+            print(f"Error saving jobs: {e}")
+            for job in candidates:
+                engine.discard(job)
+            return []
+    
+    # Every candidate is now in the table, whether it was new or already stored
+    for job in candidates:
+        index.add(job['link'])
+    for job in new_jobs:
+        NEW_JOBS.inc(source=job['source'])
+    
+    return new_jobs
 
 def get_sent_jobs_count():
     """Get total count of jobs in database"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    with _conn_lock:
+        return get_connection().execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+def get_latest_jobs(limit=10):
+    """Most recently stored jobs, newest first"""
+    return search_jobs(limit=limit)
+
+def _fts_query(term):
+    """Turn free text into an FTS5 query: every word must appear, as a word prefix"""
+    return ' '.join(f'"{word}"*' for word in re.findall(r'[^\W_]+', term))
+
+def _timestamp(value):
+    return value.strftime('%Y-%m-%d %H:%M:%S') if isinstance(value, datetime) else value
+
+def search_jobs(term=None, limit=10, source=None, since=None, until=None, search_candidates=SEARCH_CANDIDATES):
+    """Stored jobs matching `term` in title, company or location, best matches first.
+
+    Matches are ranked with BM25 (title weighs most) among the newest
+    `search_candidates` jobs that match. Without a term, jobs are listed newest
+    first. `source` and the `since`/`until` bounds on created_at (UTC datetimes
+    or 'YYYY-MM-DD HH:MM:SS' strings) narrow either kind of lookup.
+    """
+    filters, params = [], []
+    if source:
+        filters.append('jobs.source = ?')
+        params.append(source)
+    if since:
+        filters.append('jobs.created_at >= ?')
+        params.append(_timestamp(since))
+    if until:
+        filters.append('jobs.created_at < ?')
+        params.append(_timestamp(until))
+    
+    columns = 'jobs.title, jobs.company, jobs.location, jobs.link, jobs.source, jobs.posted_time, jobs.created_at'
+    match = _fts_query(term) if term else ''
+    if term and not match:
+        return []
     
-    cursor.execute('SELECT COUNT(*) FROM jobs')
-    count = cursor.fetchone()[0]
+    if match and _fts_available:
+        # Rank only the newest matches: walking the index by rowid stops early, while
+        # ranking every match of a common word would cost time proportional to the table
+        sql = f'''
+            SELECT {columns} FROM (
+                SELECT jobs.*, bm25(jobs_fts, ?, ?, ?) AS score
+                FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid
+                WHERE jobs_fts MATCH ? {''.join(' AND ' + f for f in filters)}
+                ORDER BY jobs_fts.rowid DESC LIMIT ?
+            ) AS jobs ORDER BY jobs.score, jobs.id DESC LIMIT ?
+        '''
+        params = list(SEARCH_WEIGHTS) + [match] + params + [search_candidates, limit]
+    elif match:
+        pattern = '%' + re.sub(r'([\\%_])', r'\\\1', term) + '%'
+        filters.insert(0, "(jobs.title LIKE ? ESCAPE '\\' OR jobs.company LIKE ? ESCAPE '\\' OR jobs.location LIKE ? ESCAPE '\\')")
+        params = [pattern, pattern, pattern] + params
+        sql = f"SELECT {columns} FROM jobs WHERE {' AND '.join(filters)} ORDER BY jobs.created_at DESC, jobs.id DESC LIMIT ?"
+        params.append(limit)
+    else:
+        where = f"WHERE {' AND '.join(filters)}" if filters else ''
+        sql = f"SELECT {columns} FROM jobs {where} ORDER BY jobs.created_at DESC, jobs.id DESC LIMIT ?"
+        params.append(limit)
     
-    conn.close()
-    return count
+    with SEARCH_SECONDS.time(), _conn_lock:
+        cursor = get_connection().execute(sql, params)
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
 
-def cleanup_old_jobs():
-    """Delete all jobs from the database (clean slate)"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+def cleanup_old_jobs(retention_days=JOB_RETENTION_DAYS, batch_size=CLEANUP_BATCH_SIZE, pause=CLEANUP_BATCH_PAUSE):
+    """Delete jobs older than the retention window in small batches, then reclaim free pages.
+
+    The connection lock is released between batches so scraping cycles can keep
+    writing while a large backlog is trimmed.
+    """
+    deleted_count = 0
+    cutoff = f'-{retention_days} days'
     
     try:
-        cursor.execute('DELETE FROM jobs')
-        conn.commit()
-        deleted_count = cursor.rowcount
+        while True:
+            with _conn_lock:
+                conn = get_connection()
+                with conn:
+                    deleted = conn.execute('''
+                        DELETE FROM jobs WHERE id IN (
+                            SELECT id FROM jobs WHERE created_at < datetime('now', ?)
+                            ORDER BY created_at LIMIT ?
+                        )
+                    ''', (cutoff, batch_size)).rowcount
+            
+            deleted_count += deleted
+            if deleted < batch_size:
+                break
+            time.sleep(pause)
         
-        # Reset autoincrement counter
-        cursor.execute('DELETE FROM sqlite_sequence WHERE name="jobs"')
-        conn.commit()
+        with _conn_lock:
+            get_connection().execute(f'PRAGMA incremental_vacuum({INCREMENTAL_VACUUM_PAGES})').fetchall()
         
+        # Links that left the table must not keep suppressing jobs from memory
+        expired_before = time.time() - retention_days * 24 * 60 * 60
+        get_seen_index().evict_older_than(expired_before)
+        get_dedup_engine().evict_older_than(expired_before)
         return deleted_count
         
     except Exception as e:
         print(f"Error cleaning up database: {e}")
-        return 0
-    finally:
-        conn.close()
+        return deleted_count
 
 def get_database_size():
-    """Get database file size"""
-    if os.path.exists(DB_PATH):
-        return os.path.getsize(DB_PATH)
-    return 0
-
-def start_daily_cleanup():
-    """Start background thread for daily database cleanup"""
-    def cleanup_worker():
-        while True:
-            try:
-                # Wait 24 hours
-                time.sleep(24 * 60 * 60)  # 24 hours in seconds
-                
-                # Perform cleanup
-                deleted_count = cleanup_old_jobs()
-                print(f"🧹 Daily cleanup: Removed {deleted_count} old jobs")
-                
-            except Exception as e:
-                print(f"Error in cleanup worker: {e}")
-                time.sleep(3600)  # Wait 1 hour before retrying
-    
-    # Start the cleanup thread
-    cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
-    cleanup_thread.start()
-    print("✅ Daily database cleanup scheduler started")
\ No newline at end of file
+    """Get database file size, including the WAL file"""
+    return sum(os.path.getsize(path) for path in (DB_PATH, DB_PATH + '-wal') if os.path.exists(path))
@@ -0,0 +1,88 @@
+import threading
+import time
+from collections import OrderedDict
+
+from config import SEEN_INDEX_MAX_ENTRIES
+from utils.dedup import canonical_link
+
+class SeenIndex:
+    """In-memory index of canonical links already stored in the jobs table.
+
+    Entries are kept in insertion order so the oldest links are evicted first when
+    the index is full or when retention removes them from the database. A miss only
+    means "not known in memory"; the UNIQUE constraint on jobs.link stays authoritative.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # canonical link -> first seen (epoch seconds)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def contains(self, link, count=True):
+        """Check a link against the index, counting hits and misses unless count is False"""
+        key = canonical_link(link)
+        with self._lock:
+            found = key in self._entries
+            if count:
+                if found:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            return found
+
+    def add(self, link, seen_at=None):
+        """Record a link as stored, evicting the oldest entries beyond max_entries"""
+        key = canonical_link(link)
+        if not key:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = seen_at if seen_at is not None else time.time()
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def evict_older_than(self, cutoff):
+        """Drop entries first seen before the cutoff (epoch seconds)"""
+        removed = 0
+        with self._lock:
+            while self._entries:
+                key, seen_at = next(iter(self._entries.items()))
+                if seen_at >= cutoff:
+                    break
+                del self._entries[key]
+                removed += 1
+            self.evictions += removed
+        return removed
+
+    def clear(self):
+        """Forget every link"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Size and hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+_seen_index = SeenIndex(SEEN_INDEX_MAX_ENTRIES)
+
+def get_seen_index():
+    """Get the process-wide seen-link index"""
+    return _seen_index
@@ -0,0 +1,118 @@
+import json
+import sqlite3
+
+from config import CHAT_ID, KEYWORDS, LOCATION
+from db.database import get_connection, _conn_lock
+from utils.subscription_index import SubscriptionIndex
+
+def create_subscriptions_table():
+    """Create the subscriptions table (one row per chat) if it doesn't exist"""
+    with _conn_lock:
+        conn = get_connection()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS subscriptions (
+                chat_id TEXT PRIMARY KEY,
+                keywords TEXT NOT NULL,
+                locations TEXT NOT NULL,
+                sources TEXT NOT NULL DEFAULT '[]',
+                active INTEGER NOT NULL DEFAULT 1,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.commit()
+
+def _row_to_subscription(row):
+    chat_id, keywords, locations, sources, active = row
+    return {
+        'chat_id': chat_id,
+        'keywords': json.loads(keywords),
+        'locations': json.loads(locations),
+        'sources': json.loads(sources),
+        'active': bool(active),
+    }
+
+def subscribe(chat_id, keywords, locations=None, sources=None):
+    """Create or replace a chat's subscription; no sources means every source"""
+    try:
+        with _conn_lock:
+            conn = get_connection()
+            with conn:
+                conn.execute('''
+                    INSERT INTO subscriptions (chat_id, keywords, locations, sources, active)
+                    VALUES (?, ?, ?, ?, 1)
+                    ON CONFLICT(chat_id) DO UPDATE SET
+                        keywords = excluded.keywords,
+                        locations = excluded.locations,
+                        sources = excluded.sources,
+                        active = 1
+                ''', (str(chat_id), json.dumps(list(keywords)), json.dumps(list(locations or [LOCATION])),
+                      json.dumps(list(sources or []))))
+        return True
+    except sqlite3.Error as e:
+        print(f"Error saving subscription: {e}")
+        return False
+
+def unsubscribe(chat_id):
+    """Delete a chat's subscription, returning True if it existed"""
+    with _conn_lock:
+        conn = get_connection()
+        with conn:
+            return conn.execute('DELETE FROM subscriptions WHERE chat_id = ?', (str(chat_id),)).rowcount > 0
+
+def set_subscription_active(chat_id, active):
+    """Pause or resume a chat's alerts without losing its filters"""
+    with _conn_lock:
+        conn = get_connection()
+        with conn:
+            return conn.execute('UPDATE subscriptions SET active = ? WHERE chat_id = ?',
+                                (int(bool(active)), str(chat_id))).rowcount > 0
+
+def get_subscription(chat_id):
+    """One chat's subscription, or None"""
+    with _conn_lock:
+        row = get_connection().execute(
+            'SELECT chat_id, keywords, locations, sources, active FROM subscriptions WHERE chat_id = ?',
+            (str(chat_id),)
+        ).fetchone()
+    return _row_to_subscription(row) if row else None
+
+def get_subscriptions(active_only=True):
+    """Every subscription (only active ones by default), oldest first"""
+    query = 'SELECT chat_id, keywords, locations, sources, active FROM subscriptions'
+    if active_only:
+        query += ' WHERE active = 1'
+    with _conn_lock:
+        rows = get_connection().execute(query + ' ORDER BY created_at, chat_id').fetchall()
+    return [_row_to_subscription(row) for row in rows]
+
+def sync_default_subscription(keywords=None, locations=None):
+    """Point config.CHAT_ID's subscription at config.KEYWORDS and LOCATION.
+
+    Config stays the source of truth for the default chat, so keyword edits take
+    effect on the next start; a paused state and source filter are kept.
+    Returns True if the subscription was created or changed.
+    """
+    if not CHAT_ID:
+        return False
+    keywords = list(KEYWORDS if keywords is None else keywords)
+    locations = list(locations or [LOCATION])
+
+    current = get_subscription(CHAT_ID)
+    if current and current['keywords'] == keywords and current['locations'] == locations:
+        return False
+
+    with _conn_lock:
+        conn = get_connection()
+        with conn:
+            conn.execute('''
+                INSERT INTO subscriptions (chat_id, keywords, locations)
+                VALUES (?, ?, ?)
+                ON CONFLICT(chat_id) DO UPDATE SET
+                    keywords = excluded.keywords,
+                    locations = excluded.locations
+            ''', (str(CHAT_ID), json.dumps(keywords), json.dumps(locations)))
+    return True
+
+def load_subscription_index():
+    """Matching index over the active subscriptions"""
+    return SubscriptionIndex(get_subscriptions())
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 import time
@@ -5,11 +6,17 @@ import schedule
 from datetime import datetime
 import threading
 
-from config import KEYWORDS, LOCATION, SCRAPING_INTERVAL
+from config import (
+    KEYWORDS, SCRAPING_INTERVAL, JOB_RETENTION_DAYS, DIGEST_MODE, MAX_INDIVIDUAL_ALERTS,
+    ADAPTIVE_MIN_INTERVAL, ADAPTIVE_MAX_INTERVAL, SCHEDULER_TICK_SECONDS,
+    METRICS_ENABLED, METRICS_HOST, METRICS_PORT, COMMANDS_ENABLED,
+)
 
 # Smart scraper selection - try Selenium first, fallback to requests
 try:
     from scraper.naukri_scraper import scrape_naukri_recent_jobs
+    from scraper.naukri_scraper import get_page_timing_stats
+    from scraper.driver_pool import get_driver_pool
     NAUKRI_SCRAPER = "selenium"
     print("✅ Using Selenium for Naukri")
 except Exception as e:
@@ -19,75 +26,211 @@ except Exception as e:
     print("✅ Using fallback for Naukri")
 
 from scraper.linkedin_scraper import scrape_linkedin_recent_jobs
-from db.database import create_table, save_job, get_sent_jobs_count, cleanup_old_jobs, start_daily_cleanup, get_database_size
-from tg.bot import send_bulk_alerts, send_summary, send_message
-from utils.helpers import log_message
+from scraper.pipeline import stream_scrape
+from scraper.fetch_cache import get_fetch_cache
+from scraper.crawler import get_crawl_stats
+from scraper.scheduler import build_scheduler
+from scraper.query_planner import QueryPlanner
+from scraper.health import get_source_health, format_source_health
+from db.database import create_table, save_jobs_bulk, get_sent_jobs_count, cleanup_old_jobs, get_database_size
+from db.subscriptions import create_subscriptions_table, sync_default_subscription, load_subscription_index
+from db.seen_index import get_seen_index
+from utils.dedup import get_dedup_engine
+from tg.bot import send_bulk_alerts, send_digest_alerts, send_summary, send_message
+from tg.delivery import get_delivery_queue
+from tg.commands import CommandBot
+from utils.helpers import log_message, use_keywords
+from utils.http_client import get_http_stats
+from utils.metrics import start_metrics_server, gauge
 
-def run_job_scraping():
-    """Main function to run all scrapers and send alerts"""
+# Naukri (auto-selected method) and LinkedIn (always requests-based)
+SCRAPERS = {
+    'Naukri': scrape_naukri_recent_jobs,
+    'LinkedIn': scrape_linkedin_recent_jobs,
+}
+
+def make_notifier(index):
+    """Alert sender for one cycle: fans jobs out to matching subscribers as digests,
+    or as individual alerts capped at MAX_INDIVIDUAL_ALERTS per chat"""
+    individual_sent = {}
+    
+    def notify(jobs):
+        queued = 0
+        for chat_id, chat_jobs in index.fan_out(jobs).items():
+            if DIGEST_MODE:
+                queued += send_digest_alerts(chat_jobs, chat_id)
+                continue
+            
+            room = MAX_INDIVIDUAL_ALERTS - individual_sent.get(chat_id, 0)
+            if room <= 0:
+                continue
+            individual_sent[chat_id] = individual_sent.get(chat_id, 0) + min(room, len(chat_jobs))
+            queued += send_bulk_alerts(chat_jobs[:room], chat_id)
+        return queued
+    
+    return notify
+
+# Epoch seconds of the last cycle summary sent to Telegram
+last_summary_at = 0.0
+
+def run_job_scraping(queries, index):
+    """Run the given (keyword, location, source) queries and alert each matching subscriber.
+
+    Returns the pipeline's cycle stats, or None if the cycle failed.
+    """
+    global last_summary_at
     try:
         log_message("🔄 Starting job scraping session...")
+        cache_before = get_fetch_cache().stats()
         
-        all_jobs = []
-        new_jobs = []
+        # Scrape each distinct query once, concurrently under per-source limits; jobs stream
+        # through dedup and the database and are fanned out as soon as they are confirmed new
+        cycle = stream_scrape(queries, SCRAPERS, save_jobs_bulk, make_notifier(index))
+        new_jobs = cycle['new_jobs']
+        total_queued = cycle['queued']
         
-        # Run scrapers for each keyword
-        for keyword in KEYWORDS[:3]:
-            log_message(f"🔍 Scraping jobs for: {keyword}")
-            
-            try:
-                # Scrape Naukri (auto-selects best method)
-                naukri_jobs = scrape_naukri_recent_jobs(keyword, LOCATION)
-                
-                # Scrape LinkedIn (always requests-based)
-                linkedin_jobs = scrape_linkedin_recent_jobs(keyword, LOCATION)
-                
-                all_jobs.extend(naukri_jobs)
-                all_jobs.extend(linkedin_jobs)
-                
-                log_message(f"✅ {keyword}: Naukri({len(naukri_jobs)}), LinkedIn({len(linkedin_jobs)}) | Naukri mode: {NAUKRI_SCRAPER}")
-                time.sleep(3)
-                
-            except Exception as e:
-                log_message(f"❌ Error scraping {keyword}: {e}")
+        for result in cycle['results']:
+            if result['skipped']:
+                log_message(f"⏸️ Skipped {result['source']} for {result['keyword']} ({result['location']}): {result['error']}")
                 continue
+            if result['error']:
+                log_message(f"❌ Error scraping {result['source']} for {result['keyword']} ({result['location']}): {result['error']}")
+                continue
+            
+            log_message(f"✅ {result['keyword']} ({result['location']}): {result['source']}({len(result['jobs'])}) in {result['elapsed']:.1f}s")
+        
+        log_message(f"🔍 Scraped {len(cycle['results'])}/{len(queries)} due queries for {len(index)} subscribers | Naukri mode: {NAUKRI_SCRAPER}")
+        if cycle['first_alert_seconds'] is not None:
+            log_message(f"⚡ First alert queued after {cycle['first_alert_seconds']:.1f}s "
+                        f"(cycle {cycle['elapsed']:.1f}s, {cycle['batches']} DB batches)")
+        
+        if NAUKRI_SCRAPER == "selenium":
+            pool = get_driver_pool().stats()
+            log_message(f"🌐 Chrome pool: {pool['live']}/{pool['size']} live, {pool['launches']} launches "
+                        f"({pool['avg_launch_seconds']:.1f}s avg), {pool['pages_served']} pages, "
+                        f"{pool['recycled']} recycled, {pool['crashed']} crashed")
+            pages = get_page_timing_stats()
+            log_message(f"⏳ Naukri pages: {pages['pages']} | median {pages['median']:.1f}s, "
+                        f"p90 {pages['p90']:.1f}s | {pages['outcomes']}")
+        
+        for host, stats in get_http_stats().items():
+            log_message(f"🌐 {host}: {stats['requests']} requests, {stats['errors']} errors, "
+                        f"avg {stats['avg_seconds']:.2f}s, max {stats['max_seconds']:.2f}s")
         
-        # Remove duplicates and filter new jobs
-        seen_links = set()
-        for job in all_jobs:
-            if job['link'] and job['link'] not in seen_links:
-                seen_links.add(job['link'])
-                if save_job(job):
-                    new_jobs.append(job)
+        health_text = format_source_health(get_source_health())
+        log_message(f"🚦 Sources: {health_text}")
         
-        # Send alerts
-        total_sent = 0
-        if new_jobs:
-            total_sent = send_bulk_alerts(new_jobs[:8])
+        for source, crawl in get_crawl_stats().items():
+            log_message(f"📚 {source} crawl: {crawl['pages_per_crawl']:.1f} pages/search, "
+                        f"{crawl['cards_per_second']:.0f} cards/s | stops {crawl['stops']}")
         
-        # Send summary with scraper info
-        summary_msg = f"""
+        cache = get_fetch_cache().stats()
+        page_lookups = cache['lookups'] - cache_before['lookups']
+        page_hits = cache['hits'] - cache_before['hits']
+        cache_hit_rate = page_hits / page_lookups if page_lookups else 0.0
+        log_message(f"♻️ Fetch cache: {page_hits}/{page_lookups} pages unchanged ({cache_hit_rate:.0%}) | "
+                    f"304s {cache['not_modified']}, same body {cache['same_body']}, same cards {cache['same_cards']}")
+        
+        seen = get_seen_index().stats()
+        dedup = get_dedup_engine().stats()
+        log_message(f"🧠 Seen index: {seen['size']} links | hits {seen['hits']}, misses {seen['misses']} "
+                    f"({seen['hit_rate']:.0%} hit rate) | duplicates: {dedup['exact_hits']} exact, {dedup['near_hits']} near")
+        
+        delivery = get_delivery_queue().stats()
+        gauge('seen_index_size', 'Links held in the in-memory seen index').set(seen['size'])
+        gauge('telegram_queue_depth', 'Messages waiting in the delivery queue').set(delivery['depth'])
+        log_message(f"📬 Telegram queue: depth {delivery['depth']}, sent {delivery['sent']}, failed {delivery['failed']}, "
+                    f"429s {delivery['rate_limited']}, latency p50 {delivery['latency_p50']:.1f}s / max {delivery['latency_max']:.1f}s")
+        
+        # Send summary with scraper info - on new jobs, otherwise at most once per base interval
+        if new_jobs or time.time() - last_summary_at >= SCRAPING_INTERVAL * 60:
+            summary_msg = f"""
 📊 Scraping Complete
 ⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}
-🔍 Total Scanned: {len(all_jobs)}
+🔍 Queries: {len(cycle['results'])}
+👥 Subscribers: {len(index)}
+🔍 Total Scanned: {cycle['scanned']}
 🆕 New Jobs: {len(new_jobs)}
-📤 Sent: {total_sent}
+♻️ Cache Hits: {page_hits}/{page_lookups} pages ({cache_hit_rate:.0%})
+📤 Queued: {total_queued} {'digest ' if DIGEST_MODE else ''}messages
 🔧 Naukri Mode: {NAUKRI_SCRAPER.upper()}
-        """
-        send_message(summary_msg)
+🚦 Sources: {health_text}
+            """
+            send_message(summary_msg)
+            last_summary_at = time.time()
         
-        log_message(f"✅ Cycle complete. Found: {len(all_jobs)}, New: {len(new_jobs)}, Sent: {total_sent}")
+        log_message(f"✅ Cycle complete. Found: {cycle['scanned']}, New: {len(new_jobs)}, Queued: {total_queued}")
+        return cycle
         
     except Exception as e:
         error_msg = f"❌ Error in scraping cycle: {str(e)}"
         log_message(error_msg)
         send_message(error_msg)
+        return None
+
+def run_due_scrapes(scheduler, planner):
+    """Scrape the queries that are due and feed what they found back to the scheduler and planner"""
+    # Subscriptions may have changed since the last tick: track the queries they need now,
+    # minus those the planner has learned another query already covers
+    index = load_subscription_index()
+    use_keywords(index.keywords)
+    scheduler.sync(planner.plan(index.queries(SCRAPERS)))
+    
+    queries = scheduler.due()
+    if not queries:
+        return
+    
+    cycle = run_job_scraping(queries, index)
+    failed = {(result['keyword'], result['location'], result['source'])
+              for result in cycle['results'] if result['error']} if cycle else set(queries)
+    for query in queries:
+        scheduler.record(query, cycle['new_by_query'][query] if cycle else 0, failed=query in failed)
+    
+    if cycle:
+        saved = planner.observe(cycle['results'])
+        plan = planner.stats()
+        log_message(f"🧮 Query plan: {plan['requested']} queries → {plan['planned']} "
+                    f"({plan['duplicates']} duplicate, {plan['subsumed']} covered by broader ones) | "
+                    f"saved {saved} searches this cycle, {plan['saved']} total")
+    
+    stats = scheduler.stats()
+    log_message(f"⏱️ Query intervals: {stats['min_interval'] / 60:.0f}-{stats['max_interval'] / 60:.0f} min "
+                f"(median {stats['median_interval'] / 60:.0f}) | next run in {scheduler.seconds_until_next() / 60:.1f} min")
+
+async def scrape_loop(scheduler, planner, wake):
+    """Run due scrapes and scheduled jobs every tick, or sooner when `wake` is set"""
+    while True:
+        try:
+            await asyncio.to_thread(run_due_scrapes, scheduler, planner)
+            await asyncio.to_thread(schedule.run_pending)
+        except Exception as e:
+            log_message(f"❌ Scheduler error: {e}")
+            await asyncio.sleep(300)  # Wait 5 minutes before retrying
+        
+        try:
+            await asyncio.wait_for(wake.wait(), SCHEDULER_TICK_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        wake.clear()
+
+async def serve(scheduler, planner):
+    """Scrape on schedule and, if enabled, answer Telegram commands alongside"""
+    loop = asyncio.get_running_loop()
+    wake = asyncio.Event()
+    tasks = [scrape_loop(scheduler, planner, wake)]
+    
+    if COMMANDS_ENABLED:
+        bot = CommandBot(scheduler=scheduler, on_scrape=lambda: loop.call_soon_threadsafe(wake.set))
+        tasks.append(bot.poll_forever())
+        log_message("💬 Listening for Telegram commands")
+    
+    await asyncio.gather(*tasks)
 
 def manual_cleanup():
     """Manual cleanup function that can be scheduled"""
     try:
         deleted_count = cleanup_old_jobs()
-        message = f"🧹 Manual Cleanup Complete!\n🗑️ Removed {deleted_count} jobs\n⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+        message = f"🧹 Manual Cleanup Complete!\n🗑️ Removed {deleted_count} jobs older than {JOB_RETENTION_DAYS} days\n⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
         send_message(message)
         log_message(f"Manual cleanup: Removed {deleted_count} jobs")
     except Exception as e:
@@ -110,22 +253,31 @@ def main():
     
     # Initialize database
     create_table()
+    create_subscriptions_table()
+    if sync_default_subscription():
+        log_message(f"👤 Default chat subscribed to {len(KEYWORDS)} keywords from config")
     sent_count = get_sent_jobs_count()
     log_message(f"📦 Database initialized. Previous jobs: {sent_count}")
     
-    # Start daily cleanup scheduler
-    start_daily_cleanup()
+    if METRICS_ENABLED:
+        try:
+            start_metrics_server()
+            log_message(f"📈 Metrics at http://{METRICS_HOST}:{METRICS_PORT}/metrics (summary at /stats)")
+        except OSError as e:
+            log_message(f"⚠️ Metrics server not started: {e}")
     
-    # Schedule daily cleanup at specific time (e.g., 2:00 AM)
+    # Schedule daily retention cleanup during quiet hours (2:00 AM)
     schedule.every().day.at("02:00").do(manual_cleanup)
     
     # Send startup message
+    index = load_subscription_index()
     send_message(f"""
 🤖 Job Alert Bot Activated!
-📍 Location: {LOCATION}
-🔍 Keywords: {', '.join(KEYWORDS[:3])}
-⏰ Interval: {SCRAPING_INTERVAL} minutes
-🧹 Auto-cleanup: Every 24 hours
+👥 Subscribers: {len(index)}
+🔍 Queries: {len(index.queries(SCRAPERS))} ({len(index.keywords)} distinct keywords)
+⏰ Interval: {SCRAPING_INTERVAL} minutes (adapts per query, {ADAPTIVE_MIN_INTERVAL}-{ADAPTIVE_MAX_INTERVAL})
+🧹 Retention: {JOB_RETENTION_DAYS} days (cleanup daily at 02:00)
+💬 Commands: {"/help" if COMMANDS_ENABLED else "off"}
 🚀 Deployed on Railway
     """)
     
@@ -133,24 +285,16 @@ def main():
     heartbeat_thread = threading.Thread(target=keep_alive, daemon=True)
     heartbeat_thread.start()
     
-    # Schedule the scraping job
-    schedule.every(SCRAPING_INTERVAL).minutes.do(run_job_scraping)
-    
-    # Run immediately once
-    run_job_scraping()
+    # Each (keyword, location, source) query gets its own adaptive interval; all are due on the first tick
+    planner = QueryPlanner()
+    scheduler = build_scheduler(planner.plan(index.queries(SCRAPERS)))
     
-    # Keep the script running
+    # Scraping and Telegram commands share one event loop; blocking work runs in threads
     log_message("⏰ Scheduler started. Waiting for intervals...")
-    while True:
-        try:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
-        except KeyboardInterrupt:
-            log_message("🛑 Bot stopped by user")
-            break
-        except Exception as e:
-            log_message(f"❌ Scheduler error: {e}")
-            time.sleep(300)  # Wait 5 minutes before retrying
+    try:
+        asyncio.run(serve(scheduler, planner))
+    except KeyboardInterrupt:
+        log_message("🛑 Bot stopped by user")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
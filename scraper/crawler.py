@@ -0,0 +1,117 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config import CRAWL_MAX_PAGES, CRAWL_PAGE_CONCURRENCY
+from utils.metrics import counter, histogram
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+CRAWL_SECONDS = histogram('scraper_crawl_seconds', 'Time to walk all result pages of one search')
+CARDS_FOUND = counter('scraper_cards', 'Job cards found per source and keyword')
+KEYWORD_REJECTS = counter('scraper_keyword_rejects', 'Cards dropped by the keyword filter per source and keyword')
+
+def _record(source, pages, cards, elapsed, stop):
+    with _stats_lock:
+        entry = _stats.setdefault(source, {
+            'crawls': 0,
+            'pages': 0,
+            'cards': 0,
+            'seconds': 0.0,
+            'stops': {},
+        })
+        entry['crawls'] += 1
+        entry['pages'] += pages
+        entry['cards'] += cards
+        entry['seconds'] += elapsed
+        entry['stops'][stop] = entry['stops'].get(stop, 0) + 1
+
+def _all_seen(links, is_seen):
+    links = [link for link in links if link]
+    return bool(links) and all(is_seen(link) for link in links)
+
+def _read_page(fetch_page, page):
+    # Later pages are read in full by their worker thread, so they download concurrently
+    return list(fetch_page(page))
+
+def iter_crawl(source, fetch_page, is_seen=None, max_pages=CRAWL_MAX_PAGES, concurrency=CRAWL_PAGE_CONCURRENCY, keyword=''):
+    """Walk result pages, yielding their cards in page order as soon as they arrive.
+
+    `fetch_page(page)` returns the cards on a 0-based result page, as a list or
+    an iterable that parses them lazily. The first page is fetched alone (in
+    steady state it usually holds everything new) and its cards are passed on
+    one by one as they are produced; later pages are fetched `concurrency` at a
+    time and passed on a page at a time. The crawl stops at max_pages, at the
+    first empty page, or at the first page whose links `is_seen` already knows.
+    `keyword` only labels the metrics.
+    """
+    started = time.monotonic()
+    found = 0
+    fetched = 0
+    stop = 'depth'
+
+    try:
+        # The first page is read here, card by card if fetch_page streams them
+        links = []
+        try:
+            for card in fetch_page(0):
+                found += 1
+                links.append(card.get('link'))
+                yield card
+        except Exception:
+            stop = 'error'
+            raise
+        fetched = 1
+        if not links:
+            stop = 'end'
+        elif is_seen and _all_seen(links, is_seen):
+            stop = 'seen'
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="crawl") as executor:
+            page = 1
+            while page < max_pages and stop == 'depth':
+                wave = range(page, min(max_pages, page + concurrency))
+                futures = [executor.submit(_read_page, fetch_page, number) for number in wave]
+
+                for number, future in zip(wave, futures):
+                    try:
+                        page_cards = future.result()
+                    except Exception as e:
+                        print(f"⚠️ {source} page {number + 1} failed: {e}")
+                        stop = 'error'
+                        break
+
+                    fetched += 1
+                    if not page_cards:
+                        stop = 'end'
+                        break
+
+                    found += len(page_cards)
+                    yield from page_cards
+                    if is_seen and _all_seen([card.get('link') for card in page_cards], is_seen):
+                        stop = 'seen'
+                        break
+
+                page = wave.stop
+    finally:
+        # Also recorded when the consumer stops early or the first page fails
+        elapsed = time.monotonic() - started
+        _record(source, fetched, found, elapsed, stop)
+        CRAWL_SECONDS.observe(elapsed, source=source)
+        CARDS_FOUND.inc(found, source=source, keyword=keyword)
+        print(f"📚 {source}: {found} cards from {fetched} pages in {elapsed:.1f}s (stopped: {stop})")
+
+def crawl_pages(source, fetch_page, **kwargs):
+    """Walk result pages and return all their cards in page order (see iter_crawl)"""
+    return list(iter_crawl(source, fetch_page, **kwargs))
+
+def get_crawl_stats():
+    """Per-source pages, cards and cards/second across crawls since startup"""
+    with _stats_lock:
+        stats = {source: dict(entry, stops=dict(entry['stops'])) for source, entry in _stats.items()}
+
+    for entry in stats.values():
+        entry['cards_per_second'] = entry['cards'] / entry['seconds'] if entry['seconds'] else 0.0
+        entry['pages_per_crawl'] = entry['pages'] / entry['crawls'] if entry['crawls'] else 0.0
+    return stats
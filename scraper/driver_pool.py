@@ -0,0 +1,190 @@
+import atexit
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+from config import get_random_headers, CHROME_POOL_SIZE, CHROME_MAX_PAGES_PER_DRIVER, CHROME_LEASE_TIMEOUT
+
+def create_headless_driver():
+    """Launch a headless Chrome configured to look like a regular browser"""
+    chrome_options = Options()
+    chrome_options.add_argument(f"user-agent={get_random_headers()['User-Agent']}")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    # HEADLESS MODE - No browser window will open
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+class _PooledDriver:
+    """A live driver plus the bookkeeping needed to decide when to recycle it"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.created_at = time.time()
+
+class DriverPool:
+    """Keeps up to `size` long-lived Chrome sessions and leases them to scrape calls.
+
+    Drivers are launched lazily on first demand, returned to the pool after each
+    lease, and quit/replaced once they have served `max_pages` pages or crashed.
+    """
+
+    def __init__(self, size, max_pages, lease_timeout, factory=create_headless_driver):
+        self.size = size
+        self.max_pages = max_pages
+        self.lease_timeout = lease_timeout
+        self._factory = factory
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._live = 0
+        self._closed = False
+        self._stats = {
+            'launches': 0,
+            'launch_seconds': 0.0,
+            'recycled': 0,
+            'crashed': 0,
+            'pages_served': 0,
+            'leased': 0,
+        }
+
+    def _launch(self):
+        started = time.monotonic()
+        try:
+            driver = self._factory()
+        except Exception:
+            with self._lock:
+                self._live -= 1
+            raise
+
+        with self._lock:
+            self._stats['launches'] += 1
+            self._stats['launch_seconds'] += time.monotonic() - started
+        return _PooledDriver(driver)
+
+    def _discard(self, pooled, reason):
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+        with self._lock:
+            self._live -= 1
+            self._stats[reason] += 1
+
+    def _is_alive(self, pooled):
+        try:
+            pooled.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _acquire(self):
+        deadline = time.monotonic() + self.lease_timeout
+
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                pooled = None
+
+            if pooled is None:
+                with self._lock:
+                    if self._closed:
+                        raise RuntimeError("Driver pool is shut down")
+                    can_launch = self._live < self.size
+                    if can_launch:
+                        self._live += 1
+
+                if can_launch:
+                    return self._launch()
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No Chrome driver free within {self.lease_timeout}s")
+                try:
+                    pooled = self._idle.get(timeout=remaining)
+                except queue.Empty:
+                    continue
+
+            if self._is_alive(pooled):
+                return pooled
+            self._discard(pooled, 'crashed')
+
+    def _release(self, pooled, crashed):
+        pooled.pages += 1
+        with self._lock:
+            self._stats['pages_served'] += 1
+            self._stats['leased'] -= 1
+            closed = self._closed
+
+        if crashed:
+            self._discard(pooled, 'crashed')
+        elif closed or pooled.pages >= self.max_pages:
+            self._discard(pooled, 'recycled')
+        else:
+            self._idle.put(pooled)
+
+    @contextmanager
+    def lease(self):
+        """Borrow a driver for one page; a WebDriverException inside the block retires it"""
+        pooled = self._acquire()
+        with self._lock:
+            self._stats['leased'] += 1
+
+        crashed = False
+        try:
+            yield pooled.driver
+        except WebDriverException:
+            crashed = True
+            raise
+        finally:
+            self._release(pooled, crashed)
+
+    def stats(self):
+        """Snapshot of pool usage counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = self.size
+            stats['live'] = self._live
+        stats['idle'] = self._idle.qsize()
+        stats['avg_launch_seconds'] = stats['launch_seconds'] / stats['launches'] if stats['launches'] else 0.0
+        return stats
+
+    def shutdown(self):
+        """Quit every idle driver; leased drivers are quit when they come back"""
+        with self._lock:
+            self._closed = True
+
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(pooled, 'recycled')
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_driver_pool():
+    """Get the process-wide Chrome driver pool, creating it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool(CHROME_POOL_SIZE, CHROME_MAX_PAGES_PER_DRIVER, CHROME_LEASE_TIMEOUT)
+            atexit.register(_pool.shutdown)
+        return _pool
@@ -0,0 +1,95 @@
+import threading
+import time
+
+from config import SOURCE_CONCURRENCY, SOURCE_MIN_INTERVAL
+from utils.metrics import counter, histogram
+from scraper.health import get_breaker, SourceOpen
+
+TASK_SECONDS = histogram('scrape_task_seconds', 'Wall time of one (keyword, source) scrape including limiter waits')
+TASK_ERRORS = counter('scrape_task_errors', 'Scrapes that raised, per source')
+
+class SourceLimiter:
+    """Caps in-flight scrapes for one source and spaces out their start times"""
+
+    def __init__(self, name, max_concurrent, min_interval):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def _wait_turn(self):
+        """Reserve the next start slot for this source and sleep until it arrives"""
+        with self._lock:
+            start_at = max(time.monotonic(), self._next_start)
+            self._next_start = start_at + self.min_interval
+
+        delay = start_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def run(self, func, *args):
+        """Run func under this source's concurrency and politeness limits"""
+        with self._semaphore:
+            self._wait_turn()
+            return func(*args)
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+def get_limiter(source):
+    """Get (or lazily create) the shared limiter for a source"""
+    key = source.lower()
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = SourceLimiter(
+                key,
+                SOURCE_CONCURRENCY.get(key, 1),
+                SOURCE_MIN_INTERVAL.get(key, 1.0)
+            )
+        return _limiters[key]
+
+def run_scrape_task(source, scraper, keyword, location, emit=None):
+    """Run a single (keyword, source) scrape and wrap the outcome in a result dict.
+
+    When `emit` is given, each job is handed to it as soon as the scraper yields it.
+    """
+    started = time.monotonic()
+    result = {
+        'keyword': keyword,
+        'location': location,
+        'source': source,
+        'jobs': [],
+        'error': None,
+        'skipped': False,
+        'elapsed': 0.0,
+    }
+    breaker = get_breaker(source)
+
+    def collect():
+        # Checked after the limiter wait, so queued scrapes see a circuit opened meanwhile
+        if not breaker.allow():
+            raise SourceOpen(f"{source} paused, retry in {breaker.seconds_until_retry():.0f}s")
+
+        # Scrapers may return a list or yield jobs one by one; iterate inside the limiter either way
+        jobs = []
+        for job in scraper(keyword, location) or []:
+            if emit:
+                emit(job)
+            jobs.append(job)
+        return jobs
+
+    try:
+        result['jobs'] = get_limiter(source).run(collect)
+    except SourceOpen as e:
+        result['error'] = str(e)
+        result['skipped'] = True
+    except Exception as e:
+        result['error'] = str(e)
+        TASK_ERRORS.inc(source=source)
+        breaker.record('error')
+
+    result['elapsed'] = time.monotonic() - started
+    TASK_SECONDS.observe(result['elapsed'], source=source, keyword=keyword)
+    return result
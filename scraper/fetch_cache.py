@@ -0,0 +1,212 @@
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+from config import REQUEST_TIMEOUT, FETCH_CACHE_MAX_ENTRIES, STREAM_CHUNK_SIZE
+from scraper.parsers import parse_cards
+from scraper.stream_parser import iter_cards
+from utils.http_client import http_get
+from utils.metrics import counter, histogram
+
+# Per-request noise inside otherwise identical card markup: tracking query strings and ids
+VOLATILE_MARKUP = re.compile(rb'\?[^"\'\s<>]*|\s(?:data-tracking-id|data-search-id|data-impression-id)="[^"]*"')
+
+FETCH_SECONDS = histogram('scraper_fetch_seconds', 'Search page download time per source')
+PARSE_SECONDS = histogram('scraper_parse_seconds', 'Search page parse time per source')
+CACHE_OUTCOMES = counter('fetch_cache_outcomes', 'Search pages per source by cache outcome (parsed or reused)')
+
+def card_region(markup, start_marker, end_marker=None):
+    """Bytes from the first card marker to the end of the card list, without volatile attributes.
+
+    Falls back to the whole page (e.g. a bare card fragment) when the marker isn't found.
+    """
+    start = markup.find(start_marker)
+    if start < 0:
+        return VOLATILE_MARKUP.sub(b'', markup)
+    end = markup.rfind(end_marker) if end_marker else -1
+    region = markup[start:end] if end > start else markup[start:]
+    return VOLATILE_MARKUP.sub(b'', region)
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+class FetchCache:
+    """Remembers validators, content hashes and parsed cards per search URL.
+
+    A page is only re-parsed when it actually changed: a 304 answer to a
+    conditional request, an identical body or an identical card region all
+    reuse the cards parsed last time. Bounded to max_entries URLs, least
+    recently used first.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # url -> {etag, last_modified, body_hash, region_hash, cards}
+        self._lock = threading.Lock()
+        self._stats = {
+            'lookups': 0,
+            'not_modified': 0,
+            'same_body': 0,
+            'same_cards': 0,
+            'parsed': 0,
+            'streamed': 0,
+        }
+
+    def _count(self, key, source):
+        if key != 'lookups':
+            CACHE_OUTCOMES.inc(source=source, outcome=key)
+        with self._lock:
+            self._stats[key] += 1
+
+    def _conditional_headers(self, entry, headers):
+        headers = dict(headers or {})
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def _get(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def _put(self, url, entry):
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def fetch_cards(self, url, strainer, extract, headers=None, region=None, timeout=REQUEST_TIMEOUT, source=None):
+        """GET a search page and return (status_code, cards), skipping the parse when unchanged.
+
+        `region` is an optional (start_marker, end_marker) pair delimiting the card list,
+        so pages whose surrounding markup changes on every request still hit the cache.
+        Cards are only returned for 200 and 304 answers. `source` labels the metrics.
+        """
+        source = source or urlsplit(url).netloc
+        self._count('lookups', source)
+        entry = self._get(url)
+
+        headers = self._conditional_headers(entry, headers)
+
+        with FETCH_SECONDS.time(source=source):
+            response = http_get(url, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and entry:
+            self._count('not_modified', source)
+            return 304, list(entry['cards'])
+
+        if response.status_code != 200:
+            return response.status_code, []
+
+        markup = response.content
+        body_hash = _digest(markup)
+        region_hash = _digest(card_region(markup, *region)) if region else None
+
+        if entry and entry['cards'] and body_hash == entry['body_hash']:
+            self._count('same_body', source)
+            cards = entry['cards']
+        elif entry and entry['cards'] and region_hash and region_hash == entry['region_hash']:
+            self._count('same_cards', source)
+            cards = entry['cards']
+        else:
+            self._count('parsed', source)
+            with PARSE_SECONDS.time(source=source):
+                cards = parse_cards(markup, strainer, extract)
+
+        self._put(url, {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body_hash': body_hash,
+            'region_hash': region_hash,
+            'cards': cards,
+        })
+        return 200, list(cards)
+
+    def stream_cards(self, url, spec, headers=None, timeout=REQUEST_TIMEOUT, source=None, chunk_size=STREAM_CHUNK_SIZE):
+        """Like fetch_cards, but a 200 body is parsed chunk by chunk as the caller iterates.
+
+        Returns (status_code, cards) as soon as the headers arrive; for a 200, `cards`
+        is a generator yielding each card while the body is still downloading (see
+        scraper.stream_parser). The page itself is never held, only the card being
+        parsed and the finished card dicts kept for the cache. The entry is stored
+        once the generator is exhausted, so a later 304 reuses its cards; an
+        unchanged 200 is always re-parsed, since its hash is only known once the
+        body has been read.
+        """
+        source = source or urlsplit(url).netloc
+        self._count('lookups', source)
+        entry = self._get(url)
+        headers = self._conditional_headers(entry, headers)
+
+        started = time.monotonic()
+        response = http_get(url, headers=headers, timeout=timeout, stream=True)
+        if response.status_code != 200:
+            response.close()
+            FETCH_SECONDS.observe(time.monotonic() - started, source=source)
+            if response.status_code == 304 and entry:
+                self._count('not_modified', source)
+                return 304, list(entry['cards'])
+            return response.status_code, []
+
+        return 200, self._stream(url, response, spec, source, chunk_size, started)
+
+    def _stream(self, url, response, spec, source, chunk_size, started):
+        # requests assumes ISO-8859-1 for text/html without a charset; these pages are UTF-8
+        content_type = response.headers.get('Content-Type', '').lower()
+        encoding = response.encoding if 'charset=' in content_type else 'utf-8'
+
+        hasher = hashlib.blake2b(digest_size=16)
+        def chunks():
+            for chunk in response.iter_content(chunk_size):
+                hasher.update(chunk)
+                yield chunk
+
+        # Download and parse are interleaved, so both count as fetch time
+        cards = []
+        try:
+            for card in iter_cards(chunks(), spec, encoding):
+                cards.append(card)
+                yield card
+        finally:
+            response.close()
+            FETCH_SECONDS.observe(time.monotonic() - started, source=source)
+
+        self._count('streamed', source)
+        self._put(url, {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body_hash': hasher.hexdigest(),
+            'region_hash': None,
+            'cards': cards,
+        })
+
+    def clear(self):
+        """Forget every page"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Lookup counters and the share of lookups that skipped parsing"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+
+        hits = stats['not_modified'] + stats['same_body'] + stats['same_cards']
+        stats['hits'] = hits
+        stats['hit_rate'] = hits / stats['lookups'] if stats['lookups'] else 0.0
+        return stats
+
+_fetch_cache = FetchCache(FETCH_CACHE_MAX_ENTRIES)
+
+def get_fetch_cache():
+    """Get the process-wide search page cache"""
+    return _fetch_cache
@@ -0,0 +1,178 @@
+import threading
+import time
+
+from config import (
+    CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_BLOCK_THRESHOLD, CIRCUIT_BASE_COOLDOWN,
+    CIRCUIT_MAX_COOLDOWN, CIRCUIT_PROBE_TIMEOUT,
+)
+from utils.helpers import escape_markdown
+from utils.metrics import counter, gauge
+
+# Statuses that mean "you are being blocked or throttled", not "something broke"
+BLOCK_STATUSES = {403, 429, 999}
+# URL fragments of captcha / interstitial pages a browser gets redirected to
+BLOCK_URL_MARKERS = ('captcha', 'challenge', 'authwall', 'checkpoint')
+STATE_VALUES = {'closed': 0, 'half_open': 1, 'open': 2}
+
+STATE_GAUGE = gauge('circuit_state', 'Circuit breaker state per source (0 closed, 1 half-open, 2 open)')
+OUTCOMES = counter('source_outcomes', 'Source health outcomes per source: ok, error, blocked')
+
+def classify_status(status_code):
+    """Map an HTTP status to a health outcome: 'ok', 'blocked' or 'error'"""
+    if status_code in (200, 304):
+        return 'ok'
+    if status_code in BLOCK_STATUSES:
+        return 'blocked'
+    return 'error'
+
+def looks_blocked_url(url):
+    """True if a (redirected) page URL points at a captcha or login wall"""
+    url = (url or '').lower()
+    return any(marker in url for marker in BLOCK_URL_MARKERS)
+
+class CircuitBreaker:
+    """Tracks one source's health and stops traffic to it while it is failing.
+
+    Closed: requests flow; consecutive errors or blocks are counted. Open: after
+    failure_threshold errors or block_threshold blocks, requests are refused for a
+    cooldown. Half-open: once the cooldown passes a single probe is let through;
+    success closes the circuit, failure reopens it with the cooldown doubled (up
+    to max_cooldown).
+    """
+
+    def __init__(self, name, failure_threshold=CIRCUIT_FAILURE_THRESHOLD, block_threshold=CIRCUIT_BLOCK_THRESHOLD,
+                 base_cooldown=CIRCUIT_BASE_COOLDOWN, max_cooldown=CIRCUIT_MAX_COOLDOWN,
+                 probe_timeout=CIRCUIT_PROBE_TIMEOUT, clock=time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.block_threshold = block_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.probe_timeout = probe_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = 'closed'
+        self.failures = 0
+        self.blocks = 0
+        self.cooldown = base_cooldown
+        self.opened_at = None
+        self._probe_started = None
+        self.times_opened = 0
+        STATE_GAUGE.set(0, source=name)
+
+    def _set_state(self, state):
+        if state != self.state:
+            print(f"🚦 {self.name} circuit {self.state} → {state}"
+                  + (f" for {self.cooldown:.0f}s" if state == 'open' else ""))
+        self.state = state
+        STATE_GAUGE.set(STATE_VALUES[state], source=self.name)
+
+    def _open(self, now):
+        self.opened_at = now
+        self._probe_started = None
+        self.times_opened += 1
+        self._set_state('open')
+
+    def allow(self):
+        """True if a request may go to this source now (claims the probe when half-open)"""
+        now = self._clock()
+        with self._lock:
+            if self.state == 'closed':
+                return True
+
+            if self.state == 'open':
+                if now - self.opened_at < self.cooldown:
+                    return False
+                self._set_state('half_open')
+
+            # Half-open: one probe at a time; a probe that never reported back is replaced
+            if self._probe_started is None or now - self._probe_started >= self.probe_timeout:
+                self._probe_started = now
+                return True
+            return False
+
+    def record(self, outcome):
+        """Feed back a request outcome: 'ok', 'error' or 'blocked'"""
+        OUTCOMES.inc(source=self.name, outcome=outcome)
+        now = self._clock()
+        with self._lock:
+            if outcome == 'ok':
+                self.failures = self.blocks = 0
+                self.cooldown = self.base_cooldown
+                self._probe_started = None
+                self._set_state('closed')
+                return
+
+            if self.state == 'half_open':
+                # The probe failed: back off harder
+                self.cooldown = min(self.max_cooldown, self.cooldown * 2)
+                self._open(now)
+                return
+
+            if self.state == 'open':
+                return
+
+            self.failures += 1
+            if outcome == 'blocked':
+                self.blocks += 1
+            if self.failures >= self.failure_threshold or self.blocks >= self.block_threshold:
+                self._open(now)
+
+    def seconds_until_retry(self):
+        """Seconds left in the current cooldown (0 unless open)"""
+        with self._lock:
+            if self.state != 'open':
+                return 0.0
+            return max(0.0, self.cooldown - (self._clock() - self.opened_at))
+
+    def stats(self):
+        """State, failure counts and cooldown"""
+        retry_in = self.seconds_until_retry()
+        with self._lock:
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'blocks': self.blocks,
+                'cooldown': self.cooldown,
+                'retry_in': retry_in,
+                'times_opened': self.times_opened,
+            }
+
+class SourceOpen(Exception):
+    """Raised instead of scraping a source whose circuit is open"""
+
+def watch_stream(breaker, items, errors=(Exception,)):
+    """Pass lazily fetched items through, recording an error if reading them fails midway"""
+    try:
+        yield from items
+    except errors:
+        breaker.record('error')
+        raise
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+def get_breaker(source):
+    """Get (or lazily create) the shared circuit breaker for a source"""
+    key = source.lower()
+    with _breakers_lock:
+        if key not in _breakers:
+            _breakers[key] = CircuitBreaker(source)
+        return _breakers[key]
+
+def format_source_health(health):
+    """One-line source summary, e.g. "LinkedIn closed, Naukri open (12 min)".
+
+    States are shown with hyphens ("half-open") so the text is safe in Telegram Markdown.
+    """
+    return ", ".join(
+        f"{escape_markdown(source)} {state['state'].replace('_', '-')}"
+        + (f" ({state['retry_in'] / 60:.0f} min)" if state['state'] == 'open' else "")
+        for source, state in health.items()
+    )
+
+def get_source_health():
+    """Stats for every source that has reported so far"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.stats() for breaker in breakers}
@@ -1,20 +1,28 @@
 import requests
-from bs4 import BeautifulSoup
-from config import get_random_headers, REQUEST_TIMEOUT
-from utils.helpers import clean_text, contains_keywords, parse_relative_time, format_posted_time
+from config import get_random_headers, REQUEST_TIMEOUT, LINKEDIN_BASE_URL, LINKEDIN_PAGE_SIZE, STREAM_PARSE
+from scraper.parsers import extract_linkedin_cards, LINKEDIN_STRAINER, LINKEDIN_CARD_REGION, LINKEDIN_STREAM_SPEC
+from scraper.fetch_cache import get_fetch_cache
+from scraper.crawler import iter_crawl, KEYWORD_REJECTS
+from scraper.health import get_breaker, classify_status, watch_stream
+from db.seen_index import get_seen_index
+from utils.helpers import clean_text, contains_keywords, parse_age_seconds, format_posted_time
+from datetime import datetime, timedelta
 import time
 
-def scrape_linkedin_jobs(keyword, location):
-    """Scrape jobs from LinkedIn with time parsing for recent jobs"""
-    jobs = []
+def linkedin_search_url(keyword, location, page=0):
+    """Search URL for a 0-based result page; later pages come from the guest jobs API"""
+    # Proper URL encoding
+    keyword_encoded = requests.utils.quote(keyword)
+    location_encoded = requests.utils.quote(location)
     
+    if page == 0:
+        return f"{LINKEDIN_BASE_URL}/jobs/search/?keywords={keyword_encoded}&location={location_encoded}"
+    return (f"{LINKEDIN_BASE_URL}/jobs-guest/jobs/api/seeMoreJobPostings/search"
+            f"?keywords={keyword_encoded}&location={location_encoded}&start={page * LINKEDIN_PAGE_SIZE}")
+
+def scrape_linkedin_jobs(keyword, location):
+    """Scrape jobs from LinkedIn with time parsing, yielding each match as soon as it is parsed"""
     try:
-        # Proper URL encoding
-        keyword_encoded = requests.utils.quote(keyword)
-        location_encoded = requests.utils.quote(location)
-        
-        url = f"https://www.linkedin.com/jobs/search/?keywords={keyword_encoded}&location={location_encoded}"
-        
         print(f"🔍 Scraping LinkedIn for: {keyword} in {location}")
         
         # Enhanced headers to avoid blocking
@@ -28,81 +36,65 @@ def scrape_linkedin_jobs(keyword, location):
             'Upgrade-Insecure-Requests': '1',
         }
         
-        # Add delay to avoid rate limiting
-        time.sleep(2)
-        
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        print(f"📊 LinkedIn status: {response.status_code}")
+        breaker = get_breaker('LinkedIn')
         
-        if response.status_code != 200:
-            print(f"❌ LinkedIn returned status: {response.status_code}")
-            return jobs
+        def fetch_page(page):
+            # Deeper pages are only worth it while LinkedIn is healthy
+            if page and breaker.state != 'closed':
+                return []
             
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Multiple selector strategies for LinkedIn's changing structure
-        job_cards = soup.find_all('div', class_='base-search-card__info')
-        
-        if not job_cards:
-            job_cards = soup.find_all('li', class_=lambda x: x and 'jobs-search-results__list-item' in str(x))
-            
-        if not job_cards:
-            job_cards = soup.find_all('div', class_='job-search-card')
+            # Conditional request; an unchanged page reuses last cycle's cards without parsing
+            url = linkedin_search_url(keyword, location, page)
+            try:
+                if STREAM_PARSE:
+                    status, cards = get_fetch_cache().stream_cards(
+                        url, LINKEDIN_STREAM_SPEC, headers=headers, timeout=REQUEST_TIMEOUT, source='LinkedIn'
+                    )
+                else:
+                    status, cards = get_fetch_cache().fetch_cards(
+                        url, LINKEDIN_STRAINER, extract_linkedin_cards,
+                        headers=headers, region=LINKEDIN_CARD_REGION, timeout=REQUEST_TIMEOUT, source='LinkedIn'
+                    )
+            except requests.exceptions.RequestException:
+                breaker.record('error')
+                raise
+            print(f"📊 LinkedIn page {page + 1} status: {status}")
             
-        print(f"📊 LinkedIn found {len(job_cards)} job cards")
+            breaker.record(classify_status(status))
+            if status not in (200, 304):
+                print(f"❌ LinkedIn returned status: {status}")
+                return []
+            if STREAM_PARSE:
+                # Streamed cards are parsed while the crawl consumes them, so read errors surface there
+                return watch_stream(breaker, cards, requests.exceptions.RequestException)
+            return cards
         
-        for i, card in enumerate(job_cards[:15]):  # Increased limit
+        # Walk result pages until the configured depth or a page of links we already stored
+        seen = get_seen_index()
+        job_cards = iter_crawl('LinkedIn', fetch_page, is_seen=lambda link: seen.contains(link, count=False), keyword=keyword)
+        
+        for i, card in enumerate(job_cards):
             try:
-                # Extract title with multiple selectors
-                title_elem = (card.find('h3', class_='base-search-card__title') or 
-                             card.find('h3', class_='job-card-list__title') or
-                             card.find('a', class_='job-card-list__title'))
-                
-                # Extract company with multiple selectors
-                company_elem = (card.find('a', class_='hidden-nested-link') or
-                               card.find('h4', class_='base-search-card__subtitle') or
-                               card.find('a', class_='job-card-container__link'))
-                
-                # Extract location with multiple selectors
-                location_elem = (card.find('span', class_='job-search-card__location') or
-                                card.find('span', class_='job-card-container__metadata-item'))
-                
-                # Extract posted time - LinkedIn time elements
-                time_elem = (card.find('time') or
-                            card.find('span', class_='job-search-card__listdate') or
-                            card.find('span', class_='job-search-card__listdate--new'))
-                
-                if title_elem and title_elem.text.strip():
-                    title = clean_text(title_elem.text.strip())
-                    company = clean_text(company_elem.text.strip()) if company_elem and company_elem.text.strip() else "Not specified"
-                    location_text = clean_text(location_elem.text.strip()) if location_elem and location_elem.text.strip() else location
+                if card['title']:
+                    title = clean_text(card['title'])
+                    company = clean_text(card['company']) if card['company'] else "Not specified"
+                    location_text = clean_text(card['location']) if card['location'] else location
                     
-                    # Parse posted time
+                    # Parse posted time once into an epoch timestamp for filtering and sorting
                     posted_time = None
-                    if time_elem and time_elem.text.strip():
-                        time_text = clean_text(time_elem.text.strip())
-                        # Parse relative time using your helper function
-                        parsed_time = parse_relative_time(time_text)
-                        if parsed_time:
-                            posted_time = format_posted_time(parsed_time)
+                    posted_at = None
+                    if card['time_text']:
+                        time_text = clean_text(card['time_text'])
+                        age = parse_age_seconds(time_text)
+                        if age is not None:
+                            posted_at = time.time() - age
+                            posted_time = format_posted_time(datetime.now() - timedelta(seconds=age))
                         else:
                             posted_time = time_text
                         print(f"⏰ Posted: {posted_time}")
                     
-                    # Get link - find in parent elements
-                    link = ""
-                    link_elem = card.find_previous('a', class_='base-card__full-link')
-                    if not link_elem:
-                        # Try finding link in parent card
-                        parent_card = card.find_parent('div', class_='base-card')
-                        if parent_card:
-                            link_elem = parent_card.find('a', class_='base-card__full-link')
-                    
-                    if link_elem:
-                        link = link_elem.get('href', '')
-                        # Clean LinkedIn tracking parameters
-                        if '?' in link:
-                            link = link.split('?')[0]
+                    # Clean LinkedIn tracking parameters
+                    link = card['link'].split('?')[0]
                     
                     job = {
                         'title': title,
@@ -110,14 +102,16 @@ def scrape_linkedin_jobs(keyword, location):
                         'location': location_text,
                         'link': link,
                         'source': 'LinkedIn',
-                        'posted_time': posted_time  # Added time field
+                        'posted_time': posted_time,  # Added time field
+                        'posted_at': posted_at
                     }
                     
                     # Filter by keywords
                     if contains_keywords(job['title']):
-                        jobs.append(job)
                         print(f"✅ Added LinkedIn job {i+1}: {title[:40]}... | Time: {posted_time or 'N/A'}")
+                        yield job
                     else:
+                        KEYWORD_REJECTS.inc(source='LinkedIn', keyword=keyword)
                         print(f"⏭️ Skipped - no keywords: {title[:40]}...")
                         
             except Exception as e:
@@ -128,8 +122,21 @@ def scrape_linkedin_jobs(keyword, location):
         print(f"❌ Network error scraping LinkedIn: {e}")
     except Exception as e:
         print(f"❌ Error scraping LinkedIn: {e}")
+
+
+def is_recent(job, cutoff):
+    """True if the job was posted at or after the `cutoff` epoch time"""
+    posted_at = job.get('posted_at')
+    if posted_at is None and job.get('posted_time'):
+        # Timestamp missing (e.g. built elsewhere) - parse the text once, cached
+        age = parse_age_seconds(job['posted_time'])
+        if age is not None:
+            posted_at = job['posted_at'] = time.time() - age
     
-    return jobs
+    if posted_at is not None:
+        return posted_at >= cutoff
+    # No usable time info - be conservative and include it
+    return not job.get('posted_time') or any(word in job['posted_time'].lower() for word in ['recent', 'now', 'today'])
 
 
 def filter_recent_jobs(jobs, hours=24):
@@ -137,55 +144,16 @@ def filter_recent_jobs(jobs, hours=24):
     if not jobs:
         return []
     
-    recent_jobs = []
-    now = time.time()
-    
-    for job in jobs:
-        # If job has posted_time, try to filter by recency
-        if job.get('posted_time'):
-            # Simple filtering based on time text
-            time_text = job['posted_time'].lower()
-            
-            # Consider jobs as recent if they contain time indicators
-            is_recent = any(indicator in time_text for indicator in 
-                           ['minute', 'hour', 'today', 'just now', 'now', 'recent'])
-            
-            # For hours-based filtering
-            if 'hour' in time_text:
-                try:
-                    # Extract hours number from text like "2 hours ago"
-                    import re
-                    hours_match = re.search(r'(\d+)\s*hour', time_text)
-                    if hours_match:
-                        job_hours = int(hours_match.group(1))
-                        if job_hours <= hours:
-                            recent_jobs.append(job)
-                            continue
-                except:
-                    pass
-            
-            # If we can't parse exact hours but it seems recent, include it
-            if is_recent:
-                recent_jobs.append(job)
-        else:
-            # If no time info, include the job (be conservative)
-            recent_jobs.append(job)
-    
+    cutoff = time.time() - hours * 60 * 60
+    recent_jobs = [job for job in jobs if is_recent(job, cutoff)]
     print(f"📅 Filtered {len(recent_jobs)} recent jobs out of {len(jobs)} total")
     return recent_jobs
 
 
 # Optional: Enhanced version with recency filtering
 def scrape_linkedin_recent_jobs(keyword, location, max_hours_old=24):
-    """Scrape LinkedIn jobs and filter for recent postings only"""
-    all_jobs = scrape_linkedin_jobs(keyword, location)
-    recent_jobs = filter_recent_jobs(all_jobs, max_hours_old)
-    
-    # Sort by recency (jobs with time info first, then others)
-    recent_jobs.sort(key=lambda x: (
-        0 if x.get('posted_time') and any(word in x['posted_time'].lower() 
-        for word in ['minute', 'hour', 'today']) else 1,
-        x.get('posted_time', '')
-    ))
-    
-    return recent_jobs
\ No newline at end of file
+    """Scrape LinkedIn jobs, yielding recent postings only, in result page order"""
+    cutoff = time.time() - max_hours_old * 60 * 60
+    for job in scrape_linkedin_jobs(keyword, location):
+        if is_recent(job, cutoff):
+            yield job
\ No newline at end of file
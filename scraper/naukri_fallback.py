@@ -1,71 +1,78 @@
 import requests
-from bs4 import BeautifulSoup
-from config import get_random_headers, REQUEST_TIMEOUT
+from config import get_random_headers, REQUEST_TIMEOUT, NAUKRI_BASE_URL, STREAM_PARSE
+from scraper.parsers import extract_naukri_cards, NAUKRI_STRAINER, NAUKRI_CARD_REGION, NAUKRI_STREAM_SPEC
+from scraper.fetch_cache import get_fetch_cache
+from scraper.crawler import iter_crawl, KEYWORD_REJECTS
+from scraper.health import get_breaker, classify_status, watch_stream
+from db.seen_index import get_seen_index
 from utils.helpers import clean_text, contains_keywords
 import time
 
+def _absolute_link(link):
+    if link and not link.startswith('http'):
+        return NAUKRI_BASE_URL + link
+    return link
+
+def naukri_search_url(keyword, location, page=0):
+    """Search URL for a 0-based result page (Naukri numbers pages from 2 with a path suffix)"""
+    url = f"{NAUKRI_BASE_URL}/{keyword}-jobs-in-{location}"
+    return url if page == 0 else f"{url}-{page + 1}"
+
 def scrape_naukri_fallback(keyword, location):
-    """Fallback Naukri scraper using requests only"""
-    jobs = []
-    
+    """Fallback Naukri scraper using requests only, yielding each match as soon as it is parsed"""
     try:
         print(f"🔍 Scraping Naukri (Fallback) for: {keyword} in {location}")
         
-        url = f"https://www.naukri.com/{keyword}-jobs-in-{location}"
-        
         headers = {
             **get_random_headers(),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
         }
         
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        
-        if response.status_code != 200:
-            print(f"❌ Naukri returned status: {response.status_code}")
-            return jobs
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
+        breaker = get_breaker('Naukri')
         
-        # Try multiple selectors for Naukri job cards
-        selectors = [
-            'article.jobTuple',
-            '.srp-jobtuple-wrapper',
-            'div[class*="jobTuple"]',
-            '.list',
-            'div[data-job-id]'
-        ]
-        
-        job_cards = []
-        for selector in selectors:
-            found = soup.select(selector)
-            if found:
-                job_cards = found
-                break
+        def fetch_page(page):
+            if page and breaker.state != 'closed':
+                return []
+            
+            url = naukri_search_url(keyword, location, page)
+            try:
+                if STREAM_PARSE:
+                    status, cards = get_fetch_cache().stream_cards(
+                        url, NAUKRI_STREAM_SPEC, headers=headers, timeout=REQUEST_TIMEOUT, source='Naukri'
+                    )
+                else:
+                    status, cards = get_fetch_cache().fetch_cards(
+                        url, NAUKRI_STRAINER, extract_naukri_cards,
+                        headers=headers, region=NAUKRI_CARD_REGION, timeout=REQUEST_TIMEOUT, source='Naukri'
+                    )
+            except requests.exceptions.RequestException:
+                breaker.record('error')
+                raise
+            
+            breaker.record(classify_status(status))
+            if status not in (200, 304):
+                print(f"❌ Naukri returned status: {status}")
+                return []
+            if STREAM_PARSE:
+                # Streamed cards are parsed while the crawl consumes them, so read errors surface there
+                return watch_stream(breaker, cards, requests.exceptions.RequestException)
+            return cards
         
-        print(f"📊 Naukri fallback found {len(job_cards)} job cards")
+        seen = get_seen_index()
+        job_cards = iter_crawl('Naukri', fetch_page, is_seen=lambda link: seen.contains(_absolute_link(link), count=False),
+                               keyword=keyword)
         
-        for card in job_cards[:10]:
+        for card in job_cards:
             try:
-                # Extract title
-                title_elem = card.select_one('a.title, .title a, a[class*="title"]')
-                if not title_elem or not title_elem.text.strip():
+                if not card['title']:
                     continue
                 
-                title = clean_text(title_elem.text.strip())
-                
-                # Extract company
-                company_elem = card.select_one('a.comp-name, .comp-name, [class*="company"]')
-                company = clean_text(company_elem.text.strip()) if company_elem else "Not specified"
-                
-                # Extract location
-                location_elem = card.select_one('.loc, .location, [class*="loc"]')
-                location_text = clean_text(location_elem.text.strip()) if location_elem else location
+                title = clean_text(card['title'])
+                company = clean_text(card['company']) if card['company'] else "Not specified"
+                location_text = clean_text(card['location']) if card['location'] else location
                 
-                # Get link
-                link = title_elem.get('href', '')
-                if link and not link.startswith('http'):
-                    link = "https://www.naukri.com" + link
+                link = _absolute_link(card['link'])
                 
                 job = {
                     'title': title,
@@ -77,8 +84,10 @@ def scrape_naukri_fallback(keyword, location):
                 }
                 
                 if contains_keywords(job['title']):
-                    jobs.append(job)
                     print(f"✅ Added Naukri job: {title[:40]}...")
+                    yield job
+                else:
+                    KEYWORD_REJECTS.inc(source='Naukri', keyword=keyword)
                     
             except Exception as e:
                 print(f"⚠️ Error parsing Naukri job: {e}")
@@ -86,5 +95,3 @@ def scrape_naukri_fallback(keyword, location):
                 
     except Exception as e:
         print(f"❌ Error in Naukri fallback: {e}")
-    
-    return jobs
\ No newline at end of file
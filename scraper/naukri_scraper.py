@@ -1,76 +1,154 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+from collections import deque, Counter
+import statistics
 import time
-import random
 import os
 import sys
 
 # Add parent directory to path to import config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import get_random_headers
+from config import NAUKRI_BASE_URL, NAUKRI_READY_TIMEOUT, NAUKRI_NETWORK_IDLE_SECONDS
 from utils.helpers import clean_text, contains_keywords
+from scraper.driver_pool import get_driver_pool
+from scraper.crawler import iter_crawl, KEYWORD_REJECTS
+from scraper.health import get_breaker, looks_blocked_url
+from utils.metrics import histogram
+from db.seen_index import get_seen_index
 
-def scrape_naukri_jobs(keyword, location):
-    """Scrape Naukri using Selenium in headless mode"""
-    jobs = []
-    driver = None
+# Selectors for Naukri job cards, in order of preference
+JOB_CARD_SELECTORS = [
+    "article.jobTuple",
+    ".srp-jobtuple-wrapper", 
+    "div[class*='jobTuple']"
+]
+
+BLOCK_CHECK_SCRIPT = """
+const text = document.title + ' ' + (document.body ? document.body.innerText.slice(0, 5000) : '');
+return text.toLowerCase().includes('blocked');
+"""
+
+NETWORK_STATE_SCRIPT = "return [document.readyState, performance.getEntriesByType('resource').length];"
+
+# Recent page load timings: {'keyword', 'outcome', 'seconds'}
+_page_timings = deque(maxlen=500)
+PAGE_READY_SECONDS = histogram('naukri_page_ready_seconds', 'Time for a Naukri results page to settle, by outcome')
+
+class _PageReadiness:
+    """WebDriverWait condition that resolves once the results page settles.
+
+    Outcomes: 'ready' (job cards rendered), 'blocked' (captcha or block page),
+    'empty' (document complete and network idle without any job cards).
+    """
+
+    def __init__(self, idle_seconds):
+        self.idle_seconds = idle_seconds
+        self.outcome = None
+        self.selector = None
+        self._resource_count = -1
+        self._stable_since = None
+
+    def __call__(self, driver):
+        if looks_blocked_url(driver.current_url):
+            self.outcome = 'blocked'
+            return True
+
+        for selector in JOB_CARD_SELECTORS:
+            if driver.find_elements(By.CSS_SELECTOR, selector):
+                self.outcome = 'ready'
+                self.selector = selector
+                return True
+
+        if driver.execute_script(BLOCK_CHECK_SCRIPT):
+            self.outcome = 'blocked'
+            return True
+
+        # Network idle: document complete and no new resource loads for idle_seconds
+        ready_state, resource_count = driver.execute_script(NETWORK_STATE_SCRIPT)
+        now = time.monotonic()
+        if ready_state != 'complete' or resource_count != self._resource_count:
+            self._resource_count = resource_count
+            self._stable_since = now
+            return False
+
+        if now - self._stable_since >= self.idle_seconds:
+            self.outcome = 'empty'
+            return True
+        return False
+
+def wait_for_results(driver, timeout=NAUKRI_READY_TIMEOUT, idle_seconds=NAUKRI_NETWORK_IDLE_SECONDS):
+    """Wait for job cards, a block page or network idle; returns (outcome, selector, seconds)"""
+    started = time.monotonic()
+    readiness = _PageReadiness(idle_seconds)
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.25).until(readiness)
+    except TimeoutException:
+        readiness.outcome = 'timeout'
+
+    return readiness.outcome, readiness.selector, time.monotonic() - started
+
+def get_page_timing_stats():
+    """Summary of recent Naukri page readiness timings"""
+    timings = list(_page_timings)
+    if not timings:
+        return {'pages': 0, 'median': 0.0, 'p90': 0.0, 'max': 0.0, 'outcomes': {}}
+
+    seconds = sorted(timing['seconds'] for timing in timings)
+    return {
+        'pages': len(seconds),
+        'median': statistics.median(seconds),
+        'p90': seconds[int(0.9 * (len(seconds) - 1))],
+        'max': seconds[-1],
+        'outcomes': dict(Counter(timing['outcome'] for timing in timings)),
+    }
+
+def _fetch_naukri_page(keyword, location, page):
+    """Load one results page in a pooled Chrome session and read its cards"""
+    breaker = get_breaker('Naukri')
+    if page and breaker.state != 'closed':
+        return []
     
     try:
-        print(f"🔍 Scraping Naukri for: {keyword} in {location}")
-        
-        # Setup Chrome options for headless mode
-        chrome_options = Options()
-        chrome_options.add_argument(f"user-agent={get_random_headers()['User-Agent']}")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        # HEADLESS MODE - No browser window will open
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
-        # Create driver
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        
-        url = f"https://www.naukri.com/{keyword}-jobs-in-{location}?k={keyword}&l={location}"
+        return _read_naukri_page(keyword, location, page, breaker)
+    except Exception:
+        breaker.record('error')
+        raise
+
+def _read_naukri_page(keyword, location, page, breaker):
+    with get_driver_pool().lease() as driver:
+        url = f"{NAUKRI_BASE_URL}/{keyword}-jobs-in-{location}"
+        if page:
+            url += f"-{page + 1}"
+        url += f"?k={keyword}&l={location}"
         print(f"🌐 Opening URL: {url}")
         
         driver.get(url)
         
-        # Wait for page to load
-        print("⏳ Waiting for page to load...")
-        time.sleep(8)
+        # Wait until cards render, the page is blocked or the network goes idle
+        outcome, selector, elapsed = wait_for_results(driver)
+        _page_timings.append({'keyword': keyword, 'outcome': outcome, 'seconds': elapsed})
+        PAGE_READY_SECONDS.observe(elapsed, outcome=outcome)
+        print(f"⏳ Page {page + 1} {outcome} after {elapsed:.1f}s")
+        
+        # A timeout counts against Naukri; an empty result page is still a healthy answer
+        breaker.record({'ready': 'ok', 'empty': 'ok', 'blocked': 'blocked'}.get(outcome, 'error'))
         
-        # Check if we got redirected or blocked
-        if "captcha" in driver.current_url or "blocked" in driver.page_source.lower():
+        if outcome == 'blocked':
             print("❌ Page blocked or CAPTCHA detected!")
-            return jobs
+            return []
         
-        # Try multiple selectors for job cards
-        selectors = [
-            "article.jobTuple",
-            ".srp-jobtuple-wrapper", 
-            "div[class*='jobTuple']"
-        ]
+        if outcome != 'ready':
+            print(f"⚠️ No Naukri job cards rendered ({outcome})")
+            return []
         
-        job_cards = []
-        for selector in selectors:
-            try:
-                found = driver.find_elements(By.CSS_SELECTOR, selector)
-                if found:
-                    job_cards = found
-                    print(f"✅ Found {len(job_cards)} job cards")
-                    break
-            except:
-                continue
+        job_cards = driver.find_elements(By.CSS_SELECTOR, selector)
+        print(f"✅ Found {len(job_cards)} job cards")
         
-        for i, card in enumerate(job_cards[:15]):
+        cards = []
+        for i, card in enumerate(job_cards):
             try:
                 # Extract job data
                 title_elem = card.find_elements(By.CSS_SELECTOR, "a.title, .title a")
@@ -78,38 +156,56 @@ def scrape_naukri_jobs(keyword, location):
                 location_elem = card.find_elements(By.CSS_SELECTOR, "li.location, .loc")
                 
                 if title_elem and title_elem[0].text.strip():
-                    title = clean_text(title_elem[0].text.strip())
-                    company = clean_text(company_elem[0].text.strip()) if company_elem else "Not specified"
-                    location_text = clean_text(location_elem[0].text.strip()) if location_elem else location
-                    
-                    # Get link
-                    link = title_elem[0].get_attribute('href')
-                    
-                    job = {
-                        'title': title,
-                        'company': company,
-                        'location': location_text,
-                        'link': link,
-                        'source': 'Naukri',
-                        'posted_time': 'Recently'
-                    }
-                    
-                    if contains_keywords(job['title']):
-                        jobs.append(job)
-                        print(f"✅ Added Naukri job: {title[:40]}...")
-                        
+                    cards.append({
+                        'title': title_elem[0].text.strip(),
+                        'company': company_elem[0].text.strip() if company_elem else "",
+                        'location': location_elem[0].text.strip() if location_elem else "",
+                        'link': title_elem[0].get_attribute('href'),
+                    })
             except Exception as e:
                 print(f"⚠️ Error parsing job card {i+1}: {e}")
                 continue
+        
+        return cards
+
+def scrape_naukri_jobs(keyword, location):
+    """Scrape Naukri using pooled headless Chrome sessions, one lease per results page.
+
+    Matching jobs are yielded as soon as their page has been read.
+    """
+    try:
+        print(f"🔍 Scraping Naukri for: {keyword} in {location}")
+        
+        seen = get_seen_index()
+        cards = iter_crawl(
+            'Naukri',
+            lambda page: _fetch_naukri_page(keyword, location, page),
+            is_seen=lambda link: seen.contains(link, count=False),
+            keyword=keyword
+        )
+        
+        for card in cards:
+            title = clean_text(card['title'])
+            company = clean_text(card['company']) if card['company'] else "Not specified"
+            location_text = clean_text(card['location']) if card['location'] else location
+            
+            job = {
+                'title': title,
+                'company': company,
+                'location': location_text,
+                'link': card['link'],
+                'source': 'Naukri',
+                'posted_time': 'Recently'
+            }
+            
+            if contains_keywords(job['title']):
+                print(f"✅ Added Naukri job: {title[:40]}...")
+                yield job
+            else:
+                KEYWORD_REJECTS.inc(source='Naukri', keyword=keyword)
                 
     except Exception as e:
         print(f"❌ Error scraping Naukri: {e}")
-        
-    finally:
-        if driver:
-            driver.quit()
-    
-    return jobs
 
 def scrape_naukri_recent_jobs(keyword, location, max_hours_old=24):
     """Wrapper for recent jobs filtering"""
@@ -0,0 +1,166 @@
+from bs4 import BeautifulSoup, SoupStrainer
+
+from config import HTML_PARSER
+from scraper.stream_parser import has_class, class_contains, any_class
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+LINKEDIN_CARD_CLASSES = {'base-card', 'job-search-card', 'jobs-search-results__list-item', 'base-search-card__info'}
+
+def get_parser_backend(backend=None):
+    """Resolve a parser backend name ('auto' prefers lxml when it is installed)"""
+    backend = backend or HTML_PARSER
+    if backend == 'auto':
+        return 'lxml' if LXML_AVAILABLE else 'html.parser'
+    if backend == 'lxml' and not LXML_AVAILABLE:
+        print("⚠️ lxml not installed, falling back to html.parser")
+        return 'html.parser'
+    return backend
+
+def _class_tokens(value):
+    # Depending on the bs4 version the class filter sees a raw string, one token or a list
+    if not value:
+        return []
+    return value.split() if isinstance(value, str) else list(value)
+
+def _is_linkedin_card_class(value):
+    return any(cls in LINKEDIN_CARD_CLASSES for cls in _class_tokens(value))
+
+def _is_naukri_card_class(value):
+    return any(cls == 'list' or 'jobtuple' in cls.lower() for cls in _class_tokens(value))
+
+# Only job cards (and their subtrees) are built into the tree; the rest of the page is skipped
+LINKEDIN_STRAINER = SoupStrainer(attrs={'class': _is_linkedin_card_class})
+NAUKRI_STRAINER = SoupStrainer(attrs={'class': _is_naukri_card_class})
+
+# (start, end) byte markers around the card list, used to tell whether the cards changed
+LINKEDIN_CARD_REGION = (b'jobs-search__results-list', b'</ul>')
+NAUKRI_CARD_REGION = (b'srp-jobtuple-wrapper', None)
+
+# Card layouts for the streaming parser (scraper.stream_parser), mirroring the extractors below
+LINKEDIN_STREAM_SPEC = {
+    'card': [('div', has_class('base-card')), ('li', class_contains('jobs-search-results__list-item')),
+             ('div', has_class('job-search-card'))],
+    'fields': {
+        'title': [('h3', has_class('base-search-card__title')), ('h3', has_class('job-card-list__title')),
+                  ('a', has_class('job-card-list__title'))],
+        'company': [('a', has_class('hidden-nested-link')), ('h4', has_class('base-search-card__subtitle')),
+                    ('a', has_class('job-card-container__link'))],
+        'location': [('span', has_class('job-search-card__location')),
+                     ('span', has_class('job-card-container__metadata-item'))],
+        'time_text': [('time', any_class), ('span', has_class('job-search-card__listdate')),
+                      ('span', has_class('job-search-card__listdate--new'))],
+    },
+    'attrs': {
+        'link': ('href', [('a', has_class('base-card__full-link'))]),
+    },
+}
+
+NAUKRI_STREAM_SPEC = {
+    'card': [('article', has_class('jobTuple')), (None, has_class('srp-jobtuple-wrapper')),
+             ('div', class_contains('jobTuple'))],
+    'fields': {
+        'title': [('a', has_class('title')), ('a', class_contains('title'))],
+        'company': [('a', has_class('comp-name')), (None, has_class('comp-name')), (None, class_contains('company'))],
+        'location': [(None, has_class('loc')), (None, has_class('location')), (None, class_contains('loc'))],
+    },
+    'attrs': {
+        'link': ('href', [('a', has_class('title')), ('a', class_contains('title'))]),
+    },
+}
+
+def make_soup(markup, parse_only=None, backend=None):
+    """Parse markup with the configured backend, optionally restricted by a SoupStrainer"""
+    return BeautifulSoup(markup, get_parser_backend(backend), parse_only=parse_only)
+
+def parse_cards(markup, strainer, extract, backend=None):
+    """Extract cards from the strained card region, re-parsing the full page if that finds none"""
+    cards = extract(make_soup(markup, parse_only=strainer, backend=backend))
+    if not cards:
+        cards = extract(make_soup(markup, backend=backend))
+    return cards
+
+def _text(elem):
+    return elem.get_text().strip() if elem else ""
+
+def extract_linkedin_cards(soup):
+    """Pull raw fields out of LinkedIn result cards in one pass over the card containers"""
+    # Multiple selector strategies for LinkedIn's changing structure
+    job_cards = soup.find_all('div', class_='base-card')
+
+    if not job_cards:
+        job_cards = soup.find_all('li', class_=lambda x: x and 'jobs-search-results__list-item' in str(x))
+
+    if not job_cards:
+        job_cards = soup.find_all('div', class_='job-search-card')
+
+    if not job_cards:
+        job_cards = soup.find_all('div', class_='base-search-card__info')
+
+    cards = []
+    for card in job_cards:
+        title_elem = (card.find('h3', class_='base-search-card__title') or
+                      card.find('h3', class_='job-card-list__title') or
+                      card.find('a', class_='job-card-list__title'))
+
+        company_elem = (card.find('a', class_='hidden-nested-link') or
+                        card.find('h4', class_='base-search-card__subtitle') or
+                        card.find('a', class_='job-card-container__link'))
+
+        location_elem = (card.find('span', class_='job-search-card__location') or
+                         card.find('span', class_='job-card-container__metadata-item'))
+
+        time_elem = (card.find('time') or
+                     card.find('span', class_='job-search-card__listdate') or
+                     card.find('span', class_='job-search-card__listdate--new'))
+
+        # The link lives on the card itself; only bare info blocks need to look outside
+        link_elem = card.find('a', class_='base-card__full-link')
+        if not link_elem:
+            link_elem = card.find_previous('a', class_='base-card__full-link')
+
+        cards.append({
+            'title': _text(title_elem),
+            'company': _text(company_elem),
+            'location': _text(location_elem),
+            'time_text': _text(time_elem),
+            'link': link_elem.get('href', '') if link_elem else '',
+        })
+
+    return cards
+
+NAUKRI_CARD_SELECTORS = [
+    'article.jobTuple',
+    '.srp-jobtuple-wrapper',
+    'div[class*="jobTuple"]',
+    '.list',
+    'div[data-job-id]'
+]
+
+def extract_naukri_cards(soup):
+    """Pull raw fields out of Naukri result cards"""
+    job_cards = []
+    for selector in NAUKRI_CARD_SELECTORS:
+        found = soup.select(selector)
+        if found:
+            job_cards = found
+            break
+
+    cards = []
+    for card in job_cards:
+        title_elem = card.select_one('a.title, .title a, a[class*="title"]')
+        company_elem = card.select_one('a.comp-name, .comp-name, [class*="company"]')
+        location_elem = card.select_one('.loc, .location, [class*="loc"]')
+
+        cards.append({
+            'title': _text(title_elem),
+            'company': _text(company_elem),
+            'location': _text(location_elem),
+            'link': title_elem.get('href', '') if title_elem else '',
+        })
+
+    return cards
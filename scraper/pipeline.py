@@ -0,0 +1,164 @@
+import asyncio
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from config import MAX_SCRAPE_WORKERS, PIPELINE_QUEUE_SIZE, PIPELINE_BATCH_SIZE, ALERT_FLUSH_SECONDS
+from scraper.engine import run_scrape_task
+from utils.metrics import histogram
+
+CYCLE_SECONDS = histogram('cycle_seconds', 'Wall time of a scrape cycle')
+FIRST_ALERT_SECONDS = histogram('cycle_first_alert_seconds', 'Time from cycle start to the first queued alert')
+
+_DONE = object()  # end-of-stream marker passed down the queues
+
+def has_link(job):
+    """Default filter: only jobs with a link can be stored and alerted"""
+    return bool(job.get('link'))
+
+def expand_queries(keywords, locations, sources):
+    """Every (keyword, location, source) combination, in keyword order"""
+    return [(keyword, location, source) for keyword in keywords for location in locations for source in sources]
+
+async def _fetch_stage(tasks, out_queue, results, workers):
+    """Run the scrapers in threads, pushing each job downstream as soon as it is parsed"""
+    loop = asyncio.get_running_loop()
+
+    def make_emit(query):
+        def emit(job):
+            # Remembered on the job so later stages know which search found it
+            job.setdefault('query', query)
+            # Blocks the scraper thread while the queue is full - that is the backpressure
+            asyncio.run_coroutine_threadsafe(out_queue.put(job), loop).result()
+        return emit
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scrape") as executor:
+        futures = [
+            loop.run_in_executor(executor, run_scrape_task, source, scraper, keyword, location,
+                                 make_emit((keyword, location, source)))
+            for source, scraper, keyword, location in tasks
+        ]
+        results.extend(await asyncio.gather(*futures))
+
+    await out_queue.put(_DONE)
+
+async def _filter_stage(in_queue, out_queue, keep, stats):
+    """Drop jobs that can't be stored before they reach the database"""
+    while True:
+        job = await in_queue.get()
+        if job is _DONE:
+            break
+        stats['scanned'] += 1
+        if keep(job):
+            await out_queue.put(job)
+
+    await out_queue.put(_DONE)
+
+async def _persist_stage(in_queue, out_queue, persist, batch_size, stats):
+    """Dedup and store jobs in small batches, forwarding only the new ones"""
+    loop = asyncio.get_running_loop()
+    finished = False
+    while not finished:
+        # Wait for one job, then take whatever else is already waiting as the same transaction
+        batch = [await in_queue.get()]
+        while len(batch) < batch_size and not in_queue.empty():
+            batch.append(in_queue.get_nowait())
+
+        finished = _DONE in batch
+        batch = [job for job in batch if job is not _DONE]
+        if not batch:
+            continue
+
+        try:
+            new_jobs = await loop.run_in_executor(None, persist, batch)
+        except Exception as e:
+            print(f"❌ Error persisting jobs: {e}")
+            new_jobs = []
+
+        stats['batches'] += 1
+        for job in new_jobs:
+            await out_queue.put(job)
+
+    await out_queue.put(_DONE)
+
+async def _notify_stage(in_queue, notify, flush_seconds, stats, started):
+    """Alert new jobs as they are confirmed, letting ones that arrive together share a message"""
+    loop = asyncio.get_running_loop()
+    finished = False
+    while not finished:
+        job = await in_queue.get()
+        if job is _DONE:
+            break
+
+        batch = [job]
+        deadline = loop.time() + flush_seconds
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                job = await asyncio.wait_for(in_queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if job is _DONE:
+                finished = True
+                break
+            batch.append(job)
+
+        if stats['first_alert_seconds'] is None:
+            stats['first_alert_seconds'] = time.monotonic() - started
+        stats['new_jobs'].extend(batch)
+
+        try:
+            stats['queued'] += await loop.run_in_executor(None, notify, batch) or 0
+        except Exception as e:
+            print(f"❌ Error sending alerts: {e}")
+
+async def run_pipeline(queries, sources, persist, notify, keep=has_link,
+                       queue_size=PIPELINE_QUEUE_SIZE, batch_size=PIPELINE_BATCH_SIZE,
+                       flush_seconds=ALERT_FLUSH_SECONDS):
+    """Scrape, filter, persist and alert as concurrent stages joined by bounded queues.
+
+    `queries` are (keyword, location, source) triples, each scraped once; `sources`
+    maps a source name to a scraper taking (keyword, location), which may return a
+    list or yield jobs. `persist(jobs)` returns the jobs that were new and
+    `notify(jobs)` returns how many messages it queued.
+    """
+    started = time.monotonic()
+    stats = {
+        'results': [],
+        'scanned': 0,
+        'batches': 0,
+        'new_jobs': [],
+        'new_by_query': Counter(),
+        'queued': 0,
+        'first_alert_seconds': None,
+        'elapsed': 0.0,
+    }
+
+    tasks = [
+        (source, sources[source], keyword, location)
+        for keyword, location, source in dict.fromkeys(queries) if source in sources
+    ]
+    if tasks:
+        scraped = asyncio.Queue(maxsize=queue_size)
+        kept = asyncio.Queue(maxsize=queue_size)
+        confirmed = asyncio.Queue(maxsize=queue_size)
+
+        await asyncio.gather(
+            _fetch_stage(tasks, scraped, stats['results'], min(MAX_SCRAPE_WORKERS, len(tasks))),
+            _filter_stage(scraped, kept, keep, stats),
+            _persist_stage(kept, confirmed, persist, batch_size, stats),
+            _notify_stage(confirmed, notify, flush_seconds, stats, started),
+        )
+
+    stats['new_by_query'].update(job['query'] for job in stats['new_jobs'] if 'query' in job)
+    stats['elapsed'] = time.monotonic() - started
+    CYCLE_SECONDS.observe(stats['elapsed'])
+    if stats['first_alert_seconds'] is not None:
+        FIRST_ALERT_SECONDS.observe(stats['first_alert_seconds'])
+    return stats
+
+def stream_scrape(queries, sources, persist, notify, **kwargs):
+    """Run one streaming scrape cycle to completion from synchronous code"""
+    return asyncio.run(run_pipeline(queries, sources, persist, notify, **kwargs))
@@ -0,0 +1,124 @@
+import threading
+import time
+from collections import OrderedDict
+
+from config import (
+    PLANNER_COVERAGE, PLANNER_MIN_RUNS, PLANNER_MIN_LINKS, PLANNER_HISTORY_LINKS, PLANNER_RECHECK_SECONDS,
+)
+from utils.dedup import canonical_link
+from utils.metrics import counter
+
+QUERIES_SAVED = counter('planner_queries_saved', 'Searches skipped because another search already covers them, per source')
+
+def normalize_query(query):
+    """Lowercase a (keyword, location, source) query's text and collapse its whitespace"""
+    keyword, location, source = query
+    return (' '.join(keyword.lower().split()), ' '.join(location.lower().split()), source)
+
+class QueryPlanner:
+    """Learns which searches are redundant and leaves them out of the plan.
+
+    Every run's links are remembered per query. A query is subsumed by another
+    with the same location and source when, after min_runs runs and min_links
+    links, at least `coverage` of its links were also returned by the other.
+    Subsumed queries are dropped (the covering search still finds their jobs,
+    and subscribers are matched on job titles, not on the search that found
+    them) and re-run every recheck seconds to confirm they are still redundant.
+    """
+
+    def __init__(self, coverage=PLANNER_COVERAGE, min_runs=PLANNER_MIN_RUNS, min_links=PLANNER_MIN_LINKS,
+                 history_links=PLANNER_HISTORY_LINKS, recheck=PLANNER_RECHECK_SECONDS, clock=time.time):
+        self.coverage = coverage
+        self.min_runs = min_runs
+        self.min_links = min_links
+        self.history_links = history_links
+        self.recheck = recheck
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._history = {}  # query -> {'runs', 'links': OrderedDict of canonical links}
+        self._dropped = {}  # query -> {'covered_by', 'since'}
+        self._last_plan = {'requested': 0, 'duplicates': 0, 'subsumed': 0, 'planned': 0}
+        self.saved = 0
+
+    def _covers(self, query, other):
+        """True if `other`'s recent links include enough of `query`'s"""
+        mine = self._history.get(query)
+        theirs = self._history.get(other)
+        if not mine or not theirs or mine['runs'] < self.min_runs or len(mine['links']) < self.min_links:
+            return False
+        shared = sum(1 for link in mine['links'] if link in theirs['links'])
+        return shared >= self.coverage * len(mine['links'])
+
+    def plan(self, queries):
+        """The queries worth running: normalized, deduplicated and without subsumed ones.
+
+        Keeps the input order. Within each (location, source) group the broadest
+        queries are considered first, and a query can only be covered by one that
+        is itself kept, so dropping never chains.
+        """
+        queries = list(queries)
+        distinct = list(dict.fromkeys(normalize_query(query) for query in queries))
+        now = self._clock()
+
+        with self._lock:
+            by_breadth = sorted(distinct, key=lambda q: -len(self._history.get(q, {}).get('links', ())))
+            kept = []
+            dropped = {}
+            for query in by_breadth:
+                previous = self._dropped.get(query)
+                recheck_due = previous is not None and now - previous['since'] >= self.recheck
+                covered_by = None if recheck_due else next(
+                    (other for other in kept if other[1:] == query[1:] and self._covers(query, other)), None)
+                if covered_by is None:
+                    kept.append(query)
+                else:
+                    dropped[query] = {
+                        'covered_by': covered_by,
+                        'since': previous['since'] if previous else now,
+                    }
+
+            self._dropped = dropped
+            self._last_plan = {
+                'requested': len(queries),
+                'duplicates': len(queries) - len(distinct),
+                'subsumed': len(dropped),
+                'planned': len(kept),
+            }
+
+        return [query for query in distinct if query not in dropped]
+
+    def observe(self, results):
+        """Learn from a cycle's scrape results; returns how many searches the plan saved in it.
+
+        A dropped query counts as saved each time the query covering it runs.
+        """
+        saved = 0
+        with self._lock:
+            for result in results:
+                if result.get('error'):
+                    continue
+                query = normalize_query((result['keyword'], result['location'], result['source']))
+                entry = self._history.setdefault(query, {'runs': 0, 'links': OrderedDict()})
+                entry['runs'] += 1
+                for job in result['jobs']:
+                    if job.get('link'):
+                        link = canonical_link(job['link'])
+                        entry['links'][link] = None
+                        entry['links'].move_to_end(link)
+                while len(entry['links']) > self.history_links:
+                    entry['links'].popitem(last=False)
+
+                covered = sum(1 for info in self._dropped.values() if info['covered_by'] == query)
+                if covered:
+                    saved += covered
+                    QUERIES_SAVED.inc(covered, source=query[2])
+            self.saved += saved
+        return saved
+
+    def stats(self):
+        """Size of the last plan and what covers each dropped query"""
+        with self._lock:
+            stats = dict(self._last_plan)
+            stats['saved'] = self.saved
+            stats['covered'] = {query: info['covered_by'] for query, info in self._dropped.items()}
+        return stats
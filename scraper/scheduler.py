@@ -0,0 +1,103 @@
+import random
+import statistics
+import threading
+import time
+
+from config import (
+    SCRAPING_INTERVAL, ADAPTIVE_MIN_INTERVAL, ADAPTIVE_MAX_INTERVAL,
+    ADAPTIVE_JITTER, ADAPTIVE_TIGHTEN, ADAPTIVE_RELAX, SCHEDULE_BATCH_WINDOW,
+)
+
+class AdaptiveScheduler:
+    """Per-query polling intervals that follow where new jobs appear.
+
+    A query that yielded new jobs is polled more often (interval * tighten), one
+    that yielded nothing or failed is polled less often (interval * relax), always
+    within [min_interval, max_interval] seconds. Each next run is jittered so
+    queries drift apart instead of hitting a source together.
+    """
+
+    def __init__(self, keys, base_interval, min_interval, max_interval, jitter=ADAPTIVE_JITTER,
+                 tighten=ADAPTIVE_TIGHTEN, relax=ADAPTIVE_RELAX, clock=time.time, rng=None):
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.tighten = tighten
+        self.relax = relax
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+
+        now = clock()
+        # key -> {'interval', 'next_run', 'runs', 'new_jobs'}; everything is due on the first tick
+        self._entries = {
+            key: {'interval': base_interval, 'next_run': now, 'runs': 0, 'new_jobs': 0}
+            for key in keys
+        }
+
+    def sync(self, keys):
+        """Track exactly `keys`: new ones are due immediately, dropped ones are forgotten"""
+        now = self._clock()
+        keys = list(keys)
+        with self._lock:
+            for key in set(self._entries) - set(keys):
+                del self._entries[key]
+            for key in keys:
+                self._entries.setdefault(key, {'interval': self.base_interval, 'next_run': now, 'runs': 0, 'new_jobs': 0})
+
+    def expedite(self):
+        """Make every key due now (intervals are kept)"""
+        now = self._clock()
+        with self._lock:
+            for entry in self._entries.values():
+                entry['next_run'] = min(entry['next_run'], now)
+
+    def due(self, window=SCHEDULE_BATCH_WINDOW):
+        """Keys due now, plus keys due within `window` seconds so nearby runs share one cycle"""
+        now = self._clock()
+        with self._lock:
+            if not any(entry['next_run'] <= now for entry in self._entries.values()):
+                return []
+            return [key for key, entry in self._entries.items() if entry['next_run'] <= now + window]
+
+    def record(self, key, new_jobs, failed=False):
+        """Adjust a key's interval after a run and schedule its next one"""
+        with self._lock:
+            entry = self._entries[key]
+            factor = self.tighten if new_jobs and not failed else self.relax
+            entry['interval'] = min(self.max_interval, max(self.min_interval, entry['interval'] * factor))
+            entry['next_run'] = self._clock() + entry['interval'] * (1 + self._rng.uniform(-self.jitter, self.jitter))
+            entry['runs'] += 1
+            entry['new_jobs'] += new_jobs
+
+    def seconds_until_next(self):
+        """Seconds until the earliest scheduled run (0 if something is already due)"""
+        now = self._clock()
+        with self._lock:
+            if not self._entries:
+                return None
+            return max(0.0, min(entry['next_run'] for entry in self._entries.values()) - now)
+
+    def stats(self):
+        """Interval spread and per-key state"""
+        with self._lock:
+            entries = {key: dict(entry) for key, entry in self._entries.items()}
+
+        intervals = sorted(entry['interval'] for entry in entries.values())
+        return {
+            'keys': len(entries),
+            'min_interval': intervals[0] if intervals else 0.0,
+            'median_interval': statistics.median(intervals) if intervals else 0.0,
+            'max_interval': intervals[-1] if intervals else 0.0,
+            'entries': entries,
+        }
+
+def build_scheduler(queries):
+    """Scheduler over the given (keyword, location, source) queries using the configured bounds"""
+    return AdaptiveScheduler(
+        queries,
+        SCRAPING_INTERVAL * 60,
+        ADAPTIVE_MIN_INTERVAL * 60,
+        ADAPTIVE_MAX_INTERVAL * 60,
+    )
@@ -0,0 +1,126 @@
+import codecs
+from html.parser import HTMLParser
+
+def has_class(name):
+    """Class predicate: the element has exactly this class token"""
+    return lambda classes: name in classes
+
+def class_contains(fragment):
+    """Class predicate: some class token contains `fragment` (like CSS [class*=...])"""
+    return lambda classes: any(fragment in cls for cls in classes)
+
+def any_class(classes):
+    return True
+
+class CardStreamParser(HTMLParser):
+    """Incremental HTML parser that emits a dict per job card as soon as the card closes.
+
+    `spec` describes the cards: 'card' is a list of (tag, class predicate) pairs
+    marking a card's root element, 'fields' maps a field name to alternatives
+    whose text is taken, and 'attrs' maps a field name to (attribute,
+    alternatives) whose attribute value is taken. Alternatives are in order of
+    preference, as in the BeautifulSoup extractors; a None tag matches any tag.
+    Nothing outside the open card is kept, so memory is bounded by card size.
+    """
+
+    def __init__(self, spec):
+        super().__init__(convert_charrefs=True)
+        self.spec = spec
+        self._ready = []  # closed cards not yet drained
+        self._card = None  # {'tag', 'depth', 'found': {(field, rank): value}}
+        self._captures = []  # open text captures: [field, rank, tag, depth, parts]
+
+    @staticmethod
+    def _rank(alternatives, tag, classes):
+        for rank, (alt_tag, predicate) in enumerate(alternatives):
+            if (alt_tag is None or alt_tag == tag) and predicate(classes):
+                return rank
+        return None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+
+        if self._card is None:
+            if self._rank(self.spec['card'], tag, classes) is not None:
+                self._card = {'tag': tag, 'depth': 0, 'found': {}}
+            return
+
+        if tag == self._card['tag']:
+            self._card['depth'] += 1
+        for capture in self._captures:
+            if capture[2] == tag:
+                capture[3] += 1
+
+        found = self._card['found']
+        for field, alternatives in self.spec['fields'].items():
+            rank = self._rank(alternatives, tag, classes)
+            if rank is not None and (field, rank) not in found:
+                found[(field, rank)] = None  # claimed; filled in when the element closes
+                self._captures.append([field, rank, tag, 0, []])
+
+        for field, (attr, alternatives) in self.spec.get('attrs', {}).items():
+            rank = self._rank(alternatives, tag, classes)
+            if rank is not None and (field, rank) not in found:
+                found[(field, rank)] = attrs.get(attr) or ''
+
+    def handle_startendtag(self, tag, attrs):
+        # Self-closing elements carry attributes only; they never open a card or a capture
+        if self._card is not None:
+            attrs = dict(attrs)
+            classes = (attrs.get('class') or '').split()
+            for field, (attr, alternatives) in self.spec.get('attrs', {}).items():
+                rank = self._rank(alternatives, tag, classes)
+                if rank is not None and (field, rank) not in self._card['found']:
+                    self._card['found'][(field, rank)] = attrs.get(attr) or ''
+
+    def handle_data(self, data):
+        for capture in self._captures:
+            capture[4].append(data)
+
+    def handle_endtag(self, tag):
+        if self._card is None:
+            return
+
+        for capture in list(self._captures):
+            if capture[2] != tag:
+                continue
+            if capture[3]:
+                capture[3] -= 1
+                continue
+            field, rank, _, _, parts = capture
+            self._card['found'][(field, rank)] = ''.join(parts).strip()
+            self._captures.remove(capture)
+
+        if tag == self._card['tag']:
+            if self._card['depth']:
+                self._card['depth'] -= 1
+            else:
+                self._ready.append(self._finish())
+
+    def _finish(self):
+        found = self._card['found']
+        card = {}
+        for field in list(self.spec['fields']) + list(self.spec.get('attrs', {})):
+            values = sorted((rank, value) for (name, rank), value in found.items() if name == field and value is not None)
+            card[field] = values[0][1] if values else ''
+        self._card = None
+        self._captures = []
+        return card
+
+    def drain(self):
+        """Cards closed since the last drain"""
+        ready, self._ready = self._ready, []
+        return ready
+
+def iter_cards(chunks, spec, encoding='utf-8'):
+    """Parse an iterable of byte chunks, yielding each card as soon as its closing tag arrives"""
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    parser = CardStreamParser(spec)
+    for chunk in chunks:
+        parser.feed(decoder.decode(chunk))
+        yield from parser.drain()
+
+    parser.feed(decoder.decode(b'', final=True))
+    parser.close()
+    yield from parser.drain()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Test the Telegram command loop against a local fake Bot API server"""
+import sys
+import os
+import asyncio
+import json
+import re
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import db.database as database
+import db.subscriptions as subscriptions
+import tg.bot as bot
+from scraper.health import get_breaker
+from tg.commands import CommandBot
+
+# Unescaped legacy-Markdown entity characters; an odd count is an unterminated entity
+UNESCAPED_ENTITY = re.compile(r'(?<!\\)[_*`]')
+
+class FakeTelegram(BaseHTTPRequestHandler):
+    """getUpdates hands out queued updates past `offset`; sendMessage records what was sent.
+
+    Like Telegram, sendMessage answers 400 to Markdown with an unterminated entity.
+    """
+
+    updates = []
+    sent = []
+
+    def _answer(self, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if not url.path.endswith('/getUpdates'):
+            self.send_error(404)
+            return
+        offset = int(parse_qs(url.query).get('offset', ['0'])[0])
+        self._answer({'ok': True, 'result': [u for u in self.updates if u['update_id'] >= offset]})
+
+    def do_POST(self):
+        if not self.path.endswith('/sendMessage'):
+            self.send_error(404)
+            return
+        form = parse_qs(self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8'))
+        text = form['text'][0]
+        for char in '_*`':
+            if form.get('parse_mode') == ['Markdown'] and UNESCAPED_ENTITY.findall(text).count(char) % 2:
+                self.send_response(400)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        self.sent.append((form['chat_id'][0], text))
+        self._answer({'ok': True, 'result': {}})
+
+    def log_message(self, *args):
+        pass
+
+def update(update_id, chat_id, text):
+    return {'update_id': update_id, 'message': {'chat': {'id': chat_id}, 'text': text}}
+
+def make_job(n, title):
+    return {'title': title, 'company': f"Company {n}", 'location': 'Remote',
+            'link': f"https://example.com/jobs/{n}", 'source': 'LinkedIn', 'posted_time': None}
+
+class FakeScheduler:
+    def __init__(self):
+        self.expedited = 0
+
+    def expedite(self):
+        self.expedited += 1
+
+    def stats(self):
+        return {'keys': 4, 'min_interval': 600, 'max_interval': 3600}
+
+    def seconds_until_next(self):
+        return 120
+
+def test_commands_over_fake_api():
+    """Commands are answered from the DB through the Bot API, offsets advance, mid-cycle too"""
+    original_db, original_api = database.DB_PATH, bot.TELEGRAM_API_URL
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeTelegram)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    # A source mid-probe: its raw state name would be an unterminated Markdown entity
+    probing = get_breaker("ProbeTest")
+    probing._set_state('half_open')
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            database.close_connection()
+            database.DB_PATH = os.path.join(tmpdir, "jobs.db")
+            database.create_table()
+            subscriptions.create_subscriptions_table()
+            subscriptions.subscribe("7", ["java"])
+            database.save_jobs_bulk([make_job(1, "Java Developer"), make_job(2, "Rust Engineer"),
+                                     make_job(3, "Senior 50%_Java Lead")])
+            bot.TELEGRAM_API_URL = f"http://127.0.0.1:{server.server_port}"
+
+            FakeTelegram.updates = [
+                update(1, 7, "/search java"),
+                update(2, 7, "/latest 2"),
+                update(3, 7, "/stats"),
+                update(4, 7, "/pause"),
+                update(5, 7, "/scrape now"),
+                update(6, 99, "/latest"),
+                update(7, 7, "hello"),
+                update(8, 1, "/scrape now"),
+            ]
+            FakeTelegram.sent = []
+            scheduler = FakeScheduler()
+            woken = []
+            commands = CommandBot(scheduler=scheduler, on_scrape=lambda: woken.append(True),
+                                  admin_chat_id="1", poll_timeout=0)
+
+            async def cycle_and_poll():
+                # A blocking "scrape cycle" in a thread must not hold up the command answers
+                cycle = asyncio.create_task(asyncio.to_thread(time.sleep, 1.0))
+                started = time.monotonic()
+                handled = await commands.poll_once()
+                elapsed = time.monotonic() - started
+                await cycle
+                return handled, elapsed
+
+            handled, elapsed = asyncio.run(cycle_and_poll())
+            assert handled == 8 and commands.offset == 9
+            assert elapsed < 0.9, f"commands waited for the cycle ({elapsed:.2f}s)"
+
+            replies = dict(enumerate(text for _, text in FakeTelegram.sent))
+            assert [chat for chat, _ in FakeTelegram.sent] == ["7"] * 5 + ["99", "1"]
+            assert "2 jobs matching" in replies[0] and "Rust" not in replies[0]
+            assert "Latest 2 jobs" in replies[1] and "50%\\_Java" in replies[1]
+            assert "Jobs in DB: 3" in replies[2] and "Queries: 4" in replies[2]
+            assert "ProbeTest half-open" in replies[2]
+            assert "paused" in replies[3] and not subscriptions.get_subscription("7")['active']
+            assert "Only the admin" in replies[4]
+            assert "no subscription" in replies[5]
+            assert "Scrape queued" in replies[6] and scheduler.expedited == 1 and woken == [True]
+
+            # The literal "%" and "_" in a search term don't act as wildcards
+            assert [job['title'] for job in database.search_jobs("50%_")] == ["Senior 50%_Java Lead"]
+
+            # Already-answered updates are not fetched again
+            FakeTelegram.sent = []
+            assert asyncio.run(commands.poll_once()) == 0 and FakeTelegram.sent == []
+        finally:
+            probing._set_state('closed')
+            server.shutdown()
+            server.server_close()
+            database.close_connection()
+            database.DB_PATH = original_db
+            bot.TELEGRAM_API_URL = original_api
+    print("✅ Telegram commands working")
+
+if __name__ == "__main__":
+    test_commands_over_fake_api()
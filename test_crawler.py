@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Test paginated crawling of search results"""
+import sys
+import os
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scraper.crawler import crawl_pages, iter_crawl, get_crawl_stats
+
+def make_page(page, size=3):
+    return [{'link': f"https://example.com/{page}-{i}"} for i in range(size)]
+
+def test_crawl_order_and_waves():
+    """Pages come back in order; after the first page they are fetched concurrently"""
+    lock = threading.Lock()
+    state = {'active': 0, 'peak': 0}
+    fetched = []
+
+    def fetch_page(page):
+        with lock:
+            fetched.append(page)
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        time.sleep(0.05)
+        with lock:
+            state['active'] -= 1
+        return make_page(page)
+
+    cards = crawl_pages("TestWaves", fetch_page, max_pages=5, concurrency=2)
+
+    assert [card['link'] for card in cards] == [card['link'] for page in range(5) for card in make_page(page)]
+    assert fetched[0] == 0 and sorted(fetched) == [0, 1, 2, 3, 4]
+    assert state['peak'] == 2
+
+    stats = get_crawl_stats()["TestWaves"]
+    assert stats['pages'] == 5 and stats['cards'] == 15 and stats['stops'] == {'depth': 1}
+    assert stats['cards_per_second'] > 0
+    print("✅ Paginated crawl working")
+
+def test_crawl_stops_early():
+    """The crawl stops at an all-seen page, an empty page, or a failing later page"""
+    seen = {card['link'] for card in make_page(1)}
+    cards = crawl_pages("TestSeen", make_page, is_seen=seen.__contains__, max_pages=10, concurrency=1)
+    assert len(cards) == 6
+    assert get_crawl_stats()["TestSeen"]['stops'] == {'seen': 1}
+
+    # One new link on a page keeps the crawl going
+    seen.discard("https://example.com/1-2")
+    cards = crawl_pages("TestSeen", make_page, is_seen=seen.__contains__, max_pages=3, concurrency=1)
+    assert len(cards) == 9
+
+    cards = crawl_pages("TestEnd", lambda page: make_page(page) if page < 2 else [], max_pages=10)
+    assert len(cards) == 6 and get_crawl_stats()["TestEnd"]['stops'] == {'end': 1}
+
+    def flaky(page):
+        if page == 2:
+            raise RuntimeError("timeout")
+        return make_page(page)
+    cards = crawl_pages("TestError", flaky, max_pages=5, concurrency=2)
+    assert len(cards) == 6 and get_crawl_stats()["TestError"]['stops'] == {'error': 1}
+
+    def broken(page):
+        raise RuntimeError("down")
+    try:
+        crawl_pages("TestBroken", broken)
+        assert False, "first page failure should propagate"
+    except RuntimeError:
+        pass
+    print("✅ Crawl early stop working")
+
+def test_iter_crawl_yields_per_page():
+    """Cards of the first page are handed out before later pages are requested"""
+    fetched = []
+
+    def fetch_page(page):
+        fetched.append(page)
+        return make_page(page)
+
+    cards = iter_crawl("TestStream", fetch_page, max_pages=3, concurrency=2)
+    assert next(cards)['link'] == "https://example.com/0-0" and fetched == [0]
+    assert len(list(cards)) == 8 and sorted(fetched) == [0, 1, 2]
+    assert get_crawl_stats()["TestStream"]['cards'] == 9
+
+    # A lazily parsed first page is passed on card by card, before it has been read to the end
+    produced = []
+
+    def lazy_page(page):
+        for card in make_page(page):
+            produced.append(card['link'])
+            yield card
+
+    cards = iter_crawl("TestStream", lazy_page, max_pages=2, concurrency=1)
+    assert next(cards)['link'] == "https://example.com/0-0" and len(produced) == 1
+    assert len(list(cards)) == 5
+    print("✅ Streaming crawl working")
+
+if __name__ == "__main__":
+    test_crawl_order_and_waves()
+    test_crawl_stops_early()
+    test_iter_crawl_yields_per_page()
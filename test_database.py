@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Test the SQLite persistence layer against a temporary database"""
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import db.database as database
+from db.seen_index import SeenIndex, get_seen_index
+from utils.dedup import normalize_link
+
+def make_job(n, source='LinkedIn'):
+    return {
+        'title': f"Java Developer {n}",
+        'company': f"Company {n}",
+        'location': 'Remote',
+        'link': f"https://example.com/jobs/{n}",
+        'source': source,
+        'posted_time': '1 hour ago',
+    }
+
+def use_temp_db(tmpdir):
+    database.close_connection()
+    database.DB_PATH = os.path.join(tmpdir, "jobs.db")
+    database.create_table()
+
+def test_wal_and_bulk_insert():
+    """Bulk insert runs in one transaction and reports only new jobs"""
+    original = database.DB_PATH
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            use_temp_db(tmpdir)
+            with database._conn_lock:
+                mode = database.get_connection().execute('PRAGMA journal_mode').fetchone()[0]
+            assert mode == 'wal'
+
+            first = database.save_jobs_bulk([make_job(n) for n in range(5)])
+            assert len(first) == 5
+
+            second = database.save_jobs_bulk([make_job(n) for n in range(3, 8)])
+            assert [job['link'] for job in second] == [make_job(n)['link'] for n in range(5, 8)]
+
+            assert database.save_job(make_job(100)) is True
+            assert database.save_job(make_job(100)) is False
+            assert database.get_sent_jobs_count() == 9
+        finally:
+            database.close_connection()
+            database.DB_PATH = original
+    print("✅ Bulk job persistence working")
+
+def test_seen_index_short_circuits_and_warms():
+    """Known links are rejected in memory, and the index is rebuilt from the table at startup"""
+    original = database.DB_PATH
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            use_temp_db(tmpdir)
+            index = get_seen_index()
+            database.save_jobs_bulk([make_job(n) for n in range(4)])
+
+            hits_before = index.hits
+            variant = dict(make_job(1), link="https://EXAMPLE.com/jobs/1/?trk=abc")
+            assert database.save_jobs_bulk([variant]) == []
+            assert index.hits == hits_before + 1
+
+            index.clear()
+            database.close_connection()
+            database.create_table()
+            assert len(index) == 4 and index.contains(make_job(3)['link'])
+        finally:
+            database.close_connection()
+            database.DB_PATH = original
+    print("✅ Seen-link index working")
+
+def test_cross_source_duplicates_collapse():
+    """The same posting from two sources is stored and alerted once"""
+    original = database.DB_PATH
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            use_temp_db(tmpdir)
+            linkedin = make_job(1)
+            naukri = dict(make_job(1, source='Naukri'), link="https://www.naukri.com/job-listings-java-developer-1-231023500123")
+            assert database.save_jobs_bulk([linkedin, naukri]) == [linkedin]
+
+            # Still collapsed once the in-memory engine has been rebuilt from the table
+            database.warm_seen_index()
+            naukri_later = dict(naukri, title="Java Developer 1 (Remote)")
+            assert database.save_jobs_bulk([naukri_later]) == []
+        finally:
+            database.close_connection()
+            database.DB_PATH = original
+    print("✅ Cross-source dedup working")
+
+def test_retention_deletes_only_old_jobs():
+    """Cleanup removes jobs past retention in batches and keeps recent ones deduped"""
+    original = database.DB_PATH
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            use_temp_db(tmpdir)
+            database.save_jobs_bulk([make_job(n) for n in range(12)])
+            with database._conn_lock:
+                conn = database.get_connection()
+                with conn:
+                    conn.execute("UPDATE jobs SET created_at = datetime('now', '-40 days') WHERE id <= 7")
+                assert conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 2
+            database.warm_seen_index()
+
+            assert database.cleanup_old_jobs(retention_days=30, batch_size=3, pause=0) == 7
+            assert database.get_sent_jobs_count() == 5
+            # Recent jobs are still known, so they are not re-alerted
+            assert database.save_jobs_bulk([make_job(n) for n in range(7, 12)]) == []
+        finally:
+            database.close_connection()
+            database.DB_PATH = original
+    print("✅ Retention cleanup working")
+
+def test_full_text_search():
+    """Ranked keyword search with source/time filters, kept in sync with inserts and deletes"""
+    original = database.DB_PATH
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            use_temp_db(tmpdir)
+            jobs = [
+                dict(make_job(1), title="Spring Boot Developer", company="Acme Java Labs"),
+                dict(make_job(2, source='Naukri'), title="Senior Java Spring Engineer", company="Globex"),
+                dict(make_job(3), title="Python Developer", company="Initech"),
+                dict(make_job(4), title="Java Developer", company="Hooli"),
+            ]
+            assert len(database.save_jobs_bulk(jobs)) == 4
+            with database._conn_lock:
+                conn = database.get_connection()
+                with conn:
+                    conn.execute("UPDATE jobs SET created_at = datetime('now', '-10 days') WHERE id = 4")
+
+            titles = lambda results: [job['title'] for job in results]
+            # Title matches outrank company matches; words match as prefixes and in any order
+            assert titles(database.search_jobs("java")) == ["Java Developer", "Senior Java Spring Engineer", "Spring Boot Developer"]
+            assert titles(database.search_jobs("spring jav")) == ["Senior Java Spring Engineer", "Spring Boot Developer"]
+            assert titles(database.search_jobs("java", source='Naukri')) == ["Senior Java Spring Engineer"]
+            recent = database.search_jobs("developer", since=datetime.utcnow() - timedelta(days=1))
+            assert sorted(titles(recent)) == ["Python Developer", "Spring Boot Developer"]
+            assert database.search_jobs('"*') == []
+            # Only the newest matches are ranked
+            assert titles(database.search_jobs("java", search_candidates=1)) == ["Java Developer"]
+            # Without a term: newest first
+            assert titles(database.search_jobs(limit=2)) == ["Python Developer", "Senior Java Spring Engineer"]
+            assert titles(database.get_latest_jobs(5))[-1] == "Java Developer"
+
+            # An existing table without the index is indexed when create_table runs
+            with database._conn_lock:
+                with conn:
+                    conn.execute("DROP TABLE jobs_fts")
+                    for trigger in ("insert", "delete", "update"):
+                        conn.execute(f"DROP TRIGGER jobs_fts_{trigger}")
+            database.create_table()
+            assert len(database.search_jobs("developer")) == 3
+
+            # Deleted jobs leave the index
+            assert database.cleanup_old_jobs(retention_days=5, batch_size=10, pause=0) == 1
+            assert titles(database.search_jobs("java")) == ["Senior Java Spring Engineer", "Spring Boot Developer"]
+        finally:
+            database.close_connection()
+            database.DB_PATH = original
+    print("✅ Full-text search working")
+
+def test_seen_index_bounds():
+    """The index never exceeds max_entries and evicts by age"""
+    index = SeenIndex(max_entries=3)
+    for n in range(5):
+        index.add(f"https://example.com/{n}", seen_at=n)
+
+    assert len(index) == 3 and not index.contains("https://example.com/0")
+    assert index.evict_older_than(4) == 2 and len(index) == 1
+    assert normalize_link("HTTPS://Www.X.com/a/?q=1#f") == "https://www.x.com/a"
+    print("✅ Seen-index eviction working")
+
+if __name__ == "__main__":
+    test_wal_and_bulk_insert()
+    test_seen_index_short_circuits_and_warms()
+    test_cross_source_duplicates_collapse()
+    test_retention_deletes_only_old_jobs()
+    test_full_text_search()
+    test_seen_index_bounds()
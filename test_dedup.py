@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Test canonical job identity and cross-source duplicate detection"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.dedup import DedupEngine, canonical_link, job_fingerprint
+
+def job(title, company, location, link="https://example.com/1"):
+    return {'title': title, 'company': company, 'location': location, 'link': link}
+
+def test_canonical_links():
+    """URL variants of the same posting reduce to one identity"""
+    assert canonical_link("https://in.linkedin.com/jobs/view/java-developer-at-acme-3791234567?refId=x&trk=y") == \
+        canonical_link("https://www.linkedin.com/jobs/view/3791234567/")
+    assert canonical_link("https://www.naukri.com/job-listings-java-developer-acme-bengaluru-3-to-5-years-231023500123?src=jobsearchDesk") == \
+        "https://www.naukri.com/job-listings-231023500123"
+    print("✅ Canonical links working")
+
+def test_fingerprint_ignores_formatting():
+    """Fingerprints survive punctuation, legal suffixes and remote spellings"""
+    a = job("Java Developer (Remote)", "Acme Pvt. Ltd.", "Remote")
+    b = job("java developer - remote", "ACME", "Work From Home, India")
+    c = job("Java Developer", "Globex", "Remote")
+    assert job_fingerprint(a) == job_fingerprint(b)
+    assert job_fingerprint(a) != job_fingerprint(c)
+    print("✅ Job fingerprints working")
+
+def test_near_duplicates_collapse():
+    """Reworded titles at the same company collapse; different roles do not"""
+    engine = DedupEngine(max_entries=100, threshold=0.6)
+    engine.add(job("Senior Java Spring Boot Developer", "Acme", "Bengaluru"))
+
+    assert engine.check(job("Senior Java Spring Boot Developer", "Acme Ltd", "Bengaluru, Karnataka")) == 'exact'
+    assert engine.check(job("Urgent Hiring: Senior Java Spring Boot Developer II", "Acme", "Bengaluru")) == 'near'
+    assert engine.check(job("Frontend React Engineer", "Acme", "Bengaluru")) is None
+    assert engine.check(job("Senior Java Spring Boot Developer II", "Globex", "Bengaluru")) is None
+    print("✅ Near-duplicate detection working")
+
+def test_engine_bounds():
+    """The engine forgets the oldest postings beyond max_entries"""
+    engine = DedupEngine(max_entries=2, threshold=0.8)
+    for n in range(3):
+        engine.add(job(f"Role {n} engineer", f"Company {n}", "Remote"), seen_at=n)
+
+    assert engine.stats()['size'] == 2
+    assert engine.check(job("Role 0 engineer", "Company 0", "Remote")) is None
+    assert engine.evict_older_than(2) == 1
+    print("✅ Dedup engine bounds working")
+
+if __name__ == "__main__":
+    test_canonical_links()
+    test_fingerprint_ignores_formatting()
+    test_near_duplicates_collapse()
+    test_engine_bounds()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Test the Selenium scraping path (driver pool, page readiness) with fake drivers"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from selenium.common.exceptions import WebDriverException
+from scraper.driver_pool import DriverPool
+from scraper.naukri_scraper import wait_for_results
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+        self.dead = False
+
+    @property
+    def current_url(self):
+        if self.dead:
+            raise WebDriverException("session deleted")
+        return "about:blank"
+
+    def quit(self):
+        self.quit_called = True
+
+def test_pool_reuses_and_recycles():
+    """Drivers are reused across leases and retired after max_pages"""
+    pool = DriverPool(size=1, max_pages=3, lease_timeout=1, factory=FakeDriver)
+
+    seen = []
+    for _ in range(4):
+        with pool.lease() as driver:
+            seen.append(driver)
+
+    assert seen[0] is seen[1] is seen[2]
+    assert seen[3] is not seen[0] and seen[0].quit_called
+    stats = pool.stats()
+    assert stats['launches'] == 2 and stats['recycled'] == 1 and stats['pages_served'] == 4
+    print("✅ Driver reuse and recycling working")
+
+def test_pool_replaces_crashed_drivers():
+    """A WebDriverException retires the driver, and dead idle drivers are skipped"""
+    pool = DriverPool(size=1, max_pages=100, lease_timeout=1, factory=FakeDriver)
+
+    try:
+        with pool.lease() as driver:
+            raise WebDriverException("tab crashed")
+    except WebDriverException:
+        pass
+    assert driver.quit_called
+
+    with pool.lease() as second:
+        pass
+    second.dead = True
+    with pool.lease() as third:
+        assert third is not second
+
+    stats = pool.stats()
+    assert stats['crashed'] == 2 and stats['launches'] == 3 and stats['live'] == 1
+    print("✅ Crash recovery working")
+
+def test_pool_lease_timeout():
+    """Leasing from an exhausted pool times out instead of launching extra browsers"""
+    pool = DriverPool(size=1, max_pages=100, lease_timeout=0.1, factory=FakeDriver)
+
+    with pool.lease():
+        try:
+            with pool.lease():
+                assert False, "second lease should not succeed"
+        except TimeoutError:
+            pass
+
+    assert pool.stats()['launches'] == 1
+    print("✅ Lease timeout working")
+
+class FakePage:
+    """Stands in for a driver on a Naukri results page"""
+
+    def __init__(self, url="https://www.naukri.com/x", cards_after=None, blocked=False, resources=3):
+        self.current_url = url
+        self.cards_after = cards_after
+        self.blocked = blocked
+        self.resources = resources
+        self.polls = 0
+
+    def find_elements(self, by, selector):
+        self.polls += 1
+        if self.cards_after is not None and self.polls > self.cards_after and selector == ".srp-jobtuple-wrapper":
+            return ["card"]
+        return []
+
+    def execute_script(self, script):
+        if "innerText" in script:
+            return self.blocked
+        return ["complete", self.resources]
+
+def test_readiness_outcomes():
+    """Cards, captcha, block pages and idle empty pages all resolve without a fixed sleep"""
+    outcome, selector, elapsed = wait_for_results(FakePage(cards_after=6), timeout=5, idle_seconds=5)
+    assert outcome == 'ready' and selector == ".srp-jobtuple-wrapper" and elapsed < 2
+
+    outcome, _, elapsed = wait_for_results(FakePage(url="https://www.naukri.com/captcha"), timeout=5)
+    assert outcome == 'blocked' and elapsed < 0.5
+
+    outcome, _, _ = wait_for_results(FakePage(blocked=True), timeout=5)
+    assert outcome == 'blocked'
+
+    outcome, _, elapsed = wait_for_results(FakePage(), timeout=5, idle_seconds=0.3)
+    assert outcome == 'empty' and elapsed < 2
+
+    outcome, _, _ = wait_for_results(FakePage(), timeout=0.3, idle_seconds=5)
+    assert outcome == 'timeout'
+    print("✅ Page readiness detection working")
+
+if __name__ == "__main__":
+    test_pool_reuses_and_recycles()
+    test_pool_replaces_crashed_drivers()
+    test_pool_lease_timeout()
+    test_readiness_outcomes()
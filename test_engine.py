@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Test the concurrent scrape engine"""
+import sys
+import os
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scraper.engine import SourceLimiter
+from scraper.pipeline import stream_scrape, expand_queries
+
+def test_scrape_order_and_errors():
+    """Results keep keyword/source order and failures don't sink the cycle"""
+    def fake_scraper(keyword, location):
+        if keyword == "broken":
+            raise RuntimeError("boom")
+        yield {'title': keyword, 'location': location}
+
+    sources = {'TestA': fake_scraper, 'TestB': fake_scraper}
+    queries = expand_queries(["one", "broken", "two"], ["remote"], sources)
+    results = stream_scrape(queries, sources, persist=lambda jobs: [], notify=lambda jobs: 0,
+                            keep=lambda job: True)['results']
+
+    assert [(r['keyword'], r['source']) for r in results] == [
+        ("one", "TestA"), ("one", "TestB"),
+        ("broken", "TestA"), ("broken", "TestB"),
+        ("two", "TestA"), ("two", "TestB"),
+    ]
+    assert results[2]['error'] == "boom" and results[2]['jobs'] == []
+    assert results[4]['jobs'] == [{'title': "two", 'location': "remote", 'query': ("two", "remote", "TestA")}]
+    print("✅ Scrape fan-out working")
+
+def test_source_limiter_caps_concurrency():
+    """A limiter never lets more than max_concurrent calls run at once"""
+    limiter = SourceLimiter("test", max_concurrent=2, min_interval=0)
+    lock = threading.Lock()
+    state = {'active': 0, 'peak': 0}
+
+    def work():
+        with lock:
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        time.sleep(0.05)
+        with lock:
+            state['active'] -= 1
+
+    threads = [threading.Thread(target=limiter.run, args=(work,)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert state['peak'] == 2
+    print("✅ Source concurrency limit working")
+
+def test_source_limiter_spaces_starts():
+    """Starts on the same source are at least min_interval apart"""
+    limiter = SourceLimiter("test", max_concurrent=4, min_interval=0.05)
+    starts = []
+
+    threads = [threading.Thread(target=limiter.run, args=(lambda: starts.append(time.monotonic()),)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    starts.sort()
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert all(gap >= 0.04 for gap in gaps), gaps
+    print("✅ Source politeness delay working")
+
+if __name__ == "__main__":
+    test_scrape_order_and_errors()
+    test_source_limiter_caps_concurrency()
+    test_source_limiter_spaces_starts()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Test conditional fetching and parse short-circuiting in the search page cache"""
+import sys
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scraper.fetch_cache import FetchCache, card_region
+from scraper.parsers import (
+    LINKEDIN_STRAINER, LINKEDIN_CARD_REGION, LINKEDIN_STREAM_SPEC, extract_linkedin_cards, parse_cards,
+)
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "fixtures")
+
+with open(os.path.join(FIXTURES, "linkedin_search.html"), "rb") as f:
+    LINKEDIN_PAGE = f.read()
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Serves `body`, honouring If-None-Match only when `etag` is set"""
+    protocol_version = "HTTP/1.1"
+    body = b""
+    etag = None
+    requests = []
+
+    def do_GET(self):
+        PageHandler.requests.append(dict(self.headers))
+        if self.etag and self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        if self.etag:
+            self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+def serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/jobs/search/?keywords=java"
+
+def test_not_modified_skips_download_and_parse():
+    """A 304 answer to a conditional request reuses the cached cards"""
+    PageHandler.body, PageHandler.etag, PageHandler.requests = LINKEDIN_PAGE, '"v1"', []
+    server, url = serve()
+    cache = FetchCache(max_entries=10)
+
+    try:
+        first = cache.fetch_cards(url, LINKEDIN_STRAINER, extract_linkedin_cards, region=LINKEDIN_CARD_REGION)
+        second = cache.fetch_cards(url, LINKEDIN_STRAINER, extract_linkedin_cards, region=LINKEDIN_CARD_REGION)
+    finally:
+        server.shutdown()
+
+    assert first[0] == 200 and len(first[1]) == 25
+    assert second == (304, first[1])
+    assert PageHandler.requests[1].get("If-None-Match") == '"v1"'
+    stats = cache.stats()
+    assert stats['parsed'] == 1 and stats['not_modified'] == 1 and stats['hit_rate'] == 0.5
+    print("✅ Conditional fetch working")
+
+def test_unchanged_cards_skip_parse():
+    """Pages differing only in tracking noise hit the cache; real card changes are re-parsed"""
+    PageHandler.etag, PageHandler.requests = None, []
+    server, url = serve()
+    cache = FetchCache(max_entries=10)
+
+    try:
+        PageHandler.body = LINKEDIN_PAGE
+        first = cache.fetch_cards(url, LINKEDIN_STRAINER, extract_linkedin_cards, region=LINKEDIN_CARD_REGION)
+
+        # Same postings, fresh tracking ids and query strings
+        PageHandler.body = LINKEDIN_PAGE.replace(b'data-tracking-id="t', b'data-tracking-id="u').replace(b'refId=abc', b'refId=def')
+        second = cache.fetch_cards(url, LINKEDIN_STRAINER, extract_linkedin_cards, region=LINKEDIN_CARD_REGION)
+
+        # A new title inside the card list
+        PageHandler.body = LINKEDIN_PAGE.replace(b'Data Analyst', b'Data Scientist', 2)
+        third = cache.fetch_cards(url, LINKEDIN_STRAINER, extract_linkedin_cards, region=LINKEDIN_CARD_REGION)
+    finally:
+        server.shutdown()
+
+    assert second == first
+    assert third[1] != first[1] and third[1][0]['title'] == "Data Scientist"
+    stats = cache.stats()
+    assert stats['same_cards'] == 1 and stats['parsed'] == 2
+    assert card_region(b"<html>no cards</html>", b"base-card", b"</ul>") == b"<html>no cards</html>"
+    print("✅ Card region hashing working")
+
+def test_stream_cards():
+    """Streamed pages parse like buffered ones and are still revalidated with a conditional request"""
+    PageHandler.body, PageHandler.etag, PageHandler.requests = LINKEDIN_PAGE, '"v2"', []
+    server, url = serve()
+    cache = FetchCache(max_entries=10)
+
+    try:
+        status, cards = cache.stream_cards(url, LINKEDIN_STREAM_SPEC, chunk_size=1024)
+        # Nothing is cached until the streamed cards have all been consumed
+        assert status == 200 and cache.stats()['size'] == 0
+        first = list(cards)
+        second = cache.stream_cards(url, LINKEDIN_STREAM_SPEC, chunk_size=1024)
+    finally:
+        server.shutdown()
+
+    assert first == parse_cards(LINKEDIN_PAGE, LINKEDIN_STRAINER, extract_linkedin_cards)
+    assert second == (304, first)
+    assert PageHandler.requests[1].get("If-None-Match") == '"v2"'
+    stats = cache.stats()
+    assert stats['streamed'] == 1 and stats['not_modified'] == 1 and stats['parsed'] == 0
+    print("✅ Streamed fetch working")
+
+if __name__ == "__main__":
+    test_not_modified_skips_download_and_parse()
+    test_unchanged_cards_skip_parse()
+    test_stream_cards()
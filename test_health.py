@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Test per-source circuit breakers and how the scrape engine honours them"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scraper.health import CircuitBreaker, classify_status, looks_blocked_url, get_breaker, format_source_health
+from scraper.engine import run_scrape_task
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_breaker_opens_probes_and_backs_off():
+    """Errors open the circuit, one half-open probe decides, failed probes double the cooldown"""
+    clock = FakeClock()
+    breaker = CircuitBreaker("Test", failure_threshold=3, block_threshold=1, base_cooldown=60,
+                             max_cooldown=200, probe_timeout=30, clock=clock)
+
+    breaker.record('error')
+    breaker.record('ok')
+    breaker.record('error')
+    breaker.record('error')
+    assert breaker.state == 'closed' and breaker.allow()
+    breaker.record('error')
+    assert breaker.state == 'open' and not breaker.allow()
+
+    clock.now = 61
+    assert breaker.allow() and breaker.state == 'half_open'
+    assert not breaker.allow(), "only one probe at a time"
+    breaker.record('blocked')
+    assert breaker.state == 'open' and breaker.cooldown == 120
+
+    clock.now += 121
+    assert breaker.allow()
+    breaker.record('error')
+    assert breaker.cooldown == 200, "cooldown is capped"
+
+    clock.now += 201
+    assert breaker.allow()
+    clock.now += 31
+    assert breaker.allow(), "a probe that never reported back is replaced"
+    breaker.record('ok')
+    assert breaker.state == 'closed' and breaker.cooldown == 60 and breaker.stats()['times_opened'] == 3
+    print("✅ Circuit breaker working")
+
+def test_block_detection():
+    """Blocks open the circuit at once; statuses and URLs are classified in one place"""
+    breaker = CircuitBreaker("Test", failure_threshold=3, block_threshold=1, clock=FakeClock())
+    breaker.record('blocked')
+    assert breaker.state == 'open'
+
+    assert [classify_status(code) for code in (200, 304, 429, 999, 403, 500)] == \
+        ['ok', 'ok', 'blocked', 'blocked', 'blocked', 'error']
+    assert looks_blocked_url("https://www.naukri.com/captcha?next=/jobs")
+    assert looks_blocked_url("https://www.linkedin.com/authwall?trk=x")
+    assert not looks_blocked_url("https://www.naukri.com/python-jobs-in-remote")
+    print("✅ Block detection working")
+
+def test_engine_skips_open_sources():
+    """An open circuit skips the scraper entirely; a raising scraper counts as an error"""
+    calls = []
+
+    def scraper(keyword, location):
+        calls.append(keyword)
+        raise RuntimeError("boom")
+
+    breaker = get_breaker("TestFlaky")
+    for keyword in ("a", "b", "c"):
+        result = run_scrape_task("TestFlaky", scraper, keyword, "remote")
+        assert result['error'] == "boom" and not result['skipped']
+    assert breaker.state == 'open'
+
+    result = run_scrape_task("TestFlaky", scraper, "d", "remote")
+    assert result['skipped'] and "paused" in result['error']
+    assert calls == ["a", "b", "c"]
+    print("✅ Engine skips open sources")
+
+def test_health_summary_is_markdown_safe():
+    """The Telegram source summary has no raw underscores, even mid-probe"""
+    health = {
+        'LinkedIn': {'state': 'half_open', 'retry_in': 0},
+        'Naukri': {'state': 'open', 'retry_in': 720},
+        'Indeed': {'state': 'closed', 'retry_in': 0},
+    }
+    text = format_source_health(health)
+    assert text == "LinkedIn half-open, Naukri open (12 min), Indeed closed"
+    assert '_' not in text
+    print("✅ Source health summary working")
+
+if __name__ == "__main__":
+    test_breaker_opens_probes_and_backs_off()
+    test_block_detection()
+    test_engine_skips_open_sources()
+    test_health_summary_is_markdown_safe()
@@ -72,4 +72,97 @@ def test_helpers():
         
     except Exception as e:
         print(f"❌ Helpers test failed: {e}")
-        return f"Helpers error: {e}"
\ No newline at end of file
+        return f"Helpers error: {e}"
+
+def test_keyword_matcher():
+    """Compiled matcher reports overlapping keywords on word boundaries, with weights"""
+    from utils.keyword_matcher import KeywordMatcher
+
+    matcher = KeywordMatcher(
+        ["api", "api security", "java spring boot", "spring boot developer", "fresher", "intern", "Java Spring Boot"],
+        weights={"api security": 3.0}
+    )
+
+    assert matcher.matches("Java Spring Boot Developer - API Security") == [
+        "java spring boot", "spring boot developer", "api security", "api"
+    ]
+    assert matcher.contains("Freshers welcome")
+    assert matcher.matches("Java Internship 2025") == ["intern"]
+    assert KeywordMatcher(["backend engineer"]).contains("Backend Engineering Lead")
+    assert not matcher.contains("International sales")
+    assert not matcher.contains("Rapid prototyping")
+    assert matcher.score("API Security Engineer") == 4.0
+    assert KeywordMatcher([]).matches("anything") == []
+    print("✅ Compiled keyword matcher working")
+
+
+def test_relative_time_parser():
+    """Single-pass parser covers every unit and the fuzzy phrases, and filtering uses its timestamps"""
+    import time
+    from utils.helpers import parse_age_seconds
+    from scraper.linkedin_scraper import filter_recent_jobs
+
+    cases = {
+        "2 hours ago": 2 * 3600,
+        "Reposted 5 minutes ago": 300,
+        "an hour ago": 3600,
+        "30+ days ago": 30 * 86400,
+        "Just now": 0,
+        "Today": 0,
+        "yesterday": 86400,
+        "1 month ago": 30 * 86400,
+        "Jan 15, 2024": None,
+        # Words ending in "a", "an" or "one" are not counts
+        "data day": None,
+        "media hour": None,
+        "someone week": None,
+    }
+    for text, expected in cases.items():
+        assert parse_age_seconds(text) == expected, f"Age parsing failed for: {text}"
+
+    now = time.time()
+    jobs = [
+        {'title': 'old', 'posted_time': '3 days ago', 'posted_at': now - 3 * 86400},
+        {'title': 'fresh', 'posted_time': '2 hours ago', 'posted_at': now - 7200},
+        {'title': 'text only', 'posted_time': '5 hours ago'},
+        {'title': 'unknown', 'posted_time': None},
+        {'title': 'unparsed', 'posted_time': 'Jan 15, 2024'},
+    ]
+    recent = filter_recent_jobs(jobs, hours=24)
+    assert [job['title'] for job in recent] == ['fresh', 'text only', 'unknown']
+    assert recent[1]['posted_at'] is not None
+    print("✅ Relative time parser working")
+
+def test_job_digest():
+    """Test digest packing stays under Telegram's limit and splits between jobs"""
+    from utils.helpers import format_job_digest, telegram_length, TELEGRAM_MESSAGE_LIMIT
+
+    jobs = [
+        {
+            'title': f"Security_Analyst *L{i}* [SOC] 🔐",
+            'company': "Acme_Corp",
+            'location': "Remote",
+            'posted_time': "2 hours ago",
+            'link': f"https://example.com/jobs/{i}",
+            'source': "LinkedIn",
+        }
+        for i in range(60)
+    ]
+    jobs.append(dict(jobs[0], title="x" * 5000, link="https://example.com/jobs/long"))
+
+    messages = format_job_digest(jobs)
+    assert 1 < len(messages) < len(jobs)
+    assert all(telegram_length(message) <= TELEGRAM_MESSAGE_LIMIT for message in messages)
+    assert all(message.startswith("📋 New jobs (") for message in messages)
+    assert f"of {len(jobs)})" in messages[-1]
+
+    # Every job appears exactly once and no job block is cut across messages
+    text = "\n".join(messages)
+    for job in jobs:
+        assert text.count(f"({job['link']})") == 1
+    assert sum(message.count("📱 **Source:**") for message in messages) == len(jobs)
+    assert all(message.count("🏢") == message.count("📱") for message in messages)
+
+    assert r"Security\_Analyst \*L0\* \[SOC]" in messages[0]
+    assert r"Acme\_Corp" in messages[0]
+    print("✅ Job digest packing working")
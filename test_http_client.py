@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Test the shared HTTP client against a local server"""
+import sys
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib3.util.request import ACCEPT_ENCODING
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.http_client import http_get, http_post, get_http_stats
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def _reply(self, body):
+        KeepAliveHandler.connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply(self.headers.get('Accept-Encoding', '').encode())
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._reply(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+def test_connections_are_reused():
+    """Repeated GETs and POSTs to one host share a pooled keep-alive connection"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    try:
+        for _ in range(5):
+            response = http_get(f"{base}/search", headers={'Accept-Encoding': 'gzip, deflate, br'})
+            assert response.status_code == 200
+        assert http_post(f"{base}/send", data={'text': 'hi'}).text == "ok"
+    finally:
+        server.shutdown()
+
+    assert len(KeepAliveHandler.connections) == 1
+    # Only encodings urllib3 can decode are advertised
+    assert response.text == ACCEPT_ENCODING
+
+    stats = get_http_stats()[f"127.0.0.1:{server.server_port}"]
+    assert stats['requests'] == 6 and stats['errors'] == 0
+    print("✅ HTTP connection reuse working")
+
+if __name__ == "__main__":
+    test_connections_are_reused()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Test the metrics registry and its HTTP endpoint"""
+import sys
+import os
+import urllib.request
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.metrics import Registry, start_metrics_server, get_registry
+
+def test_counters_and_histograms():
+    """Counters sum per label set and histograms render cumulative Prometheus buckets"""
+    registry = Registry()
+    cards = registry.counter('scraper_cards', 'Job cards found')
+    cards.inc(25, source='LinkedIn', keyword='python')
+    cards.inc(5, source='LinkedIn', keyword='python')
+    cards.inc(3, source='Naukri', keyword='say "hi"')
+    assert cards.value(source='LinkedIn', keyword='python') == 30
+    assert registry.counter('scraper_cards') is cards
+
+    fetch = registry.histogram('fetch_seconds', 'Fetch latency', buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        fetch.observe(value, source='LinkedIn')
+    with fetch.time(source='Naukri'):
+        pass
+
+    text = registry.render_prometheus()
+    assert '# TYPE scraper_cards_total counter' in text
+    assert 'scraper_cards_total{keyword="python",source="LinkedIn"} 30' in text
+    assert 'keyword="say \\"hi\\""' in text
+    assert 'fetch_seconds_bucket{source="LinkedIn",le="0.1"} 1' in text
+    assert 'fetch_seconds_bucket{source="LinkedIn",le="1.0"} 3' in text
+    assert 'fetch_seconds_bucket{source="LinkedIn",le="+Inf"} 4' in text
+    assert 'fetch_seconds_count{source="Naukri"} 1' in text
+
+    summary = fetch.summary()[(('source', 'LinkedIn'),)]
+    assert summary['count'] == 4 and summary['max'] == 3.0 and abs(summary['mean'] - 1.0625) < 1e-9
+
+    try:
+        registry.histogram('scraper_cards')
+        assert False, "name reuse with another type should fail"
+    except ValueError:
+        pass
+    print("✅ Metrics registry working")
+
+def test_metrics_endpoint():
+    """The endpoint serves Prometheus text at /metrics and the summary at /stats"""
+    registry = Registry()
+    registry.counter('jobs_new', 'New jobs').inc(source='LinkedIn')
+    registry.histogram('db_write_seconds', 'DB write time').observe(0.02)
+    server = start_metrics_server('127.0.0.1', 0, registry)
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    try:
+        metrics = urllib.request.urlopen(f"{base}/metrics").read().decode()
+        stats = urllib.request.urlopen(f"{base}/stats").read().decode()
+    finally:
+        server.shutdown()
+
+    assert 'jobs_new_total{source="LinkedIn"} 1' in metrics
+    assert 'db_write_seconds_sum 0.02' in metrics
+    assert stats.startswith("⏱️ Timings") and 'db_write_seconds: 1 | 0.020s' in stats
+    print("✅ Metrics endpoint working")
+
+def test_hot_paths_are_instrumented():
+    """The scraper, database and Telegram modules register their metrics in the shared registry"""
+    import db.database  # noqa: F401
+    import scraper.linkedin_scraper  # noqa: F401
+    import tg.delivery  # noqa: F401
+
+    names = {metric.name for metric in get_registry().metrics()}
+    for name in ('http_request_seconds', 'scraper_fetch_seconds', 'scraper_parse_seconds', 'scraper_cards',
+                 'scraper_keyword_rejects', 'dedup_hits', 'db_write_seconds', 'telegram_send_seconds'):
+        assert name in names, name
+    print("✅ Hot path instrumentation registered")
+
+if __name__ == "__main__":
+    test_counters_and_histograms()
+    test_metrics_endpoint()
+    test_hot_paths_are_instrumented()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Test HTML card extraction against the saved result-page fixtures"""
+import sys
+import os
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scraper.parsers import (
+    LXML_AVAILABLE, LINKEDIN_STRAINER, NAUKRI_STRAINER,
+    make_soup, parse_cards, extract_linkedin_cards, extract_naukri_cards,
+    LINKEDIN_STREAM_SPEC, NAUKRI_STREAM_SPEC,
+)
+from scraper.stream_parser import iter_cards
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "fixtures")
+BACKENDS = ['html.parser'] + (['lxml'] if LXML_AVAILABLE else [])
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+def test_linkedin_cards_one_pass():
+    """Strained and full parses agree on every backend, and links come from the card itself"""
+    markup = load_fixture("linkedin_search.html")
+    expected = extract_linkedin_cards(make_soup(markup, backend='html.parser'))
+    assert len(expected) == 25
+    assert all(card['title'] and card['company'] and card['link'].startswith("https://in.linkedin.com/jobs/view/")
+               for card in expected)
+
+    for backend in BACKENDS:
+        assert parse_cards(markup, LINKEDIN_STRAINER, extract_linkedin_cards, backend=backend) == expected
+    print("✅ LinkedIn card extraction working")
+
+def test_naukri_cards():
+    """Naukri cards parse the same with and without the strainer"""
+    markup = load_fixture("naukri_search.html")
+    expected = extract_naukri_cards(make_soup(markup, backend='html.parser'))
+    assert len(expected) == 20 and all(card['title'] and card['link'] for card in expected)
+
+    for backend in BACKENDS:
+        assert parse_cards(markup, NAUKRI_STRAINER, extract_naukri_cards, backend=backend) == expected
+    print("✅ Naukri card extraction working")
+
+def test_strainer_miss_falls_back_to_full_parse():
+    """Cards outside the strained classes are still found through a full parse"""
+    markup = b'<div data-job-id="1"><a class="title" href="/job-listings-x-231023500001">Java Developer</a></div>'
+    cards = parse_cards(markup, NAUKRI_STRAINER, extract_naukri_cards)
+    assert [card['title'] for card in cards] == ["Java Developer"]
+    print("✅ Strainer fallback working")
+
+def chunked(data, size):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+def test_streaming_matches_tree_parse():
+    """The streaming parser yields the same cards as the tree extractors, however the bytes are split"""
+    for fixture, strainer, extract, spec in (
+        ("linkedin_search.html", LINKEDIN_STRAINER, extract_linkedin_cards, LINKEDIN_STREAM_SPEC),
+        ("naukri_search.html", NAUKRI_STRAINER, extract_naukri_cards, NAUKRI_STREAM_SPEC),
+    ):
+        markup = load_fixture(fixture)
+        expected = parse_cards(markup, strainer, extract)
+        for size in (7, 4096, len(markup)):
+            assert list(iter_cards(chunked(markup, size), spec)) == expected, (fixture, size)
+
+    # Multi-byte characters split across chunks decode intact
+    markup = '<div class="base-card"><h3 class="base-search-card__title">Développeur Java – ☕</h3></div>'.encode('utf-8')
+    assert [card['title'] for card in iter_cards(chunked(markup, 1), LINKEDIN_STREAM_SPEC)] == ["Développeur Java – ☕"]
+    print("✅ Streaming card parser working")
+
+def test_streaming_memory_bounded_by_card():
+    """Cards are yielded as they close, so peak memory doesn't grow with the page"""
+    page = load_fixture("linkedin_search.html")
+    head, _, rest = page.partition(b'<li>')
+    card = b'<li>' + rest[:rest.index(b'</li>') + len(b'</li>')]
+
+    def huge_page(cards):
+        yield head
+        for _ in range(cards):
+            yield card
+
+    peaks = {}
+    for cards in (100, 2000):
+        tracemalloc.start()
+        count = sum(1 for _ in iter_cards(huge_page(cards), LINKEDIN_STREAM_SPEC))
+        _, peaks[cards] = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert count == cards
+
+    page_bytes = len(head) + 2000 * len(card)
+    assert peaks[2000] < page_bytes / 10, (peaks, page_bytes)
+    assert peaks[2000] < peaks[100] * 2, peaks
+    print(f"✅ Streaming peak memory {peaks[2000] / 1024:.0f} KB for a {page_bytes / 1024:.0f} KB page")
+
+if __name__ == "__main__":
+    test_linkedin_cards_one_pass()
+    test_naukri_cards()
+    test_strainer_miss_falls_back_to_full_parse()
+    test_streaming_matches_tree_parse()
+    test_streaming_memory_bounded_by_card()
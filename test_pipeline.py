@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Test the streaming scrape pipeline"""
+import sys
+import os
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scraper.pipeline import stream_scrape, expand_queries
+
+def make_job(n):
+    return {'title': f"job {n}", 'link': f"https://example.com/{n}"}
+
+def test_first_alert_before_slow_source_finishes():
+    """Jobs from a fast source are alerted while a slow source is still scraping"""
+    def fast_scraper(keyword, location):
+        return [make_job(f"{keyword}-fast-{i}") for i in range(3)] + [{'title': "no link", 'link': ""}]
+
+    def slow_scraper(keyword, location):
+        time.sleep(0.5)
+        return [make_job(f"{keyword}-slow")]
+
+    seen = set()
+    def persist(jobs):
+        new_jobs = [job for job in jobs if job['link'] not in seen]
+        seen.update(job['link'] for job in new_jobs)
+        return new_jobs
+
+    alerts = []
+    def notify(jobs):
+        alerts.append((time.monotonic(), [job['title'] for job in jobs]))
+        return 1
+
+    started = time.monotonic()
+    sources = {'Fast': fast_scraper, 'Slow': slow_scraper}
+    cycle = stream_scrape(expand_queries(["a"], ["remote"], sources), sources,
+                          persist, notify, flush_seconds=0.05)
+
+    assert cycle['scanned'] == 5
+    assert len(cycle['new_jobs']) == 4
+    assert cycle['queued'] == len(alerts) == 2
+    assert alerts[0][0] - started < 0.4, "first alert waited for the slow source"
+    assert alerts[0][1] == ["job a-fast-0", "job a-fast-1", "job a-fast-2"]
+    assert [(r['source'], len(r['jobs'])) for r in cycle['results']] == [('Fast', 4), ('Slow', 1)]
+    assert cycle['new_by_query'] == {("a", "remote", "Fast"): 3, ("a", "remote", "Slow"): 1}
+
+    # Only the given queries run, each once, and unknown sources are ignored
+    cycle = stream_scrape([("b", "pune", "Fast"), ("b", "pune", "Fast"), ("b", "pune", "Gone")], sources,
+                          persist, notify, flush_seconds=0)
+    assert [(r['keyword'], r['location'], r['source']) for r in cycle['results']] == [("b", "pune", "Fast")]
+    assert cycle['new_by_query'] == {("b", "pune", "Fast"): 3}
+    print("✅ Streaming pipeline alerts early")
+
+def test_backpressure_bounds_in_flight_jobs():
+    """A slow database stage holds the scraper back instead of buffering everything"""
+    state = {'produced': 0, 'persisted': 0, 'peak_ahead': 0}
+    lock = threading.Lock()
+
+    def generator_scraper(keyword, location):
+        for i in range(40):
+            with lock:
+                state['produced'] += 1
+                state['peak_ahead'] = max(state['peak_ahead'], state['produced'] - state['persisted'])
+            yield make_job(i)
+
+    def persist(jobs):
+        time.sleep(0.01)
+        with lock:
+            state['persisted'] += len(jobs)
+        return jobs
+
+    cycle = stream_scrape([("a", "remote", "Gen")], {'Gen': generator_scraper}, persist, lambda jobs: len(jobs),
+                          queue_size=2, batch_size=2, flush_seconds=0)
+
+    assert len(cycle['new_jobs']) == 40
+    # Two bounded queues of 2, one batch in the database and one job in the scraper's hand
+    assert state['peak_ahead'] <= 8, state
+    print("✅ Pipeline backpressure working")
+
+def test_stage_errors_do_not_stall():
+    """A failing scraper or database batch doesn't hang or sink the cycle"""
+    def broken_scraper(keyword, location):
+        raise RuntimeError("boom")
+
+    def persist(jobs):
+        raise RuntimeError("disk full")
+
+    sources = {'Broken': broken_scraper, 'Ok': lambda k, l: [make_job(k)]}
+    cycle = stream_scrape(expand_queries(["a", "b"], ["remote"], sources), sources,
+                          persist, lambda jobs: 1, flush_seconds=0)
+
+    assert [r['error'] for r in cycle['results']] == ["boom", None, "boom", None]
+    assert cycle['scanned'] == 2 and cycle['new_jobs'] == [] and cycle['queued'] == 0
+    print("✅ Pipeline error handling working")
+
+if __name__ == "__main__":
+    test_first_alert_before_slow_source_finishes()
+    test_backpressure_bounds_in_flight_jobs()
+    test_stage_errors_do_not_stall()
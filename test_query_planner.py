@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Test the query planner's dedup and learned subsumption"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scraper.query_planner import QueryPlanner
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def result(keyword, ids, source='LinkedIn', location='remote', error=None):
+    jobs = [{'link': f"https://www.linkedin.com/jobs/view/{n}?trk=x"} for n in ids]
+    return {'keyword': keyword, 'location': location, 'source': source, 'jobs': jobs, 'error': error}
+
+def test_normalizes_and_dedups():
+    """Case, whitespace and repeated keywords collapse into one query"""
+    planner = QueryPlanner()
+    plan = planner.plan([
+        ("API Security", "Remote", "LinkedIn"),
+        ("api  security", "remote", "LinkedIn"),
+        ("java developer", "remote", "LinkedIn"),
+    ])
+    assert plan == [("api security", "remote", "LinkedIn"), ("java developer", "remote", "LinkedIn")]
+    assert planner.stats()['duplicates'] == 1
+    print("✅ Query normalization working")
+
+def test_learns_subsumed_queries():
+    """A query whose links another query keeps returning is dropped, then rechecked"""
+    clock = FakeClock()
+    planner = QueryPlanner(coverage=0.9, min_runs=2, min_links=5, recheck=3600, clock=clock)
+    queries = [
+        ("java developer", "remote", "LinkedIn"),
+        ("java spring boot", "remote", "LinkedIn"),
+        ("java spring boot", "remote", "Naukri"),
+        ("rust", "remote", "LinkedIn"),
+    ]
+
+    for _ in range(2):
+        assert planner.plan(queries) == queries
+        planner.observe([
+            result("java developer", range(0, 20)),
+            result("java spring boot", range(5, 15)),  # all inside "java developer"
+            result("java spring boot", range(5, 15), source='Naukri'),  # other source: not comparable
+            result("rust", range(100, 110)),
+        ])
+
+    plan = planner.plan(queries)
+    assert ("java spring boot", "remote", "LinkedIn") not in plan and len(plan) == 3
+    stats = planner.stats()
+    assert stats['subsumed'] == 1 and stats['planned'] == 3
+    assert stats['covered'] == {("java spring boot", "remote", "LinkedIn"): ("java developer", "remote", "LinkedIn")}
+
+    # Each run of the covering query counts as one search saved; failed runs don't
+    assert planner.observe([result("java developer", range(0, 20))]) == 1
+    assert planner.observe([result("java developer", [], error="boom")]) == 0
+    assert planner.stats()['saved'] == 1
+
+    # After the recheck interval the dropped query runs once more
+    clock.now += 3600
+    assert planner.plan(queries) == queries
+    planner.observe([result("java spring boot", range(5, 15))])
+    assert len(planner.plan(queries)) == 3
+    print("✅ Query subsumption working")
+
+if __name__ == "__main__":
+    test_normalizes_and_dedups()
+    test_learns_subsumed_queries()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Test the adaptive per-query scheduler"""
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scraper.scheduler import AdaptiveScheduler
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def make_scheduler(clock, jitter=0.0):
+    keys = [("python", "LinkedIn"), ("python", "Naukri"), ("rust", "LinkedIn")]
+    return AdaptiveScheduler(keys, base_interval=1800, min_interval=600, max_interval=7200,
+                             jitter=jitter, tighten=0.5, relax=1.5, clock=clock, rng=random.Random(7))
+
+def test_intervals_follow_yield():
+    """Productive queries tighten, idle and failing ones relax, all within bounds"""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    assert len(scheduler.due(window=0)) == 3
+
+    for _ in range(5):
+        scheduler.record(("python", "LinkedIn"), new_jobs=4)
+        scheduler.record(("python", "Naukri"), new_jobs=0)
+        scheduler.record(("rust", "LinkedIn"), new_jobs=2, failed=True)
+
+    entries = scheduler.stats()['entries']
+    assert entries[("python", "LinkedIn")]['interval'] == 600
+    assert entries[("python", "Naukri")]['interval'] == 7200
+    assert entries[("rust", "LinkedIn")]['interval'] == 7200
+    assert entries[("python", "LinkedIn")]['new_jobs'] == 20
+
+    assert scheduler.due(window=0) == []
+    clock.now += 600
+    assert scheduler.due(window=0) == [("python", "LinkedIn")]
+    assert scheduler.seconds_until_next() == 0
+    print("✅ Adaptive intervals working")
+
+def test_jitter_and_batching():
+    """Next runs are jittered within bounds; queries due soon join the current cycle"""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, jitter=0.2)
+    for key in list(scheduler.stats()['entries']):
+        scheduler.record(key, new_jobs=1)
+
+    next_runs = [entry['next_run'] - clock.now for entry in scheduler.stats()['entries'].values()]
+    assert all(900 * 0.8 <= delay <= 900 * 1.2 for delay in next_runs), next_runs
+    assert len(set(next_runs)) == 3
+
+    clock.now += min(next_runs)
+    assert len(scheduler.due(window=0)) == 1
+    assert len(scheduler.due(window=max(next_runs) - min(next_runs))) == 3
+    print("✅ Scheduler jitter working")
+
+def test_sync_keys():
+    """Added queries are due at once, removed ones stop, existing ones keep their interval"""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    scheduler.record(("python", "LinkedIn"), new_jobs=3)
+
+    scheduler.sync([("python", "LinkedIn"), ("go", "Naukri")])
+    entries = scheduler.stats()['entries']
+    assert set(entries) == {("python", "LinkedIn"), ("go", "Naukri")}
+    assert entries[("python", "LinkedIn")]['interval'] == 900
+    assert scheduler.due(window=0) == [("go", "Naukri")]
+    print("✅ Scheduler key sync working")
+
+if __name__ == "__main__":
+    test_intervals_follow_yield()
+    test_jitter_and_batching()
+    test_sync_keys()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Test the requests-based scrapers offline against the local stand-in server"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+
+from standin import start_standin
+import scraper.linkedin_scraper as linkedin_scraper
+import scraper.naukri_fallback as naukri_fallback
+from scraper.fetch_cache import get_fetch_cache
+
+def scrape_both():
+    """Jobs from both scrapers against a fresh stand-in server"""
+    server, base_url = start_standin()
+    original = (linkedin_scraper.LINKEDIN_BASE_URL, naukri_fallback.NAUKRI_BASE_URL)
+    linkedin_scraper.LINKEDIN_BASE_URL = naukri_fallback.NAUKRI_BASE_URL = base_url
+
+    try:
+        return (list(linkedin_scraper.scrape_linkedin_jobs("java developer", "remote")),
+                list(naukri_fallback.scrape_naukri_fallback("java developer", "remote")))
+    finally:
+        linkedin_scraper.LINKEDIN_BASE_URL, naukri_fallback.NAUKRI_BASE_URL = original
+        server.shutdown()
+
+def test_scrapers_against_standin():
+    """Both scrapers fetch, parse and keyword-filter the recorded pages"""
+    linkedin_jobs, naukri_jobs = scrape_both()
+
+    assert linkedin_jobs and naukri_jobs
+    assert all('?' not in job['link'] and job['source'] == 'LinkedIn' for job in linkedin_jobs)
+    assert all(job['link'].startswith("https://www.naukri.com/job-listings-") for job in naukri_jobs)
+    assert not any(job['title'] in ("Marketing Manager", "Sales Executive") for job in linkedin_jobs + naukri_jobs)
+    print("✅ Offline scraping working")
+
+def test_streamed_scrapers_match():
+    """With STREAM_PARSE the scrapers yield the same jobs from the chunked parser"""
+    get_fetch_cache().clear()
+    buffered = scrape_both()
+
+    get_fetch_cache().clear()
+    linkedin_scraper.STREAM_PARSE = naukri_fallback.STREAM_PARSE = True
+    try:
+        streamed = scrape_both()
+    finally:
+        linkedin_scraper.STREAM_PARSE = naukri_fallback.STREAM_PARSE = False
+
+    strip = lambda jobs: [{k: v for k, v in job.items() if k != 'posted_at'} for job in jobs]
+    assert streamed[0] and streamed[1]
+    assert strip(streamed[0]) == strip(buffered[0]) and streamed[1] == buffered[1]
+    assert get_fetch_cache().stats()['streamed'] >= 2
+    print("✅ Streamed scraping working")
+
+if __name__ == "__main__":
+    test_scrapers_against_standin()
+    test_streamed_scrapers_match()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Test the subscription store and the keyword -> subscriber fan-out"""
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import db.database as database
+import db.subscriptions as subscriptions
+from utils.subscription_index import SubscriptionIndex
+
+def make_job(title, location='Remote', source='LinkedIn', query=None):
+    return {'title': title, 'location': location, 'source': source, 'link': f"https://example.com/{title}", 'query': query}
+
+def test_store_round_trip():
+    """Subscriptions persist per chat, can be replaced, paused and removed"""
+    original = database.DB_PATH
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            database.close_connection()
+            database.DB_PATH = os.path.join(tmpdir, "jobs.db")
+            subscriptions.create_subscriptions_table()
+
+            assert subscriptions.sync_default_subscription()
+            assert not subscriptions.sync_default_subscription()
+            default = subscriptions.get_subscription(subscriptions.CHAT_ID)
+            assert default['keywords'] == subscriptions.KEYWORDS
+            assert default['locations'] == [subscriptions.LOCATION] and default['sources'] == []
+
+            # Later edits to config.KEYWORDS reach the default chat on the next start; pausing survives
+            original_keywords = subscriptions.KEYWORDS
+            subscriptions.set_subscription_active(subscriptions.CHAT_ID, False)
+            try:
+                subscriptions.KEYWORDS = original_keywords[:-1] + ["kotlin developer"]
+                assert subscriptions.sync_default_subscription()
+                default = subscriptions.get_subscription(subscriptions.CHAT_ID)
+                assert default['keywords'] == subscriptions.KEYWORDS and not default['active']
+            finally:
+                subscriptions.KEYWORDS = original_keywords
+            assert subscriptions.sync_default_subscription()
+            subscriptions.set_subscription_active(subscriptions.CHAT_ID, True)
+
+            assert subscriptions.subscribe(42, ["rust"], ["berlin"], ["LinkedIn"])
+            assert subscriptions.subscribe(42, ["rust", "go"], ["berlin"], ["LinkedIn"])
+            assert subscriptions.get_subscription("42")['keywords'] == ["rust", "go"]
+            assert len(subscriptions.get_subscriptions()) == 2
+
+            assert subscriptions.set_subscription_active(42, False)
+            assert [sub['chat_id'] for sub in subscriptions.get_subscriptions()] == [subscriptions.CHAT_ID]
+            assert len(subscriptions.get_subscriptions(active_only=False)) == 2
+            assert len(subscriptions.load_subscription_index()) == 1
+
+            assert subscriptions.unsubscribe(42) and not subscriptions.unsubscribe(42)
+        finally:
+            database.close_connection()
+            database.DB_PATH = original
+    print("✅ Subscription store working")
+
+def test_shared_queries_and_fan_out():
+    """Overlapping subscribers share searches and each gets only the jobs they match"""
+    index = SubscriptionIndex([
+        {'chat_id': 1, 'keywords': ["Python", "django"], 'locations': ["remote"], 'sources': []},
+        {'chat_id': 2, 'keywords': ["python"], 'locations': ["remote", "pune"], 'sources': ["Naukri"]},
+        {'chat_id': 3, 'keywords': ["rust"], 'locations': ["remote"], 'sources': [], 'active': False},
+    ])
+    assert len(index) == 2 and index.keywords == ["django", "python"]
+
+    queries = index.queries(['LinkedIn', 'Naukri'])
+    assert queries == [
+        ("python", "remote", "LinkedIn"), ("python", "remote", "Naukri"),
+        ("django", "remote", "LinkedIn"), ("django", "remote", "Naukri"),
+        ("python", "pune", "Naukri"),
+    ]
+
+    python_naukri = make_job("Senior Python Developer", source='Naukri', query=("python", "remote", "Naukri"))
+    django_linkedin = make_job("Django Engineer", query=("django", "remote", "LinkedIn"))
+    pune_office = make_job("Python Developer", location="Pune, India", source='Naukri', query=None)
+    rust_job = make_job("Rust Engineer")
+
+    assert index.match(python_naukri) == {"1", "2"}
+    assert index.match(django_linkedin) == {"1"}
+    assert index.match(pune_office) == {"2"}  # city on the card matches chat 2's "pune"
+    assert index.match(rust_job) == set()  # only a paused chat wants rust
+
+    assert index.fan_out([python_naukri, django_linkedin, rust_job]) == {
+        "1": [python_naukri, django_linkedin],
+        "2": [python_naukri],
+    }
+    print("✅ Subscription fan-out working")
+
+if __name__ == "__main__":
+    test_store_round_trip()
+    test_shared_queries_and_fan_out()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Test Telegram delivery (queue, rate limits, retries) with a fake poster"""
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from tg.delivery import DeliveryQueue, TokenBucket, TelegramRetryAfter, TelegramTransientError
+
+class FakePoster:
+    """Records deliveries; scripted failures are raised in order before succeeding"""
+
+    def __init__(self, failures=()):
+        self.failures = list(failures)
+        self.sent = []
+
+    def __call__(self, text, chat_id):
+        if self.failures:
+            failure = self.failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        self.sent.append((text, chat_id, time.monotonic()))
+        return True
+
+def test_queue_delivers_in_order_with_retries():
+    """429s honor retry_after, transient errors retry, and order is preserved"""
+    poster = FakePoster([TelegramRetryAfter(0.1), TelegramTransientError("502")])
+    delivery = DeliveryQueue(poster, global_rate=100, chat_rate=100, chat_burst=100, max_retries=3)
+
+    for n in range(3):
+        assert delivery.enqueue(f"job {n}", "chat")
+    assert delivery.flush(timeout=10)
+
+    assert [text for text, _, _ in poster.sent] == ["job 0", "job 1", "job 2"]
+    stats = delivery.stats()
+    assert stats['sent'] == 3 and stats['rate_limited'] == 1 and stats['retries'] == 1 and stats['depth'] == 0
+    print("✅ Delivery retries working")
+
+def test_queue_gives_up_and_counts_failures():
+    """Permanent rejections and exhausted retries are counted as failed"""
+    poster = FakePoster([False, TelegramTransientError("down")])
+    delivery = DeliveryQueue(poster, global_rate=100, chat_rate=100, chat_burst=100, max_retries=0)
+
+    delivery.enqueue("rejected", "chat")
+    delivery.enqueue("flaky", "chat")
+    delivery.enqueue("ok", "chat")
+    assert delivery.flush(timeout=5)
+
+    stats = delivery.stats()
+    assert stats['failed'] == 2 and [text for text, _, _ in poster.sent] == ["ok"]
+    print("✅ Delivery failure accounting working")
+
+def test_per_chat_rate_limit():
+    """Messages to one chat are paced by its bucket after the burst is spent"""
+    poster = FakePoster()
+    delivery = DeliveryQueue(poster, global_rate=100, chat_rate=20, chat_burst=1)
+
+    for n in range(5):
+        delivery.enqueue(f"m{n}", "chat")
+    assert delivery.flush(timeout=5)
+
+    times = [sent_at for _, _, sent_at in poster.sent]
+    assert times[-1] - times[0] >= 4 / 20 * 0.9
+    print("✅ Per-chat pacing working")
+
+def test_token_bucket_burst():
+    """A full bucket allows an immediate burst of `capacity` tokens"""
+    bucket = TokenBucket(rate=1, capacity=3)
+    started = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - started < 0.1
+    print("✅ Token bucket working")
+
+if __name__ == "__main__":
+    test_queue_delivers_in_order_with_retries()
+    test_queue_gives_up_and_counts_failures()
+    test_per_chat_rate_limit()
+    test_token_bucket_burst()
@@ -1,24 +1,75 @@
 import requests
-from config import TOKEN, CHAT_ID
+from config import TOKEN, CHAT_ID, TELEGRAM_API_URL, COMMAND_POLL_TIMEOUT
+from utils.http_client import http_get, http_post
+from tg.delivery import get_delivery_queue, TelegramRetryAfter, TelegramTransientError
 
-def send_message(text):
-    """Send a message to Telegram"""
-    url = f"https://api.telegram.org/bot{TOKEN}/sendMessage"
-    
+def api_url(method):
+    """Bot API endpoint for a method, e.g. api_url('sendMessage')"""
+    return f"{TELEGRAM_API_URL}/bot{TOKEN}/{method}"
+
+def post_message(text, chat_id=CHAT_ID):
+    """Post a message to Telegram right away.
+
+    Raises TelegramRetryAfter on 429 and TelegramTransientError on network
+    errors or 5xx; returns False if Telegram rejects the message outright.
+    """
     payload = {
-        'chat_id': CHAT_ID,
+        'chat_id': chat_id,
         'text': text,
         'parse_mode': 'Markdown',
         'disable_web_page_preview': False
     }
     
     try:
-        response = requests.post(url, data=payload, timeout=10)
-        response.raise_for_status()
-        return True
-    except Exception as e:
-        print(f"Error sending message: {e}")
+        response = http_post(api_url('sendMessage'), data=payload, timeout=10)
+    except requests.exceptions.RequestException as e:
+        raise TelegramTransientError(str(e))
+    
+    if response.status_code == 429:
+        try:
+            retry_after = response.json().get('parameters', {}).get('retry_after')
+        except ValueError:
+            retry_after = None
+        raise TelegramRetryAfter(retry_after or int(response.headers.get('Retry-After', 1)))
+    
+    if response.status_code >= 500:
+        raise TelegramTransientError(f"Telegram returned {response.status_code}")
+    
+    if response.status_code != 200:
+        print(f"Error sending message: {response.status_code} {response.text[:200]}")
         return False
+    
+    return True
+
+def get_updates(offset=None, timeout=COMMAND_POLL_TIMEOUT):
+    """Long-poll Telegram for new updates (blocks up to `timeout` seconds when there are none).
+
+    Raises TelegramRetryAfter on 429 and TelegramTransientError on network errors or bad answers.
+    """
+    params = {'timeout': timeout, 'allowed_updates': '["message"]'}
+    if offset is not None:
+        params['offset'] = offset
+    
+    try:
+        response = http_get(api_url('getUpdates'), params=params, timeout=timeout + 10)
+    except requests.exceptions.RequestException as e:
+        raise TelegramTransientError(str(e))
+    
+    if response.status_code == 429:
+        raise TelegramRetryAfter(int(response.headers.get('Retry-After', 5)))
+    
+    try:
+        body = response.json()
+    except ValueError:
+        body = {}
+    if response.status_code != 200 or not body.get('ok'):
+        raise TelegramTransientError(f"getUpdates returned {response.status_code}: {body.get('description', '')}")
+    
+    return body.get('result', [])
+
+def send_message(text, chat_id=CHAT_ID):
+    """Queue a message for background delivery to Telegram"""
+    return get_delivery_queue().enqueue(text, chat_id)
 
 def send_job_alert(job):
     """Send a single job alert"""
@@ -26,8 +77,8 @@ def send_job_alert(job):
     message = format_job_text(job)
     return send_message(message)
 
-def send_bulk_alerts(jobs):
-    """Send multiple job alerts"""
+def send_bulk_alerts(jobs, chat_id=CHAT_ID):
+    """Queue multiple job alerts, returning how many were accepted"""
     from utils.helpers import format_job_text
     
     if not jobs:
@@ -36,11 +87,27 @@ def send_bulk_alerts(jobs):
     sent_count = 0
     for job in jobs:
         message = format_job_text(job)
-        if send_message(message):
+        if send_message(message, chat_id):
             sent_count += 1
     
     return sent_count
 
+def send_digest_alerts(jobs, chat_id=CHAT_ID):
+    """Queue jobs packed into as few digest messages as fit, returning how many messages were queued"""
+    from utils.helpers import format_job_digest
+    
+    if not jobs:
+        return 0
+    
+    messages = format_job_digest(jobs)
+    queued_count = 0
+    for message in messages:
+        if send_message(message, chat_id):
+            queued_count += 1
+    
+    print(f"📦 Digest for {chat_id}: {len(jobs)} jobs packed into {len(messages)} messages")
+    return queued_count
+
 def send_summary(total_found, total_sent):
     """Send a summary of the scraping session"""
     summary = f"📊 **Job Alert Summary**\n"
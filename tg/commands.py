@@ -0,0 +1,187 @@
+import asyncio
+
+from config import CHAT_ID, COMMAND_POLL_TIMEOUT, COMMAND_RESULTS_LIMIT
+from db.database import get_sent_jobs_count, get_latest_jobs, search_jobs
+from db.seen_index import get_seen_index
+from db.subscriptions import get_subscription, get_subscriptions, set_subscription_active
+from scraper.health import get_source_health, format_source_health
+from scraper.pipeline import CYCLE_SECONDS
+from tg.bot import get_updates, post_message, send_message
+from tg.delivery import get_delivery_queue, TelegramRetryAfter, TelegramTransientError
+from utils.helpers import escape_markdown, log_message
+from utils.metrics import histogram
+
+COMMAND_SECONDS = histogram('telegram_command_seconds', 'Time to answer one bot command, per command')
+
+HELP_TEXT = """🤖 Commands
+/stats - bot and scraping status
+/search <term> - stored jobs matching a title, company or location
+/latest [N] - the newest stored jobs
+/pause - stop your alerts
+/resume - restart your alerts
+/scrape now - run every query on the next tick (admin)"""
+
+def reply(text, chat_id):
+    """Answer a command right away, falling back to the delivery queue if Telegram pushes back"""
+    try:
+        return post_message(text, chat_id)
+    except (TelegramRetryAfter, TelegramTransientError):
+        return send_message(text, chat_id)
+
+def format_job_list(header, jobs):
+    """One line per job: linked title, company and source"""
+    lines = [header]
+    for job in jobs:
+        lines.append(f"• [{escape_markdown(job['title'])}]({job['link']}) - "
+                     f"{escape_markdown(job['company'])} ({escape_markdown(job['source'])})")
+    return "\n".join(lines)
+
+class CommandBot:
+    """Answers Telegram commands from a getUpdates long-poll loop.
+
+    Polling and command handling run in executor threads driven by an asyncio
+    loop, so a slow answer or a scrape cycle never blocks the other. Answers
+    come from the database and in-memory stats only; nothing here scrapes.
+    `scheduler` and `on_scrape` (called after /scrape now) are optional.
+    """
+
+    def __init__(self, scheduler=None, on_scrape=None, admin_chat_id=CHAT_ID,
+                 poll_timeout=COMMAND_POLL_TIMEOUT, send=reply):
+        self.scheduler = scheduler
+        self.on_scrape = on_scrape
+        self.admin_chat_id = str(admin_chat_id)
+        self.poll_timeout = poll_timeout
+        self.send = send
+        self.offset = None
+        self.handlers = {
+            '/start': self.cmd_help,
+            '/help': self.cmd_help,
+            '/stats': self.cmd_stats,
+            '/search': self.cmd_search,
+            '/latest': self.cmd_latest,
+            '/pause': self.cmd_pause,
+            '/resume': self.cmd_resume,
+            '/scrape': self.cmd_scrape,
+        }
+
+    def handle(self, text, chat_id):
+        """Reply text for one message, or None if it isn't a command"""
+        if not text or not text.startswith('/'):
+            return None
+        command, _, args = text.strip().partition(' ')
+        command = command.split('@')[0].lower()  # "/stats@SomeBot" in group chats
+        handler = self.handlers.get(command)
+        if handler is None:
+            return f"❓ Unknown command {escape_markdown(command)}\n\n{HELP_TEXT}"
+
+        chat_id = str(chat_id)
+        if chat_id != self.admin_chat_id and get_subscription(chat_id) is None:
+            return "🔒 This chat has no subscription."
+
+        with COMMAND_SECONDS.time(command=command):
+            return handler(args.strip(), chat_id)
+
+    def cmd_help(self, args, chat_id):
+        return HELP_TEXT
+
+    def cmd_stats(self, args, chat_id):
+        index = get_seen_index().stats()
+        delivery = get_delivery_queue().stats()
+        lines = [
+            "📊 Bot Stats",
+            f"🗃️ Jobs in DB: {get_sent_jobs_count()}",
+            f"👥 Subscribers: {len(get_subscriptions())}",
+            f"🧠 Seen index: {index['size']} links ({index['hit_rate']:.0%} hit rate)",
+        ]
+
+        cycles = CYCLE_SECONDS.summary().get((), {})
+        if cycles:
+            lines.append(f"🔄 Cycles: {cycles['count']} | p50 {cycles['p50']:.1f}s, max {cycles['max']:.1f}s")
+        if self.scheduler:
+            schedule = self.scheduler.stats()
+            next_run = self.scheduler.seconds_until_next() or 0.0
+            lines.append(f"⏱️ Queries: {schedule['keys']} | intervals {schedule['min_interval'] / 60:.0f}-"
+                         f"{schedule['max_interval'] / 60:.0f} min | next in {next_run / 60:.1f} min")
+
+        lines.append(f"📬 Telegram queue: {delivery['depth']} waiting, {delivery['sent']} sent, {delivery['failed']} failed")
+        health = get_source_health()
+        if health:
+            lines.append(f"🚦 Sources: {format_source_health(health)}")
+
+        subscription = get_subscription(chat_id)
+        if subscription:
+            lines.append(f"🔔 Your alerts: {'on' if subscription['active'] else 'paused'} "
+                         f"({len(subscription['keywords'])} keywords)")
+        return "\n".join(lines)
+
+    def cmd_search(self, args, chat_id):
+        if not args:
+            return "Usage: /search <term>"
+        jobs = search_jobs(args, COMMAND_RESULTS_LIMIT)
+        if not jobs:
+            return f"🔍 No stored jobs match \"{escape_markdown(args)}\""
+        return format_job_list(f"🔍 {len(jobs)} jobs matching \"{escape_markdown(args)}\"", jobs)
+
+    def cmd_latest(self, args, chat_id):
+        try:
+            count = int(args) if args else 5
+        except ValueError:
+            return "Usage: /latest [N]"
+        jobs = get_latest_jobs(max(1, min(count, COMMAND_RESULTS_LIMIT)))
+        if not jobs:
+            return "📭 No jobs stored yet"
+        return format_job_list(f"🆕 Latest {len(jobs)} jobs", jobs)
+
+    def cmd_pause(self, args, chat_id):
+        if not set_subscription_active(chat_id, False):
+            return "This chat has no subscription to pause."
+        return "⏸️ Alerts paused. Send /resume to restart them."
+
+    def cmd_resume(self, args, chat_id):
+        if not set_subscription_active(chat_id, True):
+            return "This chat has no subscription to resume."
+        return "▶️ Alerts resumed."
+
+    def cmd_scrape(self, args, chat_id):
+        if chat_id != self.admin_chat_id:
+            return "🔒 Only the admin chat can trigger a scrape."
+        if args.lower() not in ('', 'now'):
+            return "Usage: /scrape now"
+        if self.scheduler:
+            self.scheduler.expedite()
+        if self.on_scrape:
+            self.on_scrape()
+        return "🔄 Scrape queued; every query runs on the next tick."
+
+    async def poll_once(self):
+        """Fetch one batch of updates and answer each command; returns how many updates arrived"""
+        loop = asyncio.get_running_loop()
+        updates = await loop.run_in_executor(None, get_updates, self.offset, self.poll_timeout)
+        for update in updates:
+            self.offset = update['update_id'] + 1
+            message = update.get('message') or {}
+            chat_id = message.get('chat', {}).get('id')
+            if chat_id is None:
+                continue
+
+            try:
+                answer = await loop.run_in_executor(None, self.handle, message.get('text'), chat_id)
+                if answer:
+                    await loop.run_in_executor(None, self.send, answer, chat_id)
+            except Exception as e:
+                log_message(f"❌ Error answering {message.get('text')!r}: {e}")
+        return len(updates)
+
+    async def poll_forever(self):
+        """Long-poll for commands until cancelled, backing off on errors"""
+        backoff = 1
+        while True:
+            try:
+                await self.poll_once()
+                backoff = 1
+            except TelegramRetryAfter as e:
+                await asyncio.sleep(e.retry_after)
+            except Exception as e:
+                log_message(f"⚠️ Command polling failed: {e} (retrying in {backoff}s)")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60)
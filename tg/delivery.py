@@ -0,0 +1,177 @@
+import queue
+import threading
+import time
+from collections import deque
+
+from config import (
+    TELEGRAM_GLOBAL_RATE, TELEGRAM_CHAT_RATE, TELEGRAM_CHAT_BURST,
+    TELEGRAM_MAX_RETRIES, TELEGRAM_QUEUE_SIZE,
+)
+from utils.metrics import counter, histogram
+
+SEND_SECONDS = histogram('telegram_send_seconds', 'Latency of one sendMessage call')
+DELIVERY_SECONDS = histogram('telegram_delivery_seconds', 'Time from enqueue to successful delivery')
+EVENTS = counter('telegram_events', 'Delivery queue events: enqueued, sent, failed, dropped, retries, rate_limited')
+
+class TelegramRetryAfter(Exception):
+    """Telegram answered 429; the message may be retried after `retry_after` seconds"""
+
+    def __init__(self, retry_after):
+        super().__init__(f"rate limited, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+class TelegramTransientError(Exception):
+    """Network error or 5xx from Telegram; the message may be retried"""
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, holding at most `capacity`"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+class DeliveryQueue:
+    """Background sender for outbound Telegram messages.
+
+    Messages are delivered in order by one worker thread, paced by a global
+    token bucket and one bucket per chat. A 429 pauses delivery for the
+    `retry_after` Telegram asks for; network errors and 5xx are retried with
+    exponential backoff up to `max_retries` times before the message is dropped.
+    """
+
+    def __init__(self, post_func, global_rate=TELEGRAM_GLOBAL_RATE, chat_rate=TELEGRAM_CHAT_RATE,
+                 chat_burst=TELEGRAM_CHAT_BURST, max_retries=TELEGRAM_MAX_RETRIES, max_size=TELEGRAM_QUEUE_SIZE):
+        self._post = post_func
+        self._global_bucket = TokenBucket(global_rate, global_rate)
+        self._chat_rate = chat_rate
+        self._chat_burst = chat_burst
+        self._chat_buckets = {}
+        self.max_retries = max_retries
+        self._queue = queue.Queue(maxsize=max_size)
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._latencies = deque(maxlen=500)
+        self._stats = {
+            'enqueued': 0,
+            'sent': 0,
+            'failed': 0,
+            'dropped': 0,
+            'retries': 0,
+            'rate_limited': 0,
+        }
+
+    def _count(self, key, amount=1):
+        EVENTS.inc(amount, event=key)
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _ensure_worker(self):
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="telegram-delivery", daemon=True)
+                self._worker.start()
+
+    def enqueue(self, text, chat_id):
+        """Queue a message for delivery; returns False if the queue is full"""
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait((text, chat_id, time.monotonic()))
+        except queue.Full:
+            print("⚠️ Telegram delivery queue full, dropping message")
+            self._count('dropped')
+            return False
+
+        self._count('enqueued')
+        return True
+
+    def _chat_bucket(self, chat_id):
+        if chat_id not in self._chat_buckets:
+            self._chat_buckets[chat_id] = TokenBucket(self._chat_rate, self._chat_burst)
+        return self._chat_buckets[chat_id]
+
+    def _deliver(self, text, chat_id):
+        attempt = 0
+        while True:
+            self._global_bucket.acquire()
+            self._chat_bucket(chat_id).acquire()
+            try:
+                with SEND_SECONDS.time():
+                    return self._post(text, chat_id)
+            except TelegramRetryAfter as e:
+                # Doesn't count against max_retries: Telegram told us exactly when to come back
+                self._count('rate_limited')
+                print(f"⏳ Telegram rate limit, retrying in {e.retry_after}s")
+                time.sleep(e.retry_after)
+            except TelegramTransientError as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    print(f"❌ Giving up on Telegram message after {self.max_retries} retries: {e}")
+                    return False
+                self._count('retries')
+                time.sleep(min(2 ** attempt, 60))
+
+    def _run(self):
+        while True:
+            text, chat_id, enqueued_at = self._queue.get()
+            try:
+                if self._deliver(text, chat_id):
+                    self._count('sent')
+                    latency = time.monotonic() - enqueued_at
+                    DELIVERY_SECONDS.observe(latency)
+                    with self._stats_lock:
+                        self._latencies.append(latency)
+                else:
+                    self._count('failed')
+            except Exception as e:
+                print(f"Error delivering Telegram message: {e}")
+                self._count('failed')
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout=None):
+        """Wait until every queued message has been handled; returns False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def stats(self):
+        """Queue depth, delivery counters and enqueue-to-sent latency"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+            latencies = sorted(self._latencies)
+        stats['depth'] = self._queue.qsize()
+        stats['latency_p50'] = latencies[len(latencies) // 2] if latencies else 0.0
+        stats['latency_max'] = latencies[-1] if latencies else 0.0
+        return stats
+
+_delivery_queue = None
+_delivery_lock = threading.Lock()
+
+def get_delivery_queue():
+    """Get the process-wide Telegram delivery queue, creating it on first use"""
+    global _delivery_queue
+    with _delivery_lock:
+        if _delivery_queue is None:
+            from tg.bot import post_message
+            _delivery_queue = DeliveryQueue(post_message)
+        return _delivery_queue
@@ -0,0 +1,207 @@
+import hashlib
+import random
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from urllib.parse import urlsplit, urlunsplit
+
+from config import SEEN_INDEX_MAX_ENTRIES, NEAR_DUPLICATE_THRESHOLD
+
+LINKEDIN_JOB_ID = re.compile(r'linkedin\.com/jobs/view/(?:[^/?#]*-)?(\d+)')
+NAUKRI_JOB_ID = re.compile(r'naukri\.com/job-listings-[^?#]*?-(\d{6,})')
+NON_WORD = re.compile(r'[^a-z0-9+#]+')
+
+TITLE_NOISE = {
+    'hiring', 'urgent', 'urgently', 'immediate', 'joiner', 'joiners', 'job', 'opening',
+    'openings', 'for', 'the', 'a', 'an', 'and', 'remote', 'wfh', 'work', 'from', 'home',
+    'hybrid', 'onsite', 'position', 'role',
+}
+COMPANY_SUFFIXES = {'pvt', 'private', 'ltd', 'limited', 'inc', 'llc', 'llp', 'corp', 'corporation', 'co'}
+REMOTE_MARKERS = ('remote', 'work from home', 'wfh', 'anywhere')
+
+# MinHash over title shingles, banded for locality-sensitive lookup
+NUM_PERMUTATIONS = 32
+BANDS = 8
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1337)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERMUTATIONS)]
+
+def normalize_link(link):
+    """Normalize a job link for dedup: lowercase host, no query/fragment, no trailing slash"""
+    if not link:
+        return ""
+
+    parts = urlsplit(link.strip())
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, '', ''))
+
+def canonical_link(link):
+    """Reduce a job link to its stable identity (job id for LinkedIn/Naukri, normalized URL otherwise)"""
+    link = normalize_link(link)
+
+    match = LINKEDIN_JOB_ID.search(link)
+    if match:
+        return f"https://www.linkedin.com/jobs/view/{match.group(1)}"
+
+    match = NAUKRI_JOB_ID.search(link)
+    if match:
+        return f"https://www.naukri.com/job-listings-{match.group(1)}"
+
+    return link
+
+def _words(text):
+    return NON_WORD.sub(' ', (text or '').lower()).split()
+
+def normalize_title(title):
+    """Lowercase title without punctuation and recruiting noise words"""
+    return ' '.join(word for word in _words(title) if word not in TITLE_NOISE)
+
+def normalize_company(company):
+    """Lowercase company name without legal suffixes"""
+    return ' '.join(word for word in _words(company) if word not in COMPANY_SUFFIXES)
+
+def normalize_location(location):
+    """Collapse a location to 'remote' or its first place name"""
+    location = (location or '').lower()
+    if any(marker in location for marker in REMOTE_MARKERS):
+        return 'remote'
+    return ' '.join(_words(location.split(',')[0]))
+
+def job_fingerprint(job):
+    """Stable hash of normalized title, company and location, shared across sources"""
+    key = '|'.join((normalize_title(job['title']), normalize_company(job['company']), normalize_location(job['location'])))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+def title_signature(title):
+    """MinHash signature over the title's words and word bigrams"""
+    words = normalize_title(title).split()
+    shingles = set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+    if not shingles:
+        return None
+
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'big') for s in shingles]
+    return tuple(min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+def estimate_similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two MinHash signatures"""
+    return sum(a == b for a, b in zip(sig_a, sig_b)) / NUM_PERMUTATIONS
+
+class DedupEngine:
+    """Collapses jobs that share a fingerprint or have near-identical titles at the same company/location.
+
+    Exact fingerprints are a dict lookup; near-duplicates are found through MinHash
+    LSH bands scoped to (company, location), so each check only compares against
+    a handful of candidates. Memory is bounded to max_entries, oldest first.
+    """
+
+    def __init__(self, max_entries, threshold):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self._entries = OrderedDict()  # fingerprint -> (group, signature, seen_at)
+        self._bands = defaultdict(set)  # (group, band, band values) -> fingerprints
+        self._lock = threading.Lock()
+        self.exact_hits = 0
+        self.near_hits = 0
+
+    def _band_keys(self, group, signature):
+        return [
+            (group, band, signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND])
+            for band in range(BANDS)
+        ]
+
+    def _remove(self, fingerprint):
+        group, signature, _ = self._entries.pop(fingerprint)
+        if signature is None:
+            return
+        for key in self._band_keys(group, signature):
+            bucket = self._bands.get(key)
+            if bucket is not None:
+                bucket.discard(fingerprint)
+                if not bucket:
+                    del self._bands[key]
+
+    def check(self, job):
+        """Return 'exact' or 'near' if the job duplicates a known one, else None"""
+        fingerprint = job_fingerprint(job)
+        with self._lock:
+            if fingerprint in self._entries:
+                self.exact_hits += 1
+                return 'exact'
+
+        # Only pay for the MinHash signature once the cheap exact lookup has missed
+        group = (normalize_company(job['company']), normalize_location(job['location']))
+        signature = title_signature(job['title'])
+        if signature is None:
+            return None
+
+        with self._lock:
+
+            candidates = set()
+            for key in self._band_keys(group, signature):
+                candidates |= self._bands.get(key, set())
+
+            for candidate in candidates:
+                if estimate_similarity(signature, self._entries[candidate][1]) >= self.threshold:
+                    self.near_hits += 1
+                    return 'near'
+
+        return None
+
+    def add(self, job, seen_at=None):
+        """Remember a job so later copies of it are collapsed"""
+        fingerprint = job_fingerprint(job)
+        group = (normalize_company(job['company']), normalize_location(job['location']))
+        signature = title_signature(job['title'])
+
+        with self._lock:
+            if fingerprint in self._entries:
+                return
+            self._entries[fingerprint] = (group, signature, seen_at if seen_at is not None else time.time())
+            if signature is not None:
+                for key in self._band_keys(group, signature):
+                    self._bands[key].add(fingerprint)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def discard(self, job):
+        """Forget a job, e.g. when storing it failed"""
+        fingerprint = job_fingerprint(job)
+        with self._lock:
+            if fingerprint in self._entries:
+                self._remove(fingerprint)
+
+    def evict_older_than(self, cutoff):
+        """Forget jobs first seen before the cutoff (epoch seconds)"""
+        removed = 0
+        with self._lock:
+            while self._entries:
+                fingerprint, (_, _, seen_at) = next(iter(self._entries.items()))
+                if seen_at >= cutoff:
+                    break
+                self._remove(fingerprint)
+                removed += 1
+        return removed
+
+    def clear(self):
+        """Forget every job"""
+        with self._lock:
+            self._entries.clear()
+            self._bands.clear()
+
+    def stats(self):
+        """Size and duplicate counters"""
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'exact_hits': self.exact_hits,
+                'near_hits': self.near_hits,
+            }
+
+_dedup_engine = DedupEngine(SEEN_INDEX_MAX_ENTRIES, NEAR_DUPLICATE_THRESHOLD)
+
+def get_dedup_engine():
+    """Get the process-wide cross-source dedup engine"""
+    return _dedup_engine
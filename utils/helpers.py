@@ -1,72 +1,149 @@
 import re
 from datetime import datetime, timedelta
-from config import KEYWORDS
+from functools import lru_cache
+from config import KEYWORDS, KEYWORD_WEIGHTS
+from utils.keyword_matcher import get_keyword_matcher
+
+# Keywords the scrapers filter titles on when none are passed (see use_keywords)
+_default_keywords = tuple(KEYWORDS)
+
+def use_keywords(keywords):
+    """Make `keywords` (e.g. every subscriber's keywords) the default for the helpers below"""
+    global _default_keywords
+    _default_keywords = tuple(keywords)
+
+def _matcher(keywords=None):
+    if keywords is None:
+        return get_keyword_matcher(_default_keywords, tuple(KEYWORD_WEIGHTS.items()))
+    return get_keyword_matcher(tuple(keywords))
 
 def contains_keywords(text, keywords=None):
     """Check if text contains any of the keywords"""
-    if keywords is None:
-        keywords = KEYWORDS
-    
-    text_lower = text.lower()
-    return any(keyword.lower() in text_lower for keyword in keywords)
+    return _matcher(keywords).contains(text)
+
+def match_keywords(text, keywords=None):
+    """Return the keywords found in text"""
+    return _matcher(keywords).matches(text)
+
+def keyword_score(text, keywords=None):
+    """Weighted relevance of text (see config.KEYWORD_WEIGHTS)"""
+    return _matcher(keywords).score(text)
+
+MARKDOWN_SPECIAL = re.compile(r'([_*`\[])')
+
+TELEGRAM_MESSAGE_LIMIT = 4096
+DIGEST_HEADER_RESERVE = 64  # room kept for the "New jobs (x-y of z)" header
+
+def telegram_length(text):
+    """Message length as Telegram counts it (UTF-16 code units, so most emoji count twice)"""
+    return len(text.encode('utf-16-le')) // 2
+
+def escape_markdown(text):
+    """Escape characters that Telegram's legacy Markdown would treat as formatting"""
+    return MARKDOWN_SPECIAL.sub(r'\\\1', str(text))
 
 def format_job_text(job):
     """Format job information for Telegram message with posting time"""
-    message = f"🏢 **{job['title']}**\n"
-    message += f"🏭 **Company:** {job['company']}\n"
-    message += f"📍 **Location:** {job['location']}\n"
+    message = f"🏢 **{escape_markdown(job['title'])}**\n"
+    message += f"🏭 **Company:** {escape_markdown(job['company'])}\n"
+    message += f"📍 **Location:** {escape_markdown(job['location'])}\n"
     
     if job.get('posted_time'):
-        message += f"⏰ **Posted:** {job['posted_time']}\n"
+        message += f"⏰ **Posted:** {escape_markdown(job['posted_time'])}\n"
     
     message += f"🔗 **Apply:** [Link]({job['link']})\n"
-    message += f"📱 **Source:** {job['source']}"
+    message += f"📱 **Source:** {escape_markdown(job['source'])}"
     
     return message
 
+def format_job_digest(jobs, limit=TELEGRAM_MESSAGE_LIMIT):
+    """Pack formatted jobs into as few messages as fit Telegram's length limit.
+
+    Messages only split between jobs; each gets a "New jobs (x-y of z)" header.
+    """
+    budget = limit - DIGEST_HEADER_RESERVE
+    separator = "\n\n"
+    
+    groups = []
+    current, current_len = [], 0
+    for job in jobs:
+        block = format_job_text(job)
+        if telegram_length(block) > budget:
+            # A posting with an absurdly long title is shortened rather than dropped
+            block = format_job_text(dict(job, title=job['title'][:200] + "…"))
+        
+        added = telegram_length(block) + (len(separator) if current else 0)
+        if current and current_len + added > budget:
+            groups.append(current)
+            current, current_len = [], 0
+            added = telegram_length(block)
+        current.append(block)
+        current_len += added
+    if current:
+        groups.append(current)
+    
+    messages = []
+    first = 1
+    for group in groups:
+        last = first + len(group) - 1
+        header = f"📋 New jobs ({first}-{last} of {len(jobs)})"
+        messages.append(header + separator + separator.join(group))
+        first = last + 1
+    
+    return messages
+
 def clean_text(text):
     """Clean and normalize text"""
     if text:
         return re.sub(r'\s+', ' ', text.strip())
     return "Not specified"
 
-def parse_relative_time(time_text):
-    """Parse relative time strings like '2 hours ago', '1 day ago', etc."""
+UNIT_SECONDS = {
+    'second': 1,
+    'minute': 60,
+    'hour': 60 * 60,
+    'day': 24 * 60 * 60,
+    'week': 7 * 24 * 60 * 60,
+    'month': 30 * 24 * 60 * 60,
+    'year': 365 * 24 * 60 * 60,
+}
+UNIT_ALIASES = {'sec': 'second', 'min': 'minute', 'hr': 'hour', 'mo': 'month', 'yr': 'year'}
+FUZZY_COUNTS = {'a': 1, 'an': 1, 'one': 1, 'few': 3, 'several': 3}
+
+# One pass over the text covers every unit plus "just now" / "today" / "yesterday" / "30+ days"
+RELATIVE_TIME_PATTERN = re.compile(
+    r'(?P<now>just now|moments? ago|right now|today)'
+    r'|(?P<yesterday>yesterday)'
+    r'|\b(?P<count>\d+|an?|one|few|several)\+?\s*'
+    r'(?P<unit>second|sec|minute|min|hour|hr|day|week|month|mo|year|yr)s?\b'
+)
+
+@lru_cache(maxsize=2048)
+def parse_age_seconds(time_text):
+    """Parse relative time text ('2 hours ago', '30+ days ago', 'just now') into an age in seconds"""
     if not time_text:
         return None
     
-    time_text = time_text.lower().strip()
-    
-    # Patterns for relative time
-    patterns = {
-        r'(\d+)\s*seconds? ago': 'seconds',
-        r'(\d+)\s*minutes? ago': 'minutes',
-        r'(\d+)\s*hours? ago': 'hours',
-        r'(\d+)\s*days? ago': 'days',
-        r'(\d+)\s*weeks? ago': 'weeks',
-        r'(\d+)\s*months? ago': 'months',
-    }
+    match = RELATIVE_TIME_PATTERN.search(time_text.lower())
+    if not match:
+        return None
     
-    for pattern, unit in patterns.items():
-        match = re.search(pattern, time_text)
-        if match:
-            value = int(match.group(1))
-            now = datetime.now()
-            
-            if unit == 'seconds':
-                return now - timedelta(seconds=value)
-            elif unit == 'minutes':
-                return now - timedelta(minutes=value)
-            elif unit == 'hours':
-                return now - timedelta(hours=value)
-            elif unit == 'days':
-                return now - timedelta(days=value)
-            elif unit == 'weeks':
-                return now - timedelta(weeks=value)
-            elif unit == 'months':
-                return now - timedelta(days=value*30)
+    if match.group('now'):
+        return 0
+    if match.group('yesterday'):
+        return UNIT_SECONDS['day']
     
-    return None
+    count = match.group('count')
+    count = int(count) if count.isdigit() else FUZZY_COUNTS[count]
+    unit = UNIT_ALIASES.get(match.group('unit'), match.group('unit'))
+    return count * UNIT_SECONDS[unit]
+
+def parse_relative_time(time_text):
+    """Parse relative time strings like '2 hours ago', '1 day ago', etc."""
+    age = parse_age_seconds(time_text.strip() if time_text else time_text)
+    if age is None:
+        return None
+    return datetime.now() - timedelta(seconds=age)
 
 def format_posted_time(posted_date):
     """Format the posted time in a user-friendly way"""
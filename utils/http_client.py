@@ -0,0 +1,102 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+
+from config import REQUEST_TIMEOUT, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_MAX_RETRIES, HTTP_BACKOFF_FACTOR
+from utils.metrics import counter, histogram
+
+_session = None
+_session_lock = threading.Lock()
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+REQUEST_SECONDS = histogram('http_request_seconds', 'HTTP request latency per host')
+RESPONSES = counter('http_responses', 'HTTP responses per host and status ("error" for network failures)')
+
+def _build_session():
+    """Create a keep-alive session with per-host connection pools and retry/backoff"""
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=(500, 502, 503, 504),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # Only advertise encodings urllib3 can actually decode (br needs the brotli package)
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    return session
+
+def get_session():
+    """Get the process-wide HTTP session, creating it on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _build_session()
+        return _session
+
+def _record(host, elapsed, response=None, failed=False, streamed=False):
+    REQUEST_SECONDS.observe(elapsed, host=host)
+    RESPONSES.inc(host=host, status=response.status_code if response is not None else 'error')
+    with _stats_lock:
+        entry = _stats.setdefault(host, {
+            'requests': 0,
+            'errors': 0,
+            'total_seconds': 0.0,
+            'max_seconds': 0.0,
+            'bytes': 0,
+        })
+        entry['requests'] += 1
+        entry['total_seconds'] += elapsed
+        entry['max_seconds'] = max(entry['max_seconds'], elapsed)
+        if failed or (response is not None and response.status_code >= 400):
+            entry['errors'] += 1
+        if response is not None and not streamed:
+            entry['bytes'] += len(response.content)
+
+def request(method, url, headers=None, timeout=REQUEST_TIMEOUT, **kwargs):
+    """Send a request through the shared session and record its timing per host"""
+    if headers and 'Accept-Encoding' in headers:
+        headers = {**headers, 'Accept-Encoding': ACCEPT_ENCODING}
+
+    host = urlsplit(url).netloc
+    started = time.monotonic()
+    try:
+        response = get_session().request(method, url, headers=headers, timeout=timeout, **kwargs)
+    except requests.exceptions.RequestException:
+        _record(host, time.monotonic() - started, failed=True)
+        raise
+
+    _record(host, time.monotonic() - started, response, streamed=kwargs.get('stream', False))
+    return response
+
+def http_get(url, headers=None, timeout=REQUEST_TIMEOUT, **kwargs):
+    """GET through the shared session"""
+    return request('GET', url, headers=headers, timeout=timeout, **kwargs)
+
+def http_post(url, data=None, timeout=REQUEST_TIMEOUT, **kwargs):
+    """POST through the shared session"""
+    return request('POST', url, data=data, timeout=timeout, **kwargs)
+
+def get_http_stats():
+    """Per-host request counts, errors, bytes and latency since startup"""
+    with _stats_lock:
+        stats = {host: dict(entry) for host, entry in _stats.items()}
+
+    for entry in stats.values():
+        entry['avg_seconds'] = entry['total_seconds'] / entry['requests'] if entry['requests'] else 0.0
+    return stats
@@ -0,0 +1,65 @@
+import re
+from functools import lru_cache
+
+# Word endings a keyword may carry and still match: plurals plus the stems the
+# keyword list relies on ("intern" -> "Internship", "engineer" -> "Engineering")
+SUFFIXES = ('s', 'es', 'ing', 'ship', 'ships')
+
+class KeywordMatcher:
+    """Matches a keyword list against text with one precompiled regex.
+
+    Keywords match on word boundaries, case-insensitively, optionally followed
+    by one of SUFFIXES: "fresher" matches "Freshers" and "intern" matches
+    "Internship", but "intern" does not match "International". Overlapping
+    keywords are all reported: a zero-width lookahead tries the alternation at
+    every word start, and keywords that are word-prefixes of a longer match
+    ("api" inside "api security") are implied by it.
+    """
+
+    def __init__(self, keywords, weights=None):
+        self.keywords = list(dict.fromkeys(k.lower().strip() for k in keywords if k and k.strip()))
+        self.weights = {k.lower(): w for k, w in (weights or {}).items()}
+
+        # Longest first so the alternation prefers "api security" over "api"
+        alternatives = sorted(self.keywords, key=len, reverse=True)
+        if alternatives:
+            body = '|'.join(re.escape(k) for k in alternatives)
+            suffixes = '|'.join(SUFFIXES)
+            self._pattern = re.compile(rf'(?<!\w)(?=({body})(?:{suffixes})?(?!\w))', re.IGNORECASE)
+        else:
+            self._pattern = None
+
+        self._implied = {
+            keyword: [other for other in self.keywords if other != keyword and keyword.startswith(other)
+                      and not keyword[len(other)].isalnum()]
+            for keyword in self.keywords
+        }
+
+    def contains(self, text):
+        """True if any keyword occurs in text"""
+        return bool(text and self._pattern and self._pattern.search(text))
+
+    def matches(self, text):
+        """Keywords found in text, in order of first appearance"""
+        if not text or not self._pattern:
+            return []
+
+        found = {}
+        for match in self._pattern.finditer(text):
+            keyword = match.group(1).lower()
+            found.setdefault(keyword, None)
+            for implied in self._implied[keyword]:
+                found.setdefault(implied, None)
+        return list(found)
+
+    def score(self, text):
+        """Sum of weights of matched keywords (unweighted keywords count 1.0)"""
+        return sum(self.weights.get(keyword, 1.0) for keyword in self.matches(text))
+
+@lru_cache(maxsize=32)
+def get_keyword_matcher(keywords, weights=None):
+    """Compiled matcher for a keyword tuple, cached so each list is compiled once.
+
+    `weights` is a tuple of (keyword, weight) pairs so it can be part of the cache key.
+    """
+    return KeywordMatcher(keywords, dict(weights) if weights else None)
@@ -0,0 +1,255 @@
+import bisect
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config import METRICS_HOST, METRICS_PORT
+
+# Seconds; spans a cached parse (ms) up to a slow Selenium page (tens of seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SAMPLES_PER_SERIES = 1000  # recent observations kept per label set for the /stats percentiles
+
+def _label_key(labels):
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def _format_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+class Counter:
+    """Monotonic count per label set"""
+
+    kind = 'counter'
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(_label_key(labels), 0)
+
+    def total(self):
+        with self._lock:
+            return sum(self._values.values())
+
+    def render(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}_total{_format_labels(key)} {value}" for key, value in values]
+
+class Gauge:
+    """Current value per label set"""
+
+    kind = 'gauge'
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(_label_key(labels), 0)
+
+    def render(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(key)} {value}" for key, value in values]
+
+class Histogram:
+    """Bucketed distribution per label set, plus recent samples for percentiles"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # label key -> {'counts', 'sum', 'count', 'samples'}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {
+                    'counts': [0] * len(self.buckets),
+                    'sum': 0.0,
+                    'count': 0,
+                    'samples': deque(maxlen=SAMPLES_PER_SERIES),
+                }
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series['counts'][index] += 1
+            series['sum'] += value
+            series['count'] += 1
+            series['samples'].append(value)
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall time of the with-block"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(time.monotonic() - started, **labels)
+
+    def summary(self):
+        """Per label set: count, sum, mean, p50, p95 and max of recent samples"""
+        with self._lock:
+            series = {key: (s['count'], s['sum'], sorted(s['samples'])) for key, s in self._series.items()}
+
+        result = {}
+        for key, (count, total, samples) in series.items():
+            result[key] = {
+                'count': count,
+                'sum': total,
+                'mean': total / count if count else 0.0,
+                'p50': samples[len(samples) // 2] if samples else 0.0,
+                'p95': samples[int(0.95 * (len(samples) - 1))] if samples else 0.0,
+                'max': samples[-1] if samples else 0.0,
+            }
+        return result
+
+    def render(self):
+        with self._lock:
+            series = sorted((key, list(s['counts']), s['sum'], s['count']) for key, s in self._series.items())
+
+        lines = []
+        for key, counts, total, count in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(key, [('le', repr(bound))])} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(key, [('le', '+Inf')])} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+class Registry:
+    """Named metrics, created on first use and shared process-wide"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, help_text, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"metric {name} already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name, help_text=""):
+        return self._get(Counter, name, help_text)
+
+    def gauge(self, name, help_text=""):
+        return self._get(Gauge, name, help_text)
+
+    def histogram(self, name, help_text="", buckets=DEFAULT_BUCKETS):
+        return self._get(Histogram, name, help_text, buckets=buckets)
+
+    def metrics(self):
+        with self._lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+    def render_prometheus(self):
+        """Every metric in the Prometheus text exposition format"""
+        lines = []
+        for metric in self.metrics():
+            exposed = f"{metric.name}_total" if metric.kind == 'counter' else metric.name
+            if metric.help:
+                lines.append(f"# HELP {exposed} {metric.help}")
+            lines.append(f"# TYPE {exposed} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def summary_text(self):
+        """Human-readable digest: timings first (where the time goes), then counters"""
+        lines = ["⏱️ Timings (count | mean | p50 | p95 | max)"]
+        for metric in self.metrics():
+            if metric.kind != 'histogram':
+                continue
+            for key, s in sorted(metric.summary().items(), key=lambda item: -item[1]['sum']):
+                lines.append(f"{metric.name}{_format_labels(key)}: {s['count']} | {s['mean']:.3f}s | "
+                             f"{s['p50']:.3f}s | {s['p95']:.3f}s | {s['max']:.3f}s")
+
+        lines.append("🔢 Counters")
+        for metric in self.metrics():
+            if metric.kind == 'histogram':
+                continue
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+_registry = Registry()
+
+def get_registry():
+    """Get the process-wide metrics registry"""
+    return _registry
+
+def counter(name, help_text=""):
+    """Get or create a counter in the process-wide registry"""
+    return _registry.counter(name, help_text)
+
+def gauge(name, help_text=""):
+    """Get or create a gauge in the process-wide registry"""
+    return _registry.gauge(name, help_text)
+
+def histogram(name, help_text="", buckets=DEFAULT_BUCKETS):
+    """Get or create a histogram in the process-wide registry"""
+    return _registry.histogram(name, help_text, buckets)
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """/metrics in Prometheus format, /stats as a plain-text summary"""
+
+    registry = _registry
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        if path == '/metrics':
+            body = self.registry.render_prometheus().encode('utf-8')
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        elif path == '/stats':
+            body = self.registry.summary_text().encode('utf-8')
+            content_type = "text/plain; charset=utf-8"
+        else:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def start_metrics_server(host=METRICS_HOST, port=METRICS_PORT, registry=None):
+    """Serve /metrics and /stats from a daemon thread; returns the server"""
+    handler = type("Handler", (MetricsHandler,), {'registry': registry or _registry})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    return server
@@ -0,0 +1,82 @@
+from collections import defaultdict
+
+from utils.keyword_matcher import get_keyword_matcher
+
+def _normalize(values):
+    return list(dict.fromkeys(' '.join(v.lower().split()) for v in values or [] if v and v.strip()))
+
+class SubscriptionIndex:
+    """Routes jobs to the subscribers whose filters they match.
+
+    Holds an inverted keyword -> chat ids index over every active subscription,
+    so matching a job costs one regex pass over its title plus a lookup per
+    matched keyword, however many subscribers there are. A subscriber with no
+    sources listed takes every source.
+    """
+
+    def __init__(self, subscriptions):
+        self.subscriptions = {}
+        self._by_keyword = defaultdict(set)  # keyword -> chat ids subscribed to it
+        for sub in subscriptions:
+            if not sub.get('active', True):
+                continue
+            chat_id = str(sub['chat_id'])
+            self.subscriptions[chat_id] = {
+                'keywords': _normalize(sub.get('keywords')),
+                'locations': _normalize(sub.get('locations')),
+                'sources': _normalize(sub.get('sources')),
+            }
+            for keyword in self.subscriptions[chat_id]['keywords']:
+                self._by_keyword[keyword].add(chat_id)
+
+        self.keywords = sorted(self._by_keyword)
+        self.matcher = get_keyword_matcher(tuple(self.keywords))
+
+    def __len__(self):
+        return len(self.subscriptions)
+
+    def _wants_source(self, chat_id, source):
+        sources = self.subscriptions[chat_id]['sources']
+        return not sources or source.lower() in sources
+
+    def queries(self, sources):
+        """Distinct (keyword, location, source) searches covering every subscriber.
+
+        Subscribers sharing a keyword and location share the search.
+        """
+        queries = {}
+        for chat_id, sub in self.subscriptions.items():
+            for keyword in sub['keywords']:
+                for location in sub['locations']:
+                    for source in sources:
+                        if self._wants_source(chat_id, source):
+                            queries[(keyword, location, source)] = None
+        return list(queries)
+
+    def match(self, job):
+        """Chat ids whose keywords, location and sources all accept the job"""
+        candidates = set()
+        for keyword in self.matcher.matches(job.get('title')):
+            candidates |= self._by_keyword[keyword]
+
+        # The location searched for counts as a match even when the card shows a city
+        query_location = job['query'][1] if job.get('query') else None
+        job_location = (job.get('location') or '').lower()
+
+        matched = set()
+        for chat_id in candidates:
+            if not self._wants_source(chat_id, job.get('source', '')):
+                continue
+            locations = self.subscriptions[chat_id]['locations']
+            if locations and query_location not in locations and not any(loc in job_location for loc in locations):
+                continue
+            matched.add(chat_id)
+        return matched
+
+    def fan_out(self, jobs):
+        """Group jobs by the chat ids that should receive them, keeping job order"""
+        by_chat = defaultdict(list)
+        for job in jobs:
+            for chat_id in sorted(self.match(job)):
+                by_chat[chat_id].append(job)
+        return dict(by_chat)